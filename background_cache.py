@@ -5,16 +5,31 @@ import asyncio
 import threading
 import time
 import logging
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 import traceback
+from bisect import bisect_left
+
+from filtering import (
+    iter_filters, collect_page, build_page_info,
+    ADDRESS_FILTERS, SERVICE_FILTERS, GROUP_FILTERS, DEVICE_GROUP_FILTERS
+)
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Length of the name substrings indexed for the partial-name filter
+NAME_TRIGRAM_LENGTH = 3
+
+
+def name_trigrams(name: str) -> Set[str]:
+    """Distinct three-character substrings of a name"""
+    return {name[i:i + NAME_TRIGRAM_LENGTH] for i in range(len(name) - NAME_TRIGRAM_LENGTH + 1)}
+
+
 class CacheStatus(Enum):
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
@@ -75,6 +90,15 @@ class BackgroundCacheManager:
         'schedules'
     ]
     
+    # Advanced filter definitions for the object types served from the cache
+    FILTER_DEFINITIONS = {
+        'addresses': ADDRESS_FILTERS,
+        'services': SERVICE_FILTERS,
+        'address_groups': GROUP_FILTERS,
+        'service_groups': GROUP_FILTERS,
+        'device_groups': DEVICE_GROUP_FILTERS,
+    }
+    
     def __init__(self):
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.progress: Dict[str, CacheProgress] = {}
@@ -84,16 +108,53 @@ class BackgroundCacheManager:
         self._tasks: Dict[str, Set[asyncio.Future]] = {}
         self._stop_event = threading.Event()
         self._ready_configs: Set[str] = set()  # Track fully cached configs
+        # Config name -> cache generation, advanced by clear_cache()
+        self._generations: Dict[str, int] = {}
         
         # Initialize progress tracking
         for obj_type in self.OBJECT_TYPES:
             self.progress[obj_type] = CacheProgress(object_type=obj_type)
     
-    def mark_config_ready(self, config_name: str) -> None:
-        """Mark a configuration as fully cached and ready"""
+    def get_generation(self, config_name: str) -> int:
+        """Get the current cache generation of a configuration
+        
+        Loaders take the generation before they start and hand it back when
+        publishing. clear_cache() starts a new generation, so objects built
+        from an older parse of the file are dropped instead of published.
+        """
+        with self._lock:
+            return self._generations.setdefault(config_name, 0)
+    
+    def publish(self, config_name: str, obj_type: str, items: List[Any],
+                generation: Optional[int] = None) -> bool:
+        """Publish a complete list of objects as the cache entry for a type
+        
+        The entry is replaced as a whole, so readers always see either the
+        previous or the new list. Returns False if the generation is stale.
+        """
+        entry = {
+            'items': items,
+            'timestamp': time.time(),
+            'data': items  # Add data key for background cache compatibility
+        }
+        with self._lock:
+            if generation is not None and generation != self._generations.get(config_name, 0):
+                logger.info(f"Dropping stale {obj_type} cache for '{config_name}'")
+                return False
+            self.cache[f"{config_name}:{obj_type}"] = entry
+            return True
+    
+    def mark_config_ready(self, config_name: str, generation: Optional[int] = None) -> bool:
+        """Mark a configuration as fully cached and ready
+        
+        Returns False, leaving the configuration unready, if the generation is stale.
+        """
         with self._lock:
+            if generation is not None and generation != self._generations.get(config_name, 0):
+                return False
             self._ready_configs.add(config_name)
             logger.info(f"Configuration '{config_name}' marked as ready")
+            return True
     
     def is_config_ready(self, config_name: str) -> bool:
         """Check if a configuration is fully cached"""
@@ -109,16 +170,17 @@ class BackgroundCacheManager:
             self.parsers[config_name] = parser
             if config_name not in self._tasks:
                 self._tasks[config_name] = set()
+            generation = self._generations.setdefault(config_name, 0)
         
         # Start caching in background thread
         thread = threading.Thread(
             target=self._run_caching,
-            args=(config_name, parser),
+            args=(config_name, parser, generation),
             daemon=True
         )
         thread.start()
     
-    def _run_caching(self, config_name: str, parser) -> None:
+    def _run_caching(self, config_name: str, parser, generation: int) -> None:
         """Run caching process in background"""
         try:
             # Create tasks for each object type
@@ -129,7 +191,8 @@ class BackgroundCacheManager:
                     self._cache_object_type,
                     config_name,
                     parser,
-                    obj_type
+                    obj_type,
+                    generation
                 )
                 futures.append(future)
             
@@ -143,7 +206,7 @@ class BackgroundCacheManager:
         except Exception as e:
             logger.error(f"Error in background caching: {e}")
     
-    def _cache_object_type(self, config_name: str, parser, obj_type: str) -> None:
+    def _cache_object_type(self, config_name: str, parser, obj_type: str, generation: int) -> None:
         """Cache a specific object type in batches"""
         cache_key = f"{config_name}:{obj_type}"
         progress = self.progress[obj_type]
@@ -213,6 +276,8 @@ class BackgroundCacheManager:
             
             # Cache each batch
             with self._lock:
+                if generation != self._generations.get(config_name, 0):
+                    return
                 if cache_key not in self.cache:
                     self.cache[cache_key] = {
                         'data': [],
@@ -224,29 +289,13 @@ class BackgroundCacheManager:
                 if self._stop_event.is_set():
                     break
                 
-                # Convert objects to dictionaries for caching
-                batch_data = []
-                for obj in batch:
-                    try:
-                        if hasattr(obj, 'dict'):
-                            # Use by_alias=True to ensure field names use hyphens
-                            obj_dict = obj.dict(by_alias=True)
-                            
-                            # For service objects, ensure we include the computed type field
-                            if obj_type == 'services' and hasattr(obj, 'type') and obj.type:
-                                obj_dict['type'] = obj.type.value
-                            
-                            batch_data.append(obj_dict)
-                        elif hasattr(obj, '__dict__'):
-                            batch_data.append(obj.__dict__)
-                        else:
-                            batch_data.append(str(obj))
-                    except Exception as e:
-                        logger.error(f"Error serializing object: {e}")
-                        continue
+                # Cache the typed objects themselves; they are serialized at the response boundary
+                batch_data = list(batch)
                 
-                # Store batch in cache
+                # Store batch in cache, unless the cache was cleared meanwhile
                 with self._lock:
+                    if generation != self._generations.get(config_name, 0):
+                        break
                     self.cache[cache_key]['batches'][batch_idx] = batch_data
                     self.cache[cache_key]['data'].extend(batch_data)
                     progress.cached_items += len(batch_data)
@@ -284,21 +333,10 @@ class BackgroundCacheManager:
                 return None
             
             # Apply pagination
-            total_items = len(data)
             start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            items = data[start_idx:end_idx]
+            items = data[start_idx:start_idx + page_size]
             
-            return {
-                'items': items,
-                'total_items': total_items,
-                'page': page,
-                'page_size': page_size,
-                'total_pages': (total_items + page_size - 1) // page_size,
-                'has_next': end_idx < total_items,
-                'has_previous': page > 1,
-                'from_cache': True
-            }
+            return {'items': items, **build_page_info(len(data), page, page_size)}
     
     def get_filtered_cached_data(self, config_name: str, obj_type: str,
                                 filters: Dict[str, Any],
@@ -306,319 +344,177 @@ class BackgroundCacheManager:
         """Get filtered cached data with pagination - optimized for performance"""
         cache_key = f"{config_name}:{obj_type}"
         
+        # Debug logging
+        if filters.get('advanced'):
+            logger.debug(f"Advanced filters received: {filters.get('advanced')}")
+        
+        advanced_filters = filters.get('advanced') or {}
+        prefix = advanced_filters.get('name_starts_with')
+        protocol = (filters.get('protocol') or '').lower()
+        name_lower = (filters.get('name') or '').lower()
+        filter_protocol = False
+        
+        # Only the starting candidates are taken under the lock: the tag index,
+        # services protocol partition or name indexes when one applies, else
+        # the cached list itself. The scan and pagination run after it is
+        # released so a slow filter does not hold up other cached requests
         with self._lock:
-            if cache_key not in self.cache:
-                return None
-            
-            cached = self.cache[cache_key]
-            data = cached.get('data', [])
+            cached = self.cache.get(cache_key)
+            data = cached.get('data', []) if cached else []
             
             if not data:
                 return None
             
-            # Debug logging
-            if filters.get('advanced'):
-                logger.debug(f"Advanced filters received: {filters.get('advanced')}")
-            
-            # Apply filters efficiently using list comprehension
-            filtered_items = data
-            
-            # Location filter (for addresses)
-            if obj_type == 'addresses' and filters.get('location'):
-                location = filters['location']
-                if location == "shared":
-                    filtered_items = [a for a in filtered_items if not a.get('parent-device-group') 
-                                     and not a.get('parent-template') and not a.get('parent-vsys')]
-                elif location == "device-group":
-                    filtered_items = [a for a in filtered_items if a.get('parent-device-group')]
-                elif location == "template":
-                    filtered_items = [a for a in filtered_items if a.get('parent-template')]
-                elif location == "vsys":
-                    filtered_items = [a for a in filtered_items if a.get('parent-vsys')]
-            
-            # Name filter
-            if filters.get('name'):
-                name_lower = filters['name'].lower()
-                filtered_items = [item for item in filtered_items 
-                                 if name_lower in item.get('name', '').lower()]
-            
-            # Tag filter
             if filters.get('tag'):
-                tag = filters['tag']
-                filtered_items = [item for item in filtered_items 
-                                 if item.get('tag') and tag in item.get('tag')]
-            
-            # Parent filter (for device groups)
-            if filters.get('parent'):
-                parent = filters['parent'].lower()
-                filtered_items = [item for item in filtered_items 
-                                 if item.get('parent-dg') and parent in item.get('parent-dg', '').lower()]
-            
-            # Apply advanced filters if present
-            advanced_filters = filters.get('advanced', {})
-            if advanced_filters:
-                # Convert cached data to proper model objects for filtering
-                if obj_type == 'addresses':
-                    from models import AddressObject
-                    from filtering import apply_filters, ADDRESS_FILTERS
-                    
-                    # Convert cached dictionaries to AddressObject instances
-                    address_objects = []
-                    logger.debug(f"Reconstructing {len(filtered_items)} items to AddressObject")
-                    for item in filtered_items:
-                        try:
-                            # Create AddressObject from cached data
-                            addr_data = {
-                                'name': item.get('name'),
-                                'description': item.get('description'),
-                                'tag': item.get('tag'),
-                                'xpath': item.get('xpath'),
-                                'parent_device_group': item.get('parent-device-group'),
-                                'parent_template': item.get('parent-template'),
-                                'parent_vsys': item.get('parent-vsys')
-                            }
-                            
-                            # Add type-specific fields
-                            if item.get('ip-netmask'):
-                                addr_data['ip_netmask'] = item.get('ip-netmask')
-                            if item.get('ip-range'):
-                                addr_data['ip_range'] = item.get('ip-range')
-                            if item.get('fqdn'):
-                                addr_data['fqdn'] = item.get('fqdn')
-                            
-                            addr_obj = AddressObject(**addr_data)
-                            address_objects.append(addr_obj)
-                        except Exception as e:
-                            # Log the error for debugging
-                            logger.error(f"Failed to reconstruct AddressObject for {item.get('name')}: {e}")
-                            continue
-                    
-                    # Apply advanced filters to objects
-                    logger.debug(f"Applying filters to {len(address_objects)} reconstructed objects")
-                    filtered_objects = apply_filters(address_objects, advanced_filters, ADDRESS_FILTERS)
-                    logger.debug(f"Filter result: {len(filtered_objects)} objects matched")
-                    
-                    # Convert back to dictionary format for caching consistency
-                    filtered_items = []
-                    for obj in filtered_objects:
-                        item_dict = {
-                            'name': obj.name,
-                            'description': obj.description,
-                            'tag': obj.tag,
-                            'xpath': obj.xpath,
-                            'parent-device-group': obj.parent_device_group,
-                            'parent-template': obj.parent_template,
-                            'parent-vsys': obj.parent_vsys,
-                            'type': obj.type.value if obj.type else None
-                        }
-                        
-                        # Add type-specific fields
-                        if obj.ip_netmask:
-                            item_dict['ip-netmask'] = obj.ip_netmask
-                        if obj.ip_range:
-                            item_dict['ip-range'] = obj.ip_range
-                        if obj.fqdn:
-                            item_dict['fqdn'] = obj.fqdn
-                            
-                        filtered_items.append(item_dict)
-                
-                elif obj_type == 'services':
-                    from models import ServiceObject, Protocol
-                    from filtering import apply_filters, SERVICE_FILTERS
-                    
-                    # Convert cached dictionaries to ServiceObject instances
-                    service_objects = []
-                    logger.debug(f"Reconstructing {len(filtered_items)} items to ServiceObject")
-                    for item in filtered_items:
-                        try:
-                            # Create ServiceObject from cached data
-                            protocol_data = Protocol(
-                                tcp=item.get('protocol', {}).get('tcp'),
-                                udp=item.get('protocol', {}).get('udp')
-                            )
-                            
-                            service_data = {
-                                'name': item.get('name'),
-                                'protocol': protocol_data,
-                                'description': item.get('description'),
-                                'tag': item.get('tag'),
-                                'xpath': item.get('xpath'),
-                                'parent_device_group': item.get('parent-device-group'),
-                                'parent_template': item.get('parent-template'),
-                                'parent_vsys': item.get('parent-vsys')
-                            }
-                            
-                            service_obj = ServiceObject(**service_data)
-                            service_objects.append(service_obj)
-                        except Exception as e:
-                            # Log the error for debugging
-                            logger.error(f"Failed to reconstruct ServiceObject for {item.get('name')}: {e}")
-                            continue
-                    
-                    # Apply advanced filters to objects
-                    logger.debug(f"Applying filters to {len(service_objects)} reconstructed objects")
-                    filtered_objects = apply_filters(service_objects, advanced_filters, SERVICE_FILTERS)
-                    logger.debug(f"Filter result: {len(filtered_objects)} objects matched")
-                    
-                    # Convert back to dictionary format for caching consistency
-                    filtered_items = []
-                    for obj in filtered_objects:
-                        item_dict = {
-                            'name': obj.name,
-                            'description': obj.description,
-                            'tag': obj.tag,
-                            'xpath': obj.xpath,
-                            'parent-device-group': obj.parent_device_group,
-                            'parent-template': obj.parent_template,
-                            'parent-vsys': obj.parent_vsys,
-                            'protocol': {
-                                'tcp': obj.protocol.tcp,
-                                'udp': obj.protocol.udp
-                            },
-                            'type': obj.type.value if obj.type else None
-                        }
-                        filtered_items.append(item_dict)
-                
-                elif obj_type in ['address_groups', 'service_groups']:
-                    from models import AddressGroup, ServiceGroup
-                    from filtering import apply_filters, GROUP_FILTERS
-                    
-                    # Convert cached dictionaries to Group objects
-                    group_objects = []
-                    model_class = AddressGroup if obj_type == 'address_groups' else ServiceGroup
-                    logger.debug(f"Reconstructing {len(filtered_items)} items to {model_class.__name__}")
-                    
-                    for item in filtered_items:
-                        try:
-                            # Create Group object from cached data
-                            group_data = {
-                                'name': item.get('name'),
-                                'description': item.get('description'),
-                                'tag': item.get('tag'),
-                                'xpath': item.get('xpath'),
-                                'parent_device_group': item.get('parent-device-group'),
-                                'parent_template': item.get('parent-template'),
-                                'parent_vsys': item.get('parent-vsys')
-                            }
-                            
-                            # Add type-specific fields
-                            if obj_type == 'address_groups':
-                                # Address groups have static and dynamic fields
-                                group_data['static'] = item.get('static')
-                                group_data['dynamic'] = item.get('dynamic')
-                            else:
-                                # Service groups have members field
-                                group_data['members'] = item.get('members')
-                            
-                            group_obj = model_class(**group_data)
-                            group_objects.append(group_obj)
-                        except Exception as e:
-                            # Log the error for debugging
-                            logger.error(f"Failed to reconstruct {model_class.__name__} for {item.get('name')}: {e}")
-                            continue
-                    
-                    # Apply advanced filters to objects
-                    logger.debug(f"Applying filters to {len(group_objects)} reconstructed objects")
-                    filtered_objects = apply_filters(group_objects, advanced_filters, GROUP_FILTERS)
-                    logger.debug(f"Filter result: {len(filtered_objects)} objects matched")
-                    
-                    # Convert back to dictionary format for caching consistency
-                    filtered_items = []
-                    for obj in filtered_objects:
-                        item_dict = {
-                            'name': obj.name,
-                            'description': obj.description,
-                            'tag': obj.tag,
-                            'xpath': obj.xpath,
-                            'parent-device-group': obj.parent_device_group,
-                            'parent-template': obj.parent_template,
-                            'parent-vsys': obj.parent_vsys
-                        }
-                        
-                        # Add type-specific fields
-                        if obj_type == 'address_groups':
-                            item_dict['static'] = obj.static
-                            item_dict['dynamic'] = obj.dynamic
-                        else:
-                            item_dict['members'] = obj.members
-                        
-                        filtered_items.append(item_dict)
-                
-                elif obj_type == 'device_groups':
-                    from models import DeviceGroupSummary
-                    from filtering import apply_filters, DEVICE_GROUP_FILTERS
-                    
-                    # Convert cached dictionaries to DeviceGroupSummary objects
-                    device_group_objects = []
-                    logger.debug(f"Reconstructing {len(filtered_items)} items to DeviceGroupSummary")
-                    
-                    for item in filtered_items:
-                        try:
-                            # Create DeviceGroupSummary object from cached data
-                            dg_data = {
-                                'name': item.get('name'),
-                                'description': item.get('description'),
-                                'parent_dg': item.get('parent-dg'),
-                                'xpath': item.get('xpath'),
-                                'devices_count': item.get('devices_count', 0),
-                                'address_count': item.get('address_count', 0),
-                                'address_group_count': item.get('address-group-count', 0),
-                                'service_count': item.get('service_count', 0),
-                                'service_group_count': item.get('service-group-count', 0),
-                                'pre_security_rules_count': item.get('pre-security-rules-count', 0),
-                                'post_security_rules_count': item.get('post-security-rules-count', 0),
-                                'pre_nat_rules_count': item.get('pre-nat-rules-count', 0),
-                                'post_nat_rules_count': item.get('post-nat-rules-count', 0)
-                            }
-                            
-                            dg_obj = DeviceGroupSummary(**dg_data)
-                            device_group_objects.append(dg_obj)
-                        except Exception as e:
-                            # Log the error for debugging
-                            logger.error(f"Failed to reconstruct DeviceGroupSummary for {item.get('name')}: {e}")
-                            continue
-                    
-                    # Apply advanced filters to objects
-                    logger.debug(f"Applying filters to {len(device_group_objects)} reconstructed objects")
-                    filtered_objects = apply_filters(device_group_objects, advanced_filters, DEVICE_GROUP_FILTERS)
-                    logger.debug(f"Filter result: {len(filtered_objects)} objects matched")
-                    
-                    # Convert back to dictionary format for caching consistency
-                    filtered_items = []
-                    for obj in filtered_objects:
-                        item_dict = {
-                            'name': obj.name,
-                            'description': obj.description,
-                            'parent-dg': obj.parent_dg,
-                            'xpath': obj.xpath,
-                            'devices_count': obj.devices_count,
-                            'address_count': obj.address_count,
-                            'address-group-count': obj.address_group_count,
-                            'service_count': obj.service_count,
-                            'service-group-count': obj.service_group_count,
-                            'pre-security-rules-count': obj.pre_security_rules_count,
-                            'post-security-rules-count': obj.post_security_rules_count,
-                            'pre-nat-rules-count': obj.pre_nat_rules_count,
-                            'post-nat-rules-count': obj.post_nat_rules_count
-                        }
-                        filtered_items.append(item_dict)
-            
-            # Apply pagination to filtered results
+                filtered_items = self.get_cached_by_tag(config_name, obj_type).get(filters['tag'], [])
+            else:
+                filtered_items = data
+            # A name prefix filter (type-ahead) starts from the range of
+            # matching names in the sorted name index
+            if filtered_items is data and prefix and isinstance(prefix, str):
+                filtered_items = self.get_cached_by_name_prefix(config_name, obj_type, prefix)
+            if obj_type == 'services' and protocol in ('tcp', 'udp'):
+                if filtered_items is data:
+                    filtered_items = self.get_cached_services_by_protocol(config_name).get(protocol, [])
+                else:
+                    filter_protocol = True
+            # Names of three or more characters are looked up in the trigram
+            # index: the objects listed under the rarest trigram of the needle
+            # are the only candidates left to check
+            if filtered_items is data and len(name_lower) >= NAME_TRIGRAM_LENGTH:
+                by_trigram = self.get_cached_by_name_trigram(config_name, obj_type)
+                filtered_items = min(
+                    (by_trigram.get(trigram, ()) for trigram in name_trigrams(name_lower)), key=len
+                )
+            # Batches still being cached extend the list in place, so scan a copy
+            if filtered_items is data:
+                filtered_items = data[:]
+        
+        # Chain the remaining filters lazily
+        if filter_protocol:
+            filtered_items = (s for s in filtered_items if s.type == protocol)
+        
+        # Location filter (for addresses)
+        if obj_type == 'addresses' and filters.get('location'):
+            location = filters['location']
+            if location == "shared":
+                filtered_items = (a for a in filtered_items if not a.parent_device_group
+                                  and not a.parent_template and not a.parent_vsys)
+            elif location == "device-group":
+                filtered_items = (a for a in filtered_items if a.parent_device_group)
+            elif location == "template":
+                filtered_items = (a for a in filtered_items if a.parent_template)
+            elif location == "vsys":
+                filtered_items = (a for a in filtered_items if a.parent_vsys)
+        
+        # Name filter
+        if name_lower:
+            filtered_items = (item for item in filtered_items 
+                              if name_lower in item.name_lower)
+        
+        # Parent filter (for device groups)
+        if filters.get('parent'):
+            parent = filters['parent'].lower()
+            filtered_items = (item for item in filtered_items 
+                              if item.parent_dg and parent in item.lowered('parent_dg'))
+        
+        # Apply advanced filters directly to the cached model objects
+        definition = self.FILTER_DEFINITIONS.get(obj_type)
+        if advanced_filters and definition is not None:
+            filtered_items = iter_filters(filtered_items, advanced_filters, definition)
+        
+        # Paginate in the same pass, keeping only the requested page
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        if isinstance(filtered_items, list):
             total_items = len(filtered_items)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
             paginated_items = filtered_items[start_idx:end_idx]
+        else:
+            paginated_items, total_items = collect_page(filtered_items, start_idx, end_idx)
+        
+        return {'items': paginated_items, **build_page_info(total_items, page, page_size)}
+    
+    def _cached_index(self, cache_key: str, slot: str, build: Callable[[List[Any]], Any]) -> Optional[Any]:
+        """Get an index of a cached list, building it with build(data) when needed
+        
+        The index is stored in the cache entry under slot and rebuilt only
+        when the list grows (while batches are still being cached) or is
+        replaced. Returns None when nothing is cached under cache_key.
+        """
+        with self._lock:
+            cached = self.cache.get(cache_key)
+            if not cached:
+                return None
             
-            return {
-                'items': paginated_items,
-                'total_items': total_items,
-                'page': page,
-                'page_size': page_size,
-                'total_pages': (total_items + page_size - 1) // page_size,
-                'has_next': end_idx < total_items,
-                'has_previous': page > 1,
-                'from_cache': True
-            }
+            data = cached.get('data', [])
+            if not data:
+                return None
+            
+            index = cached.get(slot)
+            if index is None or index[0] != len(data):
+                index = (len(data), build(data))
+                cached[slot] = index
+            
+            return index[1]
+    
+    def get_cached_services_by_protocol(self, config_name: str) -> Optional[Dict[str, List[Any]]]:
+        """Get cached services partitioned by protocol type"""
+        def build(data: List[Any]) -> Dict[str, List[Any]]:
+            by_protocol: Dict[str, List[Any]] = {}
+            for service in data:
+                # Normalize ProtocolType members to their plain string value
+                service_type = getattr(service.type, 'value', service.type)
+                by_protocol.setdefault(service_type, []).append(service)
+            return by_protocol
+        
+        return self._cached_index(f"{config_name}:services", 'by_protocol', build)
+    
+    def get_cached_by_tag(self, config_name: str, obj_type: str) -> Optional[Dict[str, List[Any]]]:
+        """Get cached objects of one type indexed by tag, each tag mapping to its objects in cached order"""
+        def build(data: List[Any]) -> Dict[str, List[Any]]:
+            by_tag: Dict[str, List[Any]] = {}
+            for item in data:
+                for tag in item.tag_set:
+                    by_tag.setdefault(tag, []).append(item)
+            return by_tag
+        
+        return self._cached_index(f"{config_name}:{obj_type}", 'by_tag', build)
+    
+    def get_cached_by_name_trigram(self, config_name: str, obj_type: str) -> Optional[Dict[str, List[Any]]]:
+        """Get cached objects of one type indexed by the trigrams of their lower-cased name
+        
+        Each trigram maps to the objects whose name contains it, in cached order.
+        """
+        def build(data: List[Any]) -> Dict[str, List[Any]]:
+            by_trigram: Dict[str, List[Any]] = {}
+            for item in data:
+                for trigram in name_trigrams(item.name_lower):
+                    by_trigram.setdefault(trigram, []).append(item)
+            return by_trigram
+        
+        return self._cached_index(f"{config_name}:{obj_type}", 'by_name_trigram', build)
+    
+    def get_cached_by_name_prefix(self, config_name: str, obj_type: str, prefix: str) -> List[Any]:
+        """Get the cached objects whose lower-cased name starts with a prefix, in cached order
+        
+        The lower-cased names are kept sorted alongside their cached positions,
+        so the matches are found with two binary searches.
+        """
+        def build(data: List[Any]) -> Tuple[List[Any], List[str], List[int]]:
+            ordered = sorted(range(len(data)), key=lambda i: data[i].name_lower)
+            return data, [data[i].name_lower for i in ordered], ordered
+        
+        index = self._cached_index(f"{config_name}:{obj_type}", 'by_name_sorted', build)
+        if index is None:
+            return []
+        data, names, positions = index
+        
+        prefix = prefix.lower()
+        # Every name starting with the prefix sorts before the prefix with
+        # its last character incremented
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        matches = positions[bisect_left(names, prefix):bisect_left(names, upper)]
+        return [data[i] for i in sorted(matches)]
     
     def is_cached(self, config_name: str, obj_type: str) -> bool:
         """Check if data is cached for a specific object type"""
@@ -669,18 +565,16 @@ class BackgroundCacheManager:
                 keys_to_remove = [k for k in self.cache.keys() if k.startswith(f"{config_name}:")]
                 for key in keys_to_remove:
                     del self.cache[key]
-                
-                # Reset progress for this config
-                for progress in self.progress.values():
-                    progress.status = CacheStatus.NOT_STARTED
-                    progress.cached_items = 0
-                    progress.total_items = 0
-                    progress.error = None
-                    progress.start_time = None
-                    progress.end_time = None
+                self._ready_configs.discard(config_name)
+                self._generations[config_name] = self._generations.get(config_name, 0) + 1
+                # Progress is tracked per object type across all configs, so
+                # clearing one config leaves it alone
             else:
                 # Clear all cache
                 self.cache.clear()
+                self._ready_configs.clear()
+                for name in self._generations:
+                    self._generations[name] += 1
                 
                 # Reset all progress
                 for obj_type in self.OBJECT_TYPES:
@@ -8,9 +8,11 @@ This module provides a flexible filtering framework that supports:
 - Integration with existing pagination
 """
 
-from typing import List, Dict, Any, Optional, Union, Callable
+from typing import List, Dict, Any, Optional, Union, Callable, Iterable, Iterator, Tuple
 from enum import Enum
 import re
+from itertools import islice
+from operator import gt, lt, ge, le
 from fastapi import Query
 from functools import lru_cache
 
@@ -32,6 +34,64 @@ class FilterOperator(str, Enum):
     REGEX = "regex"
 
 
+# Operators ordered longest suffix first, so "_not_contains" wins over "_contains"
+OPERATORS_LONGEST_FIRST = tuple(sorted(FilterOperator, key=lambda x: len(x.value), reverse=True))
+
+
+@lru_cache(maxsize=1024)
+def split_filter_key(field_name: str) -> Tuple[str, FilterOperator]:
+    """Split a filter key such as "name_starts_with" into its field and operator
+    
+    Keys without an operator suffix use the default CONTAINS operator.
+    """
+    for op in OPERATORS_LONGEST_FIRST:
+        suffix = f"_{op.value}"
+        if field_name.endswith(suffix):
+            return field_name[:-len(suffix)], op
+    return field_name, FilterOperator.CONTAINS
+
+
+# Operators answered from pre-lowered values: string matches on scalar fields,
+# membership on list fields
+LOWERED_STRING_OPERATORS = frozenset({
+    FilterOperator.CONTAINS, FilterOperator.NOT_CONTAINS,
+    FilterOperator.STARTS_WITH, FilterOperator.ENDS_WITH
+})
+LOWERED_LIST_OPERATORS = frozenset({FilterOperator.IN, FilterOperator.NOT_IN})
+
+# Operators that compare the string form of a value
+STRING_OPERATORS = frozenset({
+    FilterOperator.CONTAINS, FilterOperator.NOT_CONTAINS,
+    FilterOperator.STARTS_WITH, FilterOperator.ENDS_WITH,
+    FilterOperator.REGEX
+})
+
+# Substring tests of (value string, filter string), as apply_operator performs them
+SUBSTRING_TESTS = {
+    FilterOperator.CONTAINS: lambda value, needle: needle in value,
+    FilterOperator.NOT_CONTAINS: lambda value, needle: needle not in value,
+    FilterOperator.STARTS_WITH: str.startswith,
+    FilterOperator.ENDS_WITH: str.endswith,
+}
+
+# Ordering operators compared directly on integers when both sides are whole numbers
+ORDERING_COMPARISONS = {
+    FilterOperator.GREATER_THAN: gt,
+    FilterOperator.LESS_THAN: lt,
+    FilterOperator.GREATER_THAN_OR_EQUAL: ge,
+    FilterOperator.LESS_THAN_OR_EQUAL: le,
+}
+
+
+def as_whole_number(value: Any) -> Optional[int]:
+    """Return value as an int if it is an int or a string of ASCII digits, else None"""
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
+
 class FilterConfig:
     """Configuration for a filter field"""
     def __init__(
@@ -40,7 +100,8 @@ class FilterConfig:
         operators: List[FilterOperator] = None,
         case_sensitive: bool = False,
         type_: type = str,
-        custom_getter: Optional[Callable] = None
+        custom_getter: Optional[Callable] = None,
+        lower_attr: Optional[str] = None
     ):
         self.field_path = field_path
         self.operators = operators or [
@@ -52,12 +113,66 @@ class FilterConfig:
         self.case_sensitive = case_sensitive
         self.type = type_
         self.custom_getter = custom_getter
+        # Field whose pre-lowered value (obj.lowered(lower_attr)) serves case-insensitive matches
+        self.lower_attr = lower_attr
 
 
 class FilterDefinition:
     """Defines available filters for an endpoint"""
+    # Bound on memoized compiled filter sets per definition
+    COMPILED_CACHE_SIZE = 256
+    
     def __init__(self, filters: Dict[str, FilterConfig]):
         self.filters = filters
+        self._compiled: Dict[frozenset, Tuple[Callable[[Any], bool], ...]] = {}
+    
+    def compile(self, filters: Dict[str, Any]) -> Tuple[Callable[[Any], bool], ...]:
+        """Compile a filter set into one predicate per condition, memoized per filter set
+        
+        Filter sets with unhashable values are compiled on every call.
+        """
+        try:
+            key = frozenset(filters.items())
+        except TypeError:
+            key = None
+        if key is not None:
+            predicates = self._compiled.get(key)
+            if predicates is not None:
+                return predicates
+        
+        predicates = tuple(FilterProcessor.compile_predicate(*entry) for entry in self.resolve(filters))
+        if key is not None:
+            if len(self._compiled) >= self.COMPILED_CACHE_SIZE:
+                self._compiled.clear()
+            self._compiled[key] = predicates
+        return predicates
+    
+    def resolve(self, filters: Dict[str, Any]) -> List[Tuple["FilterConfig", FilterOperator, Any, Optional[str]]]:
+        """Resolve filter keys to (config, operator, value, needle) once, before matching any objects
+        
+        Keys for fields this definition does not know, and None values other
+        than for _eq / _ne, are dropped. needle is the lower-cased filter
+        value when the match can use the object's pre-lowered field, else None.
+        """
+        resolved = []
+        for field_name, filter_value in filters.items():
+            # Only skip None filter values if they're not part of explicit equality/inequality operations
+            # This allows filtering for None values when using operators like _eq or _ne
+            if filter_value is None and not (field_name.endswith('_eq') or field_name.endswith('_ne')):
+                continue
+            
+            base_field_name, operator = split_filter_key(field_name)
+            config = self.filters.get(base_field_name)
+            if config is None:
+                continue
+            
+            needle = None
+            if config.lower_attr and not config.case_sensitive and isinstance(filter_value, str):
+                operators = LOWERED_LIST_OPERATORS if config.type is list else LOWERED_STRING_OPERATORS
+                if operator in operators:
+                    needle = filter_value.lower()
+            resolved.append((config, operator, filter_value, needle))
+        return resolved
     
     def get_filter_params(self) -> Dict[str, Any]:
         """Generate FastAPI query parameters for filters"""
@@ -166,19 +281,9 @@ class FilterProcessor:
                 return operator == FilterOperator.NOT_EQUALS
         
         # Handle enum values - convert to their string representation
-        from enum import Enum
         if isinstance(value, Enum):
             value = value.value
         
-        # Pre-define string operators set for faster lookup
-        STRING_OPERATORS = {
-            FilterOperator.CONTAINS,
-            FilterOperator.NOT_CONTAINS,
-            FilterOperator.STARTS_WITH,
-            FilterOperator.ENDS_WITH,
-            FilterOperator.REGEX
-        }
-        
         # Convert to string for string operations
         if operator in STRING_OPERATORS:
             value_str = str(value)
@@ -213,6 +318,14 @@ class FilterProcessor:
         # Handle list operations
         elif operator in [FilterOperator.IN, FilterOperator.NOT_IN]:
             if isinstance(value, list):
+                if isinstance(filter_value, list):
+                    # Several filter values: match when any of them is in the list
+                    if not case_sensitive:
+                        value_set = {str(v).lower() for v in value}
+                        found = any(str(f).lower() in value_set for f in filter_value)
+                    else:
+                        found = any(f in value for f in filter_value)
+                    return found if operator == FilterOperator.IN else not found
                 # Check if filter_value is in the list
                 if not case_sensitive and isinstance(filter_value, str):
                     value_list = [str(v).lower() for v in value]
@@ -306,54 +419,109 @@ class FilterProcessor:
         # Early exit if no filters
         if not filters:
             return True
+        return FilterProcessor.matches_compiled(obj, filter_definition.compile(filters))
+    
+    @staticmethod
+    def match_lowered(lowered: Any, needle: str, operator: FilterOperator) -> Optional[bool]:
+        """Match a pre-lowered field value against a lower-cased needle
+        
+        Returns None when the value's shape does not fit the operator, so the
+        caller falls back to apply_operator.
+        """
+        if lowered is None:
+            # Mirrors apply_operator: a missing value only matches "not equals"
+            return False
+        if isinstance(lowered, frozenset):
+            if operator == FilterOperator.IN:
+                return needle in lowered
+            if operator == FilterOperator.NOT_IN:
+                return needle not in lowered
+            return None
+        if not isinstance(lowered, str):
+            return None
+        if operator == FilterOperator.CONTAINS:
+            return needle in lowered
+        if operator == FilterOperator.NOT_CONTAINS:
+            return needle not in lowered
+        if operator == FilterOperator.STARTS_WITH:
+            return lowered.startswith(needle)
+        if operator == FilterOperator.ENDS_WITH:
+            return lowered.endswith(needle)
+        return None
+    
+    @staticmethod
+    def compile_predicate(
+        config: FilterConfig,
+        operator: FilterOperator,
+        filter_value: Any,
+        needle: Optional[str]
+    ) -> Callable[[Any], bool]:
+        """Build the predicate for one resolved filter condition"""
+        getter = config.custom_getter
+        field_path = config.field_path
+        case_sensitive = config.case_sensitive
+        
+        def match(obj: Any) -> bool:
+            value = getter(obj) if getter else FilterProcessor.get_nested_value(obj, field_path)
+            return FilterProcessor.apply_operator(value, filter_value, operator, case_sensitive)
+        
+        # Substring operators resolve the test and case-fold the filter value
+        # once, instead of apply_operator doing both for every object
+        substring_test = SUBSTRING_TESTS.get(operator)
+        if substring_test is not None and filter_value is not None:
+            filter_str = str(filter_value) if case_sensitive else str(filter_value).lower()
             
-        for field_name, filter_value in filters.items():
-            # Only skip None filter values if they're not part of explicit equality/inequality operations
-            # This allows filtering for None values when using operators like _eq or _ne
-            if filter_value is None and not (field_name.endswith('_eq') or field_name.endswith('_ne')):
-                continue
-            
-            # Parse field name to extract operator if present
-            # First, try to find the longest matching operator at the end
-            operator = None
-            base_field_name = field_name
-            
-            # Check for operator suffixes from longest to shortest
-            # Sort operators by length (descending) to match longest first
-            sorted_operators = sorted(FilterOperator, key=lambda x: len(x.value), reverse=True)
-            for op in sorted_operators:
-                suffix = f"_{op.value}"
-                if field_name.endswith(suffix):
-                    operator = op
-                    base_field_name = field_name[:-len(suffix)]
-                    break
-            
-            # If no operator found, use default
-            if operator is None:
-                operator = FilterOperator.CONTAINS  # Default operator
-                base_field_name = field_name
-            
-            # Skip if field not in filter definition
-            if base_field_name not in filter_definition.filters:
-                continue
+            def match_substring(obj: Any) -> bool:
+                value = getter(obj) if getter else FilterProcessor.get_nested_value(obj, field_path)
+                if value is None:
+                    return False
+                if isinstance(value, Enum):
+                    value = value.value
+                value_str = str(value) if case_sensitive else str(value).lower()
+                return substring_test(value_str, filter_str)
             
-            config = filter_definition.filters[base_field_name]
+            if needle is None:
+                return match_substring
+            fallback = match_substring
+        else:
+            fallback = match
+        
+        if needle is None:
+            # Numeric comparisons (port ranges, counts) convert the filter value
+            # once and compare integers directly; anything else, such as a
+            # port range string, still goes through apply_operator
+            compare = ORDERING_COMPARISONS.get(operator)
+            number = as_whole_number(filter_value) if compare else None
+            if number is None:
+                return match
             
-            # Get value from object
-            if config.custom_getter:
-                value = config.custom_getter(obj)
-            else:
-                value = FilterProcessor.get_nested_value(obj, config.field_path)
+            def match_number(obj: Any) -> bool:
+                value = getter(obj) if getter else FilterProcessor.get_nested_value(obj, field_path)
+                value_number = as_whole_number(value)
+                if value_number is not None:
+                    return compare(value_number, number)
+                return FilterProcessor.apply_operator(value, filter_value, operator, case_sensitive)
             
-            # Apply filter
-            if not FilterProcessor.apply_operator(
-                value,
-                filter_value,
-                operator,
-                config.case_sensitive
-            ):
-                return False
+            return match_number
+        
+        lower_attr = config.lower_attr
+        
+        def match_lowered(obj: Any) -> bool:
+            lowered = getattr(obj, 'lowered', None)
+            if lowered is not None:
+                matched = FilterProcessor.match_lowered(lowered(lower_attr), needle, operator)
+                if matched is not None:
+                    return matched
+            return fallback(obj)
         
+        return match_lowered
+    
+    @staticmethod
+    def matches_compiled(obj: Any, predicates: Tuple[Callable[[Any], bool], ...]) -> bool:
+        """Check an object against predicates from FilterDefinition.compile"""
+        for predicate in predicates:
+            if not predicate(obj):
+                return False
         return True
 
 
@@ -364,7 +532,7 @@ def apply_filters(
 ) -> List[Any]:
     """Apply filters to a list of items with optimizations for large datasets"""
     # The filter_params are already parsed, no need to extract
-    # Don't filter out None values here - let matches_filters handle them
+    # Don't filter out None values here - let FilterDefinition.resolve handle them
     active_filters = filter_params
     
     if not active_filters:
@@ -374,9 +542,46 @@ def apply_filters(
     if not items:
         return items
     
-    # Use generator expression with list comprehension for better performance
-    # This is more memory efficient for large datasets
-    return [item for item in items if FilterProcessor.matches_filters(item, active_filters, filter_definition)]
+    # Compile the filter set once rather than interpreting it for every item
+    predicates = filter_definition.compile(active_filters)
+    return [item for item in items if FilterProcessor.matches_compiled(item, predicates)]
+
+
+def iter_filters(
+    items: Iterable[Any],
+    filter_params: Dict[str, Any],
+    filter_definition: FilterDefinition
+) -> Iterator[Any]:
+    """Lazily yield the items matching the filters
+    
+    Unlike apply_filters this never materializes the filtered list, so it can
+    be chained with other lazy filters and consumed by paginate_results.
+    """
+    if not filter_params:
+        return iter(items)
+    predicates = filter_definition.compile(filter_params)
+    return (item for item in items if FilterProcessor.matches_compiled(item, predicates))
+
+
+def collect_page(items: Iterable[Any], start: int, end: int) -> Tuple[List[Any], int]:
+    """Consume an iterable in one pass, keeping only items[start:end] and counting the rest"""
+    iterator = iter(items)
+    skipped = sum(1 for _ in islice(iterator, start))
+    page = list(islice(iterator, end - start))
+    return page, skipped + len(page) + sum(1 for _ in iterator)
+
+
+def build_page_info(total_items: int, page: int, page_size: int) -> Dict[str, Any]:
+    """Pagination metadata of a PaginatedResponse for one page of total_items"""
+    total_pages = -(-total_items // page_size)
+    return {
+        'total_items': total_items,
+        'page': page,
+        'page_size': page_size,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_previous': page > 1
+    }
 
 
 def apply_filters_parallel(
@@ -435,7 +640,7 @@ def create_filter_with_aliases(base_filters: Dict[str, FilterConfig]) -> Dict[st
 
 # Address object filters - comprehensive filtering for all properties
 ADDRESS_FILTERS = FilterDefinition(create_filter_with_aliases({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -494,7 +699,7 @@ ADDRESS_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -502,7 +707,7 @@ ADDRESS_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "tag": FilterConfig("tag", operators=[
+    "tag": FilterConfig("tag", lower_attr="tag", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -513,17 +718,17 @@ ADDRESS_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.CONTAINS,
         FilterOperator.STARTS_WITH
     ]),
-    "parent_device_group": FilterConfig("parent_device_group", operators=[
+    "parent_device_group": FilterConfig("parent_device_group", lower_attr="parent_device_group", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "parent_template": FilterConfig("parent_template", operators=[
+    "parent_template": FilterConfig("parent_template", lower_attr="parent_template", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "parent_vsys": FilterConfig("parent_vsys", operators=[
+    "parent_vsys": FilterConfig("parent_vsys", lower_attr="parent_vsys", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
@@ -553,7 +758,7 @@ ADDRESS_FILTERS = FilterDefinition(create_filter_with_aliases({
 
 # Service object filters - comprehensive filtering for all properties
 SERVICE_FILTERS = FilterDefinition(create_filter_with_aliases({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -624,7 +829,7 @@ SERVICE_FILTERS = FilterDefinition(create_filter_with_aliases({
             FilterOperator.CONTAINS
         ]
     ),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -632,7 +837,7 @@ SERVICE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "tag": FilterConfig("tag", operators=[
+    "tag": FilterConfig("tag", lower_attr="tag", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -643,17 +848,17 @@ SERVICE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.CONTAINS,
         FilterOperator.STARTS_WITH
     ]),
-    "parent_device_group": FilterConfig("parent_device_group", operators=[
+    "parent_device_group": FilterConfig("parent_device_group", lower_attr="parent_device_group", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "parent_template": FilterConfig("parent_template", operators=[
+    "parent_template": FilterConfig("parent_template", lower_attr="parent_template", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "parent_vsys": FilterConfig("parent_vsys", operators=[
+    "parent_vsys": FilterConfig("parent_vsys", lower_attr="parent_vsys", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
@@ -668,7 +873,7 @@ SERVICE_FILTERS = FilterDefinition(create_filter_with_aliases({
 }))
 
 SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -680,13 +885,13 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS
     ]),
-    "source": FilterConfig("source", operators=[
+    "source": FilterConfig("source", lower_attr="source", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
         FilterOperator.NOT_CONTAINS
     ], type_=list),
-    "destination": FilterConfig("destination", operators=[
+    "destination": FilterConfig("destination", lower_attr="destination", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -728,7 +933,7 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.CONTAINS,
         FilterOperator.NOT_CONTAINS
     ], type_=list),
-    "action": FilterConfig("action", operators=[
+    "action": FilterConfig("action", lower_attr="action", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS
     ]),
@@ -744,7 +949,7 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -752,7 +957,7 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "tag": FilterConfig("tag", operators=[
+    "tag": FilterConfig("tag", lower_attr="tag", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -768,7 +973,7 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.CONTAINS,
         FilterOperator.STARTS_WITH
     ]),
-    "parent_device_group": FilterConfig("parent_device_group", operators=[
+    "parent_device_group": FilterConfig("parent_device_group", lower_attr="parent_device_group", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
@@ -777,7 +982,7 @@ SECURITY_RULE_FILTERS = FilterDefinition(create_filter_with_aliases({
 
 # Device group filters - comprehensive filtering for all properties
 DEVICE_GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -785,17 +990,17 @@ DEVICE_GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "parent": FilterConfig("parent_dg", operators=[
+    "parent": FilterConfig("parent_dg", lower_attr="parent_dg", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "parent_dg": FilterConfig("parent_dg", operators=[
+    "parent_dg": FilterConfig("parent_dg", lower_attr="parent_dg", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -884,7 +1089,7 @@ DEVICE_GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
 
 # Address/Service group filters - comprehensive filtering for all properties
 GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -892,7 +1097,7 @@ GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -921,7 +1126,7 @@ GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
         FilterOperator.CONTAINS,
         FilterOperator.NOT_CONTAINS
     ], type_=list),
-    "tag": FilterConfig("tag", operators=[
+    "tag": FilterConfig("tag", lower_attr="tag", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -972,7 +1177,7 @@ GROUP_FILTERS = FilterDefinition(create_filter_with_aliases({
 
 # Security profile filters - comprehensive filtering for all properties
 PROFILE_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -980,7 +1185,7 @@ PROFILE_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -997,7 +1202,7 @@ PROFILE_FILTERS = FilterDefinition({
 
 # NAT rule filters - comprehensive filtering for all properties
 NAT_RULE_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1009,13 +1214,13 @@ NAT_RULE_FILTERS = FilterDefinition({
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS
     ]),
-    "source": FilterConfig("source", operators=[
+    "source": FilterConfig("source", lower_attr="source", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
         FilterOperator.NOT_CONTAINS
     ], type_=list),
-    "destination": FilterConfig("destination", operators=[
+    "destination": FilterConfig("destination", lower_attr="destination", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -1042,7 +1247,7 @@ NAT_RULE_FILTERS = FilterDefinition({
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1050,7 +1255,7 @@ NAT_RULE_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "tag": FilterConfig("tag", operators=[
+    "tag": FilterConfig("tag", lower_attr="tag", operators=[
         FilterOperator.IN,
         FilterOperator.NOT_IN,
         FilterOperator.CONTAINS,
@@ -1060,7 +1265,7 @@ NAT_RULE_FILTERS = FilterDefinition({
 
 # Template filters - comprehensive filtering for all properties
 TEMPLATE_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1068,7 +1273,7 @@ TEMPLATE_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1085,7 +1290,7 @@ TEMPLATE_FILTERS = FilterDefinition({
 
 # Template stack filters - comprehensive filtering for all properties
 TEMPLATE_STACK_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1093,7 +1298,7 @@ TEMPLATE_STACK_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1116,7 +1321,7 @@ TEMPLATE_STACK_FILTERS = FilterDefinition({
 
 # Log profile filters - comprehensive filtering for all properties
 LOG_PROFILE_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1124,7 +1329,7 @@ LOG_PROFILE_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1141,7 +1346,7 @@ LOG_PROFILE_FILTERS = FilterDefinition({
 
 # Schedule filters - comprehensive filtering for all properties
 SCHEDULE_FILTERS = FilterDefinition({
-    "name": FilterConfig("name", operators=[
+    "name": FilterConfig("name", lower_attr="name", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -1149,7 +1354,7 @@ SCHEDULE_FILTERS = FilterDefinition({
         FilterOperator.STARTS_WITH,
         FilterOperator.ENDS_WITH
     ]),
-    "description": FilterConfig("description", operators=[
+    "description": FilterConfig("description", lower_attr="description", operators=[
         FilterOperator.EQUALS,
         FilterOperator.NOT_EQUALS,
         FilterOperator.CONTAINS,
@@ -0,0 +1,426 @@
+"""
+HTTP-level caching for the configuration API.
+
+Every response under /api/v1/configs/{config_name}/ is derived from the
+configuration XML file alone, so the request plus the file's modification
+time and size identify the response body. This module uses that to:
+
+- answer If-None-Match / If-Modified-Since requests with 304 Not Modified
+  via an ETag and a Last-Modified date, and
+- keep an in-process LRU of serialized response bodies so repeated
+  requests skip parsing, filtering and serialization entirely, optionally
+  backed by an on-disk tier shared across workers and restarts.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from operator import itemgetter
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONFIG_PATH_PREFIX = "/api/v1/configs/"
+
+# Endpoints whose responses reflect runtime state rather than the XML file
+UNCACHEABLE_ENDPOINTS = frozenset({"cache-stats", "cache-status", "info"})
+
+
+def get_config_name(path: str) -> Optional[str]:
+    """Extract the configuration name from a config-scoped API path"""
+    if not path.startswith(CONFIG_PATH_PREFIX):
+        return None
+    parts = path[len(CONFIG_PATH_PREFIX):].split("/")
+    if len(parts) < 2 or not parts[0] or parts[1] in UNCACHEABLE_ENDPOINTS:
+        return None
+    return parts[0]
+
+
+def compute_etag(config_name: str, path: str, query_string: bytes,
+                 mtime_ns: int, size: int) -> str:
+    """Build a quoted entity tag for a request against a configuration file"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(config_name.encode())
+    digest.update(b"\0")
+    digest.update(path.encode())
+    digest.update(b"\0")
+    digest.update(query_string)
+    digest.update(b"\0")
+    digest.update(f"{mtime_ns}:{size}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header lists the given entity tag
+    
+    Uses the weak comparison RFC 9110 requires for If-None-Match, so a tag
+    weakened by an intermediary (W/"...") still matches, and "*" matches any.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: Optional[str], mtime: float) -> bool:
+    """Check whether a file is unchanged since an If-Modified-Since date
+
+    HTTP dates have one-second resolution, so the modification time is
+    truncated before comparing. Unparseable dates never match.
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since
+
+
+class FileStatCache:
+    """Short-lived cache of os.stat results
+
+    Config files change rarely, so a stat that is up to ``ttl`` seconds old
+    is good enough to detect edits while keeping the syscall off the
+    per-request path.
+    """
+
+    def __init__(self, ttl: float = 1.0):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+        self._lock = threading.Lock()
+
+    def stat(self, path: str) -> Optional[os.stat_result]:
+        """Return the (possibly cached) stat result for a path, or None if missing"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry[0] < self.ttl:
+                return entry[1]
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+        with self._lock:
+            self._entries[path] = (now, result)
+        return result
+
+    def prime(self, path: str, result: Optional[os.stat_result]):
+        """Record a stat result obtained elsewhere, e.g. from os.scandir"""
+        with self._lock:
+            self._entries[path] = (time.monotonic(), result)
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop the cached stat for one path, or for all paths"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response body ready to be replayed"""
+    body: bytes
+    media_type: Optional[str]
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized response bodies bounded by total size
+
+    Args:
+        max_bytes: Upper bound on the summed size of cached bodies; 0 disables caching
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the cached response for a key, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: Hashable, body: bytes, media_type: Optional[str]):
+        """Store a response body, evicting least recently used entries as needed"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = CachedResponse(body, media_type)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache usage statistics"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+class DiskResponseCache:
+    """Second-tier store of serialized response bodies in a directory
+
+    Entries are written atomically and named after a digest of the cache
+    key and ``version``, so bodies written by another release are never
+    replayed. Keys include the config file's mtime and size, so entries for
+    an edited file are simply never looked up again; such orphans age out
+    as the least recently used files are evicted to stay within
+    ``max_bytes``.
+
+    Args:
+        directory: Directory holding the cached bodies, created if missing
+        max_bytes: Upper bound on the summed size of the stored files
+        version: Application version mixed into every entry name
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, version: str = ""):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self._load_index()
+
+    def _load_index(self):
+        """Index existing entries oldest first and trim them to max_bytes"""
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".resp"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        with self._lock:
+            for _, name, size in sorted(found):
+                self._files[name] = size
+                self._size += size
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used files until within max_bytes; call with the lock held"""
+        while self._size > self.max_bytes and self._files:
+            name, size = self._files.popitem(last=False)
+            self._size -= size
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def _name(self, key: Hashable) -> str:
+        digest = hashlib.blake2b(repr((self.version, key)).encode(), digest_size=20).hexdigest()
+        return f"{digest}.resp"
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the stored response for a key, or None"""
+        name = self._name(key)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        with self._lock:
+            if name in self._files:
+                self._files.move_to_end(name)
+        try:
+            # Keep the recency order for the index rebuilt on restart
+            os.utime(path)
+        except OSError:
+            pass
+        media_type, _, body = data.partition(b"\n")
+        self.hits += 1
+        return CachedResponse(body, media_type.decode("latin-1") or None)
+
+    def set(self, key: Hashable, body: bytes, media_type: Optional[str]):
+        """Store a response body, replacing any previous entry atomically"""
+        data = (media_type or "").encode("latin-1") + b"\n" + body
+        if len(data) > self.max_bytes:
+            return
+        name = self._name(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.directory, name))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._size += len(data) - self._files.pop(name, 0)
+            self._files[name] = len(data)
+            self._evict()
+
+    def clear(self):
+        """Remove all stored responses"""
+        with self._lock:
+            self._files.clear()
+            self._size = 0
+            for name in os.listdir(self.directory):
+                if name.endswith(".resp"):
+                    try:
+                        os.unlink(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics"""
+        return {
+            'directory': self.directory,
+            'entries': len(self._files),
+            'size_bytes': self._size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware adding cache validators and response caching to config endpoints
+
+    Args:
+        app: The wrapped ASGI application
+        config_path_resolver: Maps a configuration name to its XML file path,
+            or returns None when the configuration is unknown
+        response_cache: Store for serialized bodies of successful GET responses
+        stat_cache: Source of config file stat results
+        disk_cache: Optional second tier consulted on response_cache misses
+    """
+
+    def __init__(self, app: ASGIApp,
+                 config_path_resolver: Callable[[str], Optional[str]],
+                 response_cache: ResponseCache,
+                 stat_cache: FileStatCache,
+                 disk_cache: Optional[DiskResponseCache] = None):
+        self.app = app
+        self.config_path_resolver = config_path_resolver
+        self.response_cache = response_cache
+        self.stat_cache = stat_cache
+        self.disk_cache = disk_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        config_name = get_config_name(scope["path"])
+        xml_path = self.config_path_resolver(config_name) if config_name else None
+        stat = self.stat_cache.stat(xml_path) if xml_path else None
+        if stat is None:
+            await self.app(scope, receive, send)
+            return
+
+        query_string = scope["query_string"]
+        etag = compute_etag(config_name, scope["path"], query_string,
+                            stat.st_mtime_ns, stat.st_size)
+
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+        validators = {"ETag": etag, "Last-Modified": last_modified}
+
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.1.3)
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = etag_matches(if_none_match, etag)
+        else:
+            not_modified = not_modified_since(request_headers.get("if-modified-since"), stat.st_mtime)
+        if not_modified:
+            response = Response(status_code=304, headers=validators)
+            await response(scope, receive, send)
+            return
+
+        cache_key = None
+        if scope["method"] == "GET" and self.response_cache.enabled:
+            # Sort by parameter name only: the stable sort keeps repeated
+            # parameters in request order, where the last value wins
+            query = tuple(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True),
+                                 key=itemgetter(0)))
+            cache_key = (config_name, scope["path"], query, stat.st_mtime_ns, stat.st_size)
+            cached = self.response_cache.get(cache_key)
+            if cached is None and self.disk_cache is not None:
+                cached = await asyncio.to_thread(self.disk_cache.get, cache_key)
+                if cached is not None:
+                    self.response_cache.set(cache_key, cached.body, cached.media_type)
+            if cached is not None:
+                response = Response(content=cached.body, media_type=cached.media_type,
+                                    headers=validators)
+                await response(scope, receive, send)
+                return
+
+        media_type = None
+        chunks = []
+        captured = 0
+
+        async def send_with_cache(message: Message) -> None:
+            nonlocal cache_key, media_type, captured
+            if message["type"] == "http.response.start":
+                if message["status"] == 200:
+                    headers = MutableHeaders(scope=message)
+                    headers["ETag"] = etag
+                    headers["Last-Modified"] = last_modified
+                    media_type = headers.get("content-type")
+                else:
+                    cache_key = None
+            elif message["type"] == "http.response.body" and cache_key is not None:
+                body = message.get("body", b"")
+                captured += len(body)
+                if captured > self.response_cache.max_bytes:
+                    cache_key = None
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                    if not message.get("more_body", False):
+                        full_body = b"".join(chunks)
+                        self.response_cache.set(cache_key, full_body, media_type)
+                        if self.disk_cache is not None:
+                            await asyncio.to_thread(self.disk_cache.set, cache_key, full_body, media_type)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache)
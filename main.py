@@ -1,10 +1,21 @@
-from fastapi import FastAPI, HTTPException, Query, Path, Request
-from fastapi.responses import RedirectResponse, HTMLResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Query, Path, Request, Depends
+from fastapi.responses import (
+    RedirectResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
+)
 from fastapi.staticfiles import StaticFiles
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Callable, Set, Iterable, Iterator, Mapping, Tuple, Union
 import os
-import glob
 import asyncio
+import base64
+import hashlib
+from types import MappingProxyType
+import re
+import orjson
+from functools import lru_cache
+from itertools import islice
+from bisect import bisect_left
+from urllib.parse import parse_qsl
+from contextlib import asynccontextmanager
 from parser import PanoramaXMLParser
 from background_cache import background_cache
 from models import (
@@ -13,19 +24,29 @@ from models import (
     URLFilteringProfile, FileBlockingProfile, WildFireAnalysisProfile,
     DataFilteringProfile, SecurityProfileGroup, SecurityRule, NATRule,
     DeviceGroup, DeviceGroupSummary, Template, TemplateStack, LogSetting, Schedule,
-    ZoneProtectionProfile, PaginationParams, PaginatedResponse
+    ZoneProtectionProfile, PaginatedResponse
 )
 from filtering import (
-    apply_filters, FilterDefinition, FilterConfig, FilterOperator,
+    iter_filters, collect_page, build_page_info, split_filter_key, FilterDefinition, FilterProcessor,
+    FilterConfig, FilterOperator, LOWERED_LIST_OPERATORS,
     ADDRESS_FILTERS, SERVICE_FILTERS, SECURITY_RULE_FILTERS,
     DEVICE_GROUP_FILTERS, GROUP_FILTERS, PROFILE_FILTERS,
     NAT_RULE_FILTERS, TEMPLATE_FILTERS, TEMPLATE_STACK_FILTERS,
     LOG_PROFILE_FILTERS, SCHEDULE_FILTERS
 )
 from zodb_cache import get_zodb_cache
+from http_cache import HTTPCacheMiddleware, ResponseCache, DiskResponseCache, FileStatCache, etag_matches
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-load and cache all configurations before serving requests"""
+    await startup_event()
+    yield
+
 
 # Initialize FastAPI app with comprehensive documentation
 app = FastAPI(
+    lifespan=lifespan,
     title="PAN-OS Panorama Configuration API",
     description="""
     This API provides real-time access to Panorama PAN-OS configuration data from XML files.
@@ -178,6 +199,7 @@ app = FastAPI(
         "name": "Apache 2.0",
         "url": "https://www.apache.org/licenses/LICENSE-2.0.html"
     },
+    default_response_class=ORJSONResponse,
     tags_metadata=[
         {
             "name": "Configuration",
@@ -221,25 +243,72 @@ app = FastAPI(
 # Configuration
 CONFIG_FILES_PATH = os.environ.get("CONFIG_FILES_PATH", "./config-files")
 parsers: Dict[str, PanoramaXMLParser] = {}
-available_configs: List[str] = []
+available_configs: Set[str] = set()
+# Sorted available config names for display
+available_configs_sorted: List[str] = []
 # Track which configs are fully loaded and ready
 ready_configs: Set[str] = set()
 # Track configs currently being loaded
 loading_configs: Set[str] = set()
+# Per-config locks so concurrent requests never parse the same file twice
+parser_locks: Dict[str, asyncio.Lock] = {}
+# Background re-caching of configs whose file changed, by config name
+cache_reload_tasks: Dict[str, asyncio.Task] = {}
+# Serialized response bodies, bounded by total size (0 disables the cache)
+response_cache = ResponseCache(max_bytes=int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024)))
+# Optional on-disk tier kept across restarts, bounded by total size and
+# keyed by the app version so an upgrade never replays stale bodies
+RESPONSE_CACHE_DIR = os.environ.get("RESPONSE_CACHE_DIR")
+disk_response_cache = DiskResponseCache(
+    RESPONSE_CACHE_DIR,
+    max_bytes=int(os.environ.get("RESPONSE_CACHE_DIR_MAX_BYTES", 256 * 1024 * 1024)),
+    version=app.version
+) if RESPONSE_CACHE_DIR else None
+# Config file stat results, refreshed at most once per second
+config_stat_cache = FileStatCache(ttl=1.0)
+# Built React entry page, kept in memory and re-read only when the file changes
+INDEX_HTML_PATH = "static/dist/index.html"
+static_stat_cache = FileStatCache(ttl=1.0)
+_index_html: Optional[Tuple[int, bytes, str]] = None
+
+
+def get_config_path(config_name: str) -> Optional[str]:
+    """Return the XML file path for a known configuration, or None"""
+    if config_name not in available_configs:
+        return None
+    return os.path.join(CONFIG_FILES_PATH, f"{config_name}.xml")
+
+
+# Answer repeated GETs for unchanged configurations with 304 Not Modified or a cached body
+app.add_middleware(HTTPCacheMiddleware, config_path_resolver=get_config_path,
+                   response_cache=response_cache, stat_cache=config_stat_cache,
+                   disk_cache=disk_response_cache)
 
 # Templates removed - using React frontend instead
 
-async def load_and_cache_config(config_name: str) -> None:
-    """Load a configuration and fully cache all its objects using ZODB for persistence"""
+async def load_and_cache_config(config_name: str, parser: Optional[PanoramaXMLParser] = None) -> None:
+    """Load a configuration and fully cache all its objects using ZODB for persistence
+    
+    Parsing, hashing and ZODB I/O are blocking, so the work runs in a worker
+    thread to keep the event loop responsive while large files load. A parser
+    already built from the current file is cached as is instead of parsing again.
+    """
+    await asyncio.to_thread(_load_and_cache_config_sync, config_name, parser)
+
+
+def _load_and_cache_config_sync(config_name: str, parser: Optional[PanoramaXMLParser] = None) -> None:
+    """Blocking implementation of load_and_cache_config"""
     import time
     start_time = time.time()
     xml_path = os.path.join(CONFIG_FILES_PATH, f"{config_name}.xml")
+    # Objects are only published while no reload has cleared this config's cache
+    generation = background_cache.get_generation(config_name)
     
     # Get ZODB cache instance
     zodb_cache = get_zodb_cache()
     
     # Check if we have valid cached data
-    if zodb_cache.is_cache_valid(config_name, xml_path):
+    if parser is None and zodb_cache.is_cache_valid(config_name, xml_path):
         print(f"  Loading from ZODB cache...")
         cached_data = zodb_cache.load_from_cache(config_name)
         
@@ -251,39 +320,24 @@ async def load_and_cache_config(config_name: str) -> None:
             # Load cached data into memory cache
             total_items = 0
             for obj_type, items in cached_data.items():
-                cache_key = f"{config_name}:{obj_type}"
-                
-                # Convert objects to dictionaries for background cache
-                dict_items = []
-                for item in items:
-                    if hasattr(item, 'dict'):
-                        # Use by_alias=True to get hyphenated field names
-                        dict_items.append(item.dict(by_alias=True))
-                    elif hasattr(item, '__dict__'):
-                        dict_items.append(item.__dict__)
-                    else:
-                        dict_items.append(item)
-                
-                background_cache.cache[cache_key] = {
-                    'items': dict_items,
-                    'timestamp': time.time(),
-                    'data': dict_items  # Add data key for background cache compatibility
-                }
+                # Keep the typed models, exactly as a fresh parse would cache them
+                background_cache.publish(config_name, obj_type, items, generation)
                 item_count = len(items) if items else 0
                 total_items += item_count
                 print(f"  Loaded {obj_type}: {item_count} items")
             
             # Mark as ready
-            background_cache.mark_config_ready(config_name)
+            background_cache.mark_config_ready(config_name, generation)
             
             elapsed = time.time() - start_time
             print(f"  Total: {total_items} items loaded from cache in {elapsed:.2f} seconds")
             return
     
     # No valid cache, parse from XML
-    print(f"  Parsing XML file...")
-    parser = PanoramaXMLParser(xml_path)
-    parsers[config_name] = parser
+    if parser is None:
+        print(f"  Parsing XML file...")
+        parser = PanoramaXMLParser(xml_path)
+        parsers[config_name] = parser
     
     # Define what to cache with proper method names
     cache_methods = [
@@ -310,12 +364,7 @@ async def load_and_cache_config(config_name: str) -> None:
                 items = method()
                 
                 # Store in memory cache
-                cache_key = f"{config_name}:{obj_type}"
-                background_cache.cache[cache_key] = {
-                    'items': items,
-                    'timestamp': time.time(),
-                    'data': items  # Add data key for background cache compatibility
-                }
+                background_cache.publish(config_name, obj_type, items, generation)
                 
                 # Store for ZODB
                 zodb_data[obj_type] = items
@@ -326,54 +375,69 @@ async def load_and_cache_config(config_name: str) -> None:
         except Exception as e:
             print(f"Failed: {e}")
     
-    # Save to ZODB cache
+    # Save to ZODB cache, unless a newer edit has already superseded this load
+    if background_cache.get_generation(config_name) != generation:
+        print(f"  Skipping ZODB save, configuration changed while caching")
+        return
     print(f"  Saving to ZODB cache...")
     zodb_cache.save_to_cache(config_name, xml_path, zodb_data)
     
     # Mark this config as fully cached
-    background_cache.mark_config_ready(config_name)
+    background_cache.mark_config_ready(config_name, generation)
     
     elapsed = time.time() - start_time
     print(f"  Total: {total_items} items cached in {elapsed:.2f} seconds")
 
-@app.on_event("startup")
+async def preload_config(config_name: str) -> None:
+    """Load and cache one configuration at startup, tracking its readiness"""
+    print(f"Loading configuration: {config_name}")
+    loading_configs.add(config_name)
+    
+    try:
+        await load_and_cache_config(config_name)
+        ready_configs.add(config_name)
+        print(f"✓ Configuration '{config_name}' fully loaded and cached")
+    except Exception as e:
+        print(f"✗ Failed to load configuration '{config_name}': {e}")
+    finally:
+        loading_configs.discard(config_name)
+
 async def startup_event():
     """Scan for XML files and pre-load/cache them on startup"""
-    global available_configs, ready_configs, loading_configs
+    global available_configs, available_configs_sorted, ready_configs, loading_configs
     
     if not os.path.exists(CONFIG_FILES_PATH):
         os.makedirs(CONFIG_FILES_PATH, exist_ok=True)
     
-    # Find all XML files in the config directory
-    xml_files = glob.glob(os.path.join(CONFIG_FILES_PATH, "*.xml"))
+    # Find all XML files in the config directory in one scandir pass, seeding
+    # the stat cache so the first requests don't stat the files again
+    xml_files = {}
+    with os.scandir(CONFIG_FILES_PATH) as entries:
+        for entry in entries:
+            # Hidden files are skipped, as glob("*.xml") did
+            if entry.name.endswith(".xml") and not entry.name.startswith(".") and entry.is_file():
+                config_stat_cache.prime(entry.path, entry.stat())
+                xml_files[entry.name[:-len(".xml")]] = entry.path
     
     if not xml_files:
         print(f"Warning: No XML files found in {CONFIG_FILES_PATH}")
         return
     
     # Store available config names (without path and extension)
-    available_configs = [os.path.splitext(os.path.basename(f))[0] for f in xml_files]
-    print(f"Found {len(available_configs)} configuration files: {available_configs}")
+    # as a set so the per-request membership checks are O(1)
+    available_configs = set(xml_files)
+    available_configs_sorted = sorted(available_configs)
+    print(f"Found {len(available_configs)} configuration files: {available_configs_sorted}")
     
-    # Pre-load and fully cache each configuration
+    # Pre-load and fully cache all configurations concurrently, each in its own worker thread
     print("Pre-loading and caching all configurations...")
-    for config_name in available_configs:
-        print(f"Loading configuration: {config_name}")
-        loading_configs.add(config_name)
-        
-        try:
-            # Load the parser and trigger full caching synchronously
-            await load_and_cache_config(config_name)
-            ready_configs.add(config_name)
-            print(f"✓ Configuration '{config_name}' fully loaded and cached")
-        except Exception as e:
-            print(f"✗ Failed to load configuration '{config_name}': {e}")
-        finally:
-            loading_configs.discard(config_name)
+    # Create the shared ZODB cache up front so the workers don't race to construct it
+    get_zodb_cache()
+    await asyncio.gather(*(preload_config(config_name) for config_name in available_configs_sorted))
     
     print(f"Startup complete. {len(ready_configs)}/{len(available_configs)} configurations ready.")
 
-def get_parser(config_name: str) -> PanoramaXMLParser:
+async def get_parser(config_name: str) -> PanoramaXMLParser:
     """Get parser for a specific config file (must be fully loaded)"""
     # Check if config is ready
     if config_name not in ready_configs:
@@ -393,65 +457,280 @@ def get_parser(config_name: str) -> PanoramaXMLParser:
                 detail=f"Configuration '{config_name}' not found. Available configs: {list(ready_configs)}"
             )
     
-    # Return the pre-loaded parser
-    if config_name not in parsers:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal error: Configuration '{config_name}' marked as ready but parser not found."
-        )
+    # Return the pre-loaded parser, parsing in a worker thread if it is missing
+    # or the file has been modified since it was parsed
+    parser = parsers.get(config_name)
+    if parser is None or is_parser_stale(parser):
+        lock = parser_locks.setdefault(config_name, asyncio.Lock())
+        async with lock:
+            parser = parsers.get(config_name)
+            if parser is None or is_parser_stale(parser):
+                stale = parser is not None
+                xml_path = os.path.join(CONFIG_FILES_PATH, f"{config_name}.xml")
+                parser = await asyncio.to_thread(PanoramaXMLParser, xml_path)
+                parsers[config_name] = parser
+                if stale:
+                    # Objects cached from the previous file contents are no longer
+                    # valid; cache the new parser's objects in the background
+                    background_cache.clear_cache(config_name)
+                    schedule_cache_reload(config_name, parser)
+    
+    return parser
+
+def schedule_cache_reload(config_name: str, parser: PanoramaXMLParser) -> None:
+    """Re-cache a config from its rebuilt parser without holding up the request
+    
+    Until the reload publishes, the cache-backed endpoints fall back to the
+    parser. A newer edit schedules a newer reload, whose cache generation
+    makes any earlier one drop its results.
+    """
+    task = asyncio.create_task(load_and_cache_config(config_name, parser))
+    cache_reload_tasks[config_name] = task
+    
+    def reload_done(task: asyncio.Task) -> None:
+        if cache_reload_tasks.get(config_name) is task:
+            del cache_reload_tasks[config_name]
+        if not task.cancelled() and task.exception() is not None:
+            print(f"✗ Failed to re-cache configuration '{config_name}': {task.exception()}")
+    
+    task.add_done_callback(reload_done)
+
+async def refresh_stale_config(config_name: str) -> None:
+    """Rebuild the parser of a modified config before its cached objects are served
+    
+    The background-cache branches answer without calling get_parser, so they
+    call this first. A stale parser is rebuilt by get_parser, which also
+    clears the config's cached objects and schedules their reload; the request
+    then falls back to the new parser instead of producing an old body under
+    the new file's ETag.
+    """
+    parser = parsers.get(config_name)
+    if parser is not None and is_parser_stale(parser):
+        await get_parser(config_name)
+
+def is_parser_stale(parser: PanoramaXMLParser) -> bool:
+    """Whether the parser's XML file changed on disk after it was parsed"""
+    stat = config_stat_cache.stat(parser.xml_file_path)
+    return stat is not None and stat.st_mtime_ns != parser.mtime_ns
+
+# Pages with at least this many items are streamed instead of serialized in one go
+STREAMING_MIN_ITEMS = 1000
+# Number of items serialized per streamed chunk
+_STREAM_CHUNK_ITEMS = 256
+
+def _encode_model(obj: Any) -> Any:
+    """orjson fallback for Pydantic models, matching jsonable_encoder's by-alias output"""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class ModelJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes Pydantic models found in the content
     
-    return parsers[config_name]
-
-def paginate_results(items: List, pagination: PaginationParams) -> Dict:
-    """Apply pagination to a list of items and return paginated response"""
-    
-    # Serialize items if they are Pydantic models to ensure proper JSON serialization
-    def serialize_items(item_list):
-        serialized = []
-        for item in item_list:
-            if hasattr(item, 'model_dump'):
-                # Pydantic v2
-                serialized.append(item.model_dump())
-            elif hasattr(item, 'dict'):
-                # Pydantic v1 (deprecated but still supported)
-                serialized.append(item.dict())
-            else:
-                # Not a Pydantic model, use as-is
-                serialized.append(item)
-        return serialized
-    
-    if pagination.disable_paging:
-        return {
-            "items": serialize_items(items),
-            "total_items": len(items),
+    Returning it directly skips FastAPI's jsonable_encoder walk over the
+    payload, while producing the same JSON for the models inside.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_model, option=orjson.OPT_NON_STR_KEYS)
+
+def _serialize_item(item: Any) -> Any:
+    """Convert a Pydantic model to a dict for JSON serialization"""
+    if hasattr(item, 'model_dump'):
+        # Pydantic v2
+        return item.model_dump()
+    if hasattr(item, 'dict'):
+        # Pydantic v1 (deprecated but still supported)
+        return item.dict()
+    # Not a Pydantic model, use as-is
+    return item
+
+def _stream_page(items: Iterable, page_info: Optional[Dict[str, Any]],
+                 serialize: Callable[[Any], Any] = _serialize_item) -> Iterator[bytes]:
+    """Yield a paginated response body, serializing the items in chunks
+    
+    When page_info is None the items are the whole unpaged result and the
+    pagination metadata is derived from their count once they are streamed.
+    """
+    def dump_chunk(chunk: List[Any], first: bool) -> bytes:
+        # orjson writes "[...]"; strip the brackets to splice into the array
+        body = orjson.dumps(chunk, option=orjson.OPT_NON_STR_KEYS)[1:-1]
+        return body if first else b',' + body
+    
+    yield b'{"items":['
+    count = 0
+    chunk = []
+    for item in items:
+        chunk.append(serialize(item))
+        count += 1
+        if len(chunk) == _STREAM_CHUNK_ITEMS:
+            yield dump_chunk(chunk, count == len(chunk))
+            chunk = []
+    if chunk:
+        yield dump_chunk(chunk, count == len(chunk))
+    
+    if page_info is None:
+        page_info = {
+            "total_items": count,
             "page": 1,
-            "page_size": len(items),
+            "page_size": count,
             "total_pages": 1,
             "has_next": False,
             "has_previous": False
         }
-    
-    total_items = len(items)
-    total_pages = (total_items + pagination.page_size - 1) // pagination.page_size
+    yield b'],' + orjson.dumps(page_info, option=orjson.OPT_NON_STR_KEYS)[1:]
+
+def iter_named_filters(items: Iterable, name: Optional[str], filter_params: Dict[str, Any],
+                       definition: FilterDefinition) -> Iterator:
+    """Lazily apply the legacy partial-name filter and the advanced filters"""
+    if name:
+        name_lower = name.lower()
+        items = (item for item in items if name_lower in item.name_lower)
+    return iter_filters(items, filter_params, definition)
+
+
+def paginate_results(items: Iterable, page: int = 1, page_size: int = 500,
+                     disable_paging: bool = False) -> Response:
+    """Apply pagination to a list of items and return the serialized paginated response
+    
+    The payload already matches PaginatedResponse, so it is returned as an
+    ORJSONResponse to skip FastAPI's response_model re-validation and
+    jsonable_encoder pass over every item. The pagination arguments are plain
+    values already validated by the endpoints' Query parameters. Besides
+    lists, items may be a lazy iterable of filtered objects; only the
+    requested page is then kept.
+    
+    Unpaged results over a lazy iterable, and pages of STREAMING_MIN_ITEMS or
+    more, are streamed so the full JSON body is never held in memory at once.
+    """
+    if disable_paging:
+        if not isinstance(items, list):
+            return StreamingResponse(_stream_page(items, None), media_type="application/json")
+        total_items = len(items)
+        if total_items >= STREAMING_MIN_ITEMS:
+            return StreamingResponse(_stream_page(items, None), media_type="application/json")
+        return ORJSONResponse({
+            "items": [_serialize_item(item) for item in items],
+            "total_items": total_items,
+            "page": 1,
+            "page_size": total_items,
+            "total_pages": 1,
+            "has_next": False,
+            "has_previous": False
+        })
     
     # Calculate start and end indices
-    start_idx = (pagination.page - 1) * pagination.page_size
-    end_idx = start_idx + pagination.page_size
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
     
     # Get the page of items
-    paginated_items = items[start_idx:end_idx]
+    if isinstance(items, list):
+        total_items = len(items)
+        # Past the last page there is nothing to copy
+        paginated_items = items[start_idx:end_idx] if start_idx < total_items else []
+    else:
+        paginated_items, total_items = collect_page(items, start_idx, end_idx)
     
-    return {
-        "items": serialize_items(paginated_items),
-        "total_items": total_items,
-        "page": pagination.page,
-        "page_size": pagination.page_size,
-        "total_pages": total_pages,
-        "has_next": pagination.page < total_pages,
-        "has_previous": pagination.page > 1
-    }
+    info = build_page_info(total_items, page, page_size)
+    if len(paginated_items) >= STREAMING_MIN_ITEMS:
+        return StreamingResponse(_stream_page(paginated_items, info), media_type="application/json")
+    return ORJSONResponse({"items": [_serialize_item(item) for item in paginated_items], **info})
+
+async def paginate_filtered_results(items: Iterable, page: int = 1, page_size: int = 500,
+                                   disable_paging: bool = False) -> Response:
+    """paginate_results() that runs pending filters in a worker thread
+    
+    Lists are only sliced, so they are paginated on the event loop. A lazy
+    iterable still has to run its filters over the whole source to count the
+    matches, which would stall every other request, so that page is
+    collected with asyncio.to_thread. Unpaged lazy results are already
+    streamed from Starlette's threadpool.
+    """
+    if disable_paging or isinstance(items, list):
+        return paginate_results(items, page, page_size, disable_paging)
+    return await asyncio.to_thread(paginate_results, items, page, page_size)
+
+async def get_filtered_cached_page(config_name: str, obj_type: str, filters: Dict[str, Any],
+                                   page: int, page_size: int) -> Optional[Dict[str, Any]]:
+    """background_cache.get_filtered_cached_data(), in a worker thread when a filter applies"""
+    if any(filters.values()):
+        return await asyncio.to_thread(
+            background_cache.get_filtered_cached_data, config_name, obj_type, filters, page, page_size
+        )
+    return background_cache.get_filtered_cached_data(config_name, obj_type, filters, page, page_size)
+
+def cached_page_response(page_data: Dict[str, Any]) -> Response:
+    """Serialize a page of background-cached models by alias, streaming large pages"""
+    items = page_data["items"]
+    if len(items) >= STREAMING_MIN_ITEMS:
+        page_info = {key: value for key, value in page_data.items() if key != "items"}
+        return StreamingResponse(_stream_page(items, page_info, _encode_model), media_type="application/json")
+    return ModelJSONResponse(page_data)
+
+def paginate_shared_objects(parser: PanoramaXMLParser, object_type: str,
+                            page: int, page_size: int, disable_paging: bool) -> Response:
+    """Paginate unfiltered shared objects from their memoized serialized form
+    
+    Shared objects only change with the XML file, so the parser keeps their
+    model_dump() output and pages are sliced from it directly. The full
+    unpaged payload is serialized once and replayed as raw bytes.
+    """
+    items = parser.get_shared_object_dicts(object_type)
+    if not disable_paging:
+        return paginate_results(items, page, page_size)
+    
+    body = parser.get_serialized_payload(
+        f"shared/{object_type}", lambda: b"".join(_stream_page(items, None))
+    )
+    return Response(content=body, media_type="application/json")
+
+def object_response(parser: PanoramaXMLParser, kind: str, obj: Any) -> Response:
+    """Serialize a single object the way response_model would, memoized on the parser
+    
+    The body is the by-alias JSON FastAPI produces for a response_model, but
+    it is built once per object and replayed as raw bytes afterwards.
+    """
+    body = parser.get_serialized_payload(
+        f"{kind}/{obj.name}", lambda: orjson.dumps(obj.model_dump(mode="json", by_alias=True))
+    )
+    return Response(content=body, media_type="application/json")
+
+# Operator aliases accepted in filter parameters, mapped to their operator values
+_OPERATOR_ALIASES: Mapping[str, str] = MappingProxyType({
+    'eq': 'eq',
+    'equals': 'eq',
+    'ne': 'ne',
+    'not_equals': 'ne',
+    'contains': 'contains',
+    'not_contains': 'not_contains',
+    'starts_with': 'starts_with',
+    'ends_with': 'ends_with',
+    'in': 'in',
+    'not_in': 'not_in',
+    'gt': 'gt',
+    'greater_than': 'gt',
+    'lt': 'lt',
+    'less_than': 'lt',
+    'gte': 'gte',
+    'greater_than_or_equal': 'gte',
+    'lte': 'lte',
+    'less_than_or_equal': 'lte',
+    'regex': 'regex',
+    'exists': 'exists'
+})
+# Longest aliases first so e.g. "_not_equals" is never read as "_equals"
+_OPERATOR_ALIAS_PATTERN = "|".join(
+    re.escape(alias) for alias in sorted(_OPERATOR_ALIASES, key=len, reverse=True)
+)
+
+# filter[field] or filter[field][operator]
+_FILTER_BRACKET_RE = re.compile(r'^filter\[([^\]]+)\](?:\[([^\]]+)\])?$')
+# filter.field.operator (split on the last dot) or filter.field
+_FILTER_DOT_RE = re.compile(r'^filter\.(?:(.*)\.(%s)|(.*))$' % _OPERATOR_ALIAS_PATTERN, re.DOTALL)
+# filter_field_operator or filter_field
+_FILTER_UNDERSCORE_RE = re.compile(r'^filter_(?:(.+?)_(%s)|(.*))$' % _OPERATOR_ALIAS_PATTERN, re.DOTALL)
 
-def parse_filter_params(params: Dict[str, Any]) -> Dict[str, Any]:
+
+def parse_filter_params(params: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]) -> Dict[str, Any]:
     """Parse filter parameters from request with validation
     
     Supports both dot and bracket notation for filters:
@@ -461,111 +740,127 @@ def parse_filter_params(params: Dict[str, Any]) -> Dict[str, Any]:
     - filter[name][equals]=value (bracket notation, explicit operator)
     - filter_name=value (direct parameter name format)
     - filter_name_equals=value (direct parameter name with operator format)
+    
+    Each key is normalized by parse_filter_key(), which is memoized.
+    params may be a mapping or an iterable of (key, value) pairs such as
+    parse_qsl() output. Repeated in / not_in filters are collected into a
+    list of values (filter.tag.in=a&filter.tag.in=b); for any other repeated
+    key the last value wins.
     """
     filters = {}
+    pairs = params.items() if isinstance(params, Mapping) else params
     
-    # Create a mapping of operator aliases to their enum values
-    operator_aliases = {
-        'eq': 'eq',
-        'equals': 'eq',
-        'ne': 'ne',
-        'not_equals': 'ne',
-        'contains': 'contains',
-        'not_contains': 'not_contains',
-        'starts_with': 'starts_with',
-        'ends_with': 'ends_with',
-        'in': 'in',
-        'not_in': 'not_in',
-        'gt': 'gt',
-        'greater_than': 'gt',
-        'lt': 'lt',
-        'less_than': 'lt',
-        'gte': 'gte',
-        'greater_than_or_equal': 'gte',
-        'lte': 'lte',
-        'less_than_or_equal': 'lte',
-        'regex': 'regex',
-        'exists': 'exists'
-    }
-    
-    import re
-    
-    for key, value in params.items():
-        if value is None:
-            continue
-            
-        # Handle bracket notation: filter[field] or filter[field][operator]
-        bracket_match = re.match(r'^filter\[([^\]]+)\](?:\[([^\]]+)\])?$', key)
-        if bracket_match:
-            field, operator = bracket_match.groups()
-            if operator and operator in operator_aliases:
-                # filter[field][operator] format
-                op = operator_aliases[operator]
-                filters[f"{field}_{op}"] = value
-            else:
-                # filter[field] format (default to contains operator)
-                filters[field] = value
+    for key, value in pairs:
+        if value is None or not key.startswith('filter'):
             continue
-            
-        # Handle dot notation: filter.field or filter.field.operator
-        if key.startswith('filter.'):
-            try:
-                # Extract field name and operator from filter.field or filter.field.operator
-                filter_key = key[7:]  # Remove 'filter.' prefix
-                
-                # Validate filter key format
-                if not filter_key:
-                    raise HTTPException(status_code=400, detail=f"Invalid filter format: {key}")
-                
-                # Check if there's an operator specified
-                parts = filter_key.rsplit('.', 1)  # Split from the right to handle field names with dots
-                
-                # Check if the last part is an operator alias
-                if len(parts) == 2 and parts[1] in operator_aliases:
-                    # filter.field.operator format
-                    field, op_alias = parts
-                    if not field:
-                        raise HTTPException(status_code=400, detail=f"Invalid filter format: {key}")
-                    # Map the alias to the actual operator value
-                    op = operator_aliases[op_alias]
-                    filters[f"{field}_{op}"] = value
-                else:
-                    # filter.field format (default to contains operator)
-                    filters[filter_key] = value
-                    
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=f"Error parsing filter {key}: {str(e)}")
+        filter_key = parse_filter_key(key)
+        if filter_key is None:
             continue
-            
-        # Handle direct parameter format: filter_field or filter_field_operator
-        if key.startswith('filter_'):
-            filter_key = key[7:]  # Remove 'filter_' prefix
-            if not filter_key:
+        previous = filters.get(filter_key)
+        if previous is not None and split_filter_key(filter_key)[1] in LOWERED_LIST_OPERATORS:
+            if isinstance(previous, list):
+                previous.append(value)
                 continue
-                
-            # Check if the key ends with an operator
-            found_operator = False
-            for op_alias, op_value in operator_aliases.items():
-                if filter_key.endswith(f"_{op_alias}"):
-                    # filter_field_operator format
-                    field = filter_key[:-len(f"_{op_alias}")]
-                    if field:
-                        filters[f"{field}_{op_value}"] = value
-                        found_operator = True
-                        break
-            
-            if not found_operator:
-                # filter_field format (default to contains operator)
-                filters[filter_key] = value
+            value = [previous, value]
+        filters[filter_key] = value
                 
     return filters
 
+
+@lru_cache(maxsize=4096)
+def parse_filter_key(key: str) -> Optional[str]:
+    """Normalize a filter query key to "field" or "field_operator"
+    
+    Each notation is recognized by a single precompiled regular expression.
+    Returns None for keys that are not filters and raises a 400 for
+    malformed dot notation. Results are memoized per key, since clients
+    send the same handful of filter keys over and over.
+    """
+    # Handle bracket notation: filter[field] or filter[field][operator]
+    bracket_match = _FILTER_BRACKET_RE.match(key)
+    if bracket_match:
+        field, operator = bracket_match.groups()
+        if operator and operator in _OPERATOR_ALIASES:
+            # filter[field][operator] format
+            return f"{field}_{_OPERATOR_ALIASES[operator]}"
+        # filter[field] format (default to contains operator)
+        return field
+        
+    # Handle dot notation: filter.field or filter.field.operator
+    dot_match = _FILTER_DOT_RE.match(key)
+    if dot_match:
+        field, operator, filter_key = dot_match.groups()
+        if operator:
+            # filter.field.operator format
+            if not field:
+                raise HTTPException(status_code=400, detail=f"Invalid filter format: {key}")
+            return f"{field}_{_OPERATOR_ALIASES[operator]}"
+        if filter_key:
+            # filter.field format (default to contains operator)
+            return filter_key
+        raise HTTPException(status_code=400, detail=f"Invalid filter format: {key}")
+        
+    # Handle direct parameter format: filter_field or filter_field_operator
+    underscore_match = _FILTER_UNDERSCORE_RE.match(key)
+    if underscore_match:
+        field, operator, filter_key = underscore_match.groups()
+        if operator:
+            # filter_field_operator format
+            return f"{field}_{_OPERATOR_ALIASES[operator]}"
+        if filter_key:
+            # filter_field format (default to contains operator)
+            return filter_key
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_query_filters(query_string: bytes) -> Dict[str, Any]:
+    """Parse filter parameters straight from the raw query string
+    
+    Results are memoized on the raw bytes, so repeated identical queries skip
+    parsing entirely. The returned dict is shared between callers and must
+    be treated as read-only.
+    """
+    return parse_filter_params(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+
+def get_index_page() -> Optional[Tuple[bytes, str]]:
+    """Return the built React index page and its ETag, or None if the frontend is not built"""
+    global _index_html
+    stat = static_stat_cache.stat(INDEX_HTML_PATH)
+    if stat is None:
+        return None
+    if _index_html is None or _index_html[0] != stat.st_mtime_ns:
+        with open(INDEX_HTML_PATH, "rb") as f:
+            body = f.read()
+        _index_html = (stat.st_mtime_ns, body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+    return _index_html[1], _index_html[2]
+
+def get_index_html() -> Optional[bytes]:
+    """Return the built React index page, or None if the frontend is not built"""
+    page = get_index_page()
+    return page[0] if page is not None else None
+
+def get_filters(request: Request) -> Dict[str, Any]:
+    """Dependency providing the parsed filter parameters of the current request"""
+    query_string = request.scope["query_string"]
+    # Most requests only carry paging parameters; skip decoding those entirely
+    # unless some parameter name starts with "filter"
+    if not (query_string.startswith(b"filter") or b"&filter" in query_string):
+        return {}
+    return parse_query_filters(query_string)
+
 @app.get("/", include_in_schema=False)
-async def root():
+async def root(request: Request):
     """Serve the React frontend"""
     # Check if we have a built React app
-    if os.path.exists("static/dist/index.html"):
-        return FileResponse("static/dist/index.html")
+    index_page = get_index_page()
+    if index_page is not None:
+        index_html, etag = index_page
+        # Browsers revalidate on each load, so a new build is picked up at once
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(index_html, headers=headers)
     else:
         # Fallback to API docs if no frontend is built
         return RedirectResponse(url="/docs")
@@ -630,13 +925,20 @@ async def get_config_info(
             detail=f"Configuration '{config_name}' not found"
         )
     
-    xml_path = os.path.join(CONFIG_FILES_PATH, f"{config_name}.xml")
+    xml_path = get_config_path(config_name)
+    # Shares the short-lived stat cache with the HTTP cache middleware
+    stat = config_stat_cache.stat(xml_path)
+    if stat is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Configuration '{config_name}' not found"
+        )
     
     return {
         "name": config_name,
         "path": xml_path,
-        "size": os.path.getsize(xml_path),
-        "modified": os.path.getmtime(xml_path),
+        "size": stat.st_size,
+        "modified": stat.st_mtime,
         "ready": config_name in ready_configs,
         "loading": config_name in loading_configs,
         "cached": background_cache.is_config_ready(config_name)
@@ -644,19 +946,19 @@ async def get_config_info(
 
 # Address Objects Endpoints
 @app.get("/api/v1/configs/{config_name}/addresses", 
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Address Objects"],
          summary="Get all address objects",
          description="Retrieve all shared address objects from the configuration. Supports filtering by name and tags, with pagination.")
 async def get_addresses(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by address name (partial match)"),
     tag: Optional[str] = Query(None, description="Filter by tag"),
     location: Optional[str] = Query("all", description="Filter by location (all/shared/device-group/template/vsys)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    advanced_filters: Dict[str, Any] = Depends(get_filters)
 ):
     """Get address objects with optional filtering and pagination
     
@@ -698,11 +1000,8 @@ async def get_addresses(
     - filter[description][not_contains]=test
     - filter[parent_device_group][eq]=branch-offices
     """
-    # Check if we have cached data first
-    # Parse filter parameters to check for advanced filters
-    advanced_filters = parse_filter_params(dict(request.query_params))
-    
     # Use cache if available (can handle both simple and advanced filters)
+    await refresh_stale_config(config_name)
     if background_cache.is_cached(config_name, 'addresses'):
         # Check if simple filters are being applied
         has_simple_filters = (name or tag or location != "all")
@@ -711,10 +1010,10 @@ async def get_addresses(
             # No filters - return paginated cached data directly
             cached_data = background_cache.get_cached_data(config_name, 'addresses', page, page_size)
             if cached_data:
-                return cached_data
+                return cached_page_response(cached_data)
         else:
             # Simple or advanced filters present - use cached filtering
-            filtered_data = background_cache.get_filtered_cached_data(
+            filtered_data = await get_filtered_cached_page(
                 config_name, 'addresses',
                 filters={
                     'location': location,
@@ -726,41 +1025,41 @@ async def get_addresses(
                 page_size=page_size
             )
             if filtered_data:
-                return filtered_data
+                return cached_page_response(filtered_data)
     
     # Fall back to parser if no cache available
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
-    # Get addresses based on location filter
+    # Get addresses based on location filter, starting from the tag index when possible
     if location == "shared":
         addresses = parser.get_shared_addresses()
+    elif tag:
+        addresses = parser.get_addresses_by_tag().get(tag, [])
     else:
         addresses = parser.get_all_addresses()
         
-    # Additional filtering based on location
-    if location == "device-group":
-        addresses = [a for a in addresses if a.parent_device_group is not None]
-    elif location == "template":
-        addresses = [a for a in addresses if a.parent_template is not None]
-    elif location == "vsys":
-        addresses = [a for a in addresses if a.parent_vsys is not None]
-    
-    # Apply legacy filters for backwards compatibility
-    if name:
-        addresses = [a for a in addresses if name.lower() in a.name.lower()]
-    if tag:
-        addresses = [a for a in addresses if a.tag and tag in a.tag]
+    # Apply location and legacy filters in a single pass. The filters are
+    # chained lazily so only the requested page is ever materialized.
+    if location in ("device-group", "template", "vsys") or name or tag:
+        name_lower = name.lower() if name else None
+        addresses = (
+            a for a in addresses
+            if (location != "device-group" or a.parent_device_group is not None)
+            and (location != "template" or a.parent_template is not None)
+            and (location != "vsys" or a.parent_vsys is not None)
+            and (name_lower is None or name_lower in a.name_lower)
+            and (not tag or tag in a.tag_set)
+        )
     
-    # Apply advanced filters (already parsed above)
+    # Apply advanced filters
     if advanced_filters:
-        addresses = apply_filters(addresses, advanced_filters, ADDRESS_FILTERS)
+        addresses = iter_filters(addresses, advanced_filters, ADDRESS_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(addresses, pagination)
+    return await paginate_filtered_results(addresses, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/addresses/{address_name}",
-         response_model=AddressObject,
+         responses={200: {"model": AddressObject}},
          tags=["Address Objects"],
          summary="Get specific address object",
          description="Retrieve a specific address object by its exact name, including location details")
@@ -769,27 +1068,26 @@ async def get_address(
     address_name: str = Path(..., description="Address object name")
 ):
     """Get a specific address object by name"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     # Search in all locations
-    addresses = parser.get_all_addresses()
-    for address in addresses:
-        if address.name == address_name:
-            return address
+    address = parser.get_addresses_by_name().get(address_name)
+    if address is not None:
+        return object_response(parser, "address", address)
     raise HTTPException(status_code=404, detail=f"Address '{address_name}' not found")
 
 @app.get("/api/v1/configs/{config_name}/address-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Address Objects"],
          summary="Get all address groups",
          description="Retrieve all shared address groups including static and dynamic groups, with pagination")
 async def get_address_groups(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     tag: Optional[str] = Query(None, description="Filter by tag"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared address groups with optional filtering and pagination
     
@@ -821,67 +1119,33 @@ async def get_address_groups(
     - filter[tag][in]=production
     - filter[description][starts_with]=DMZ
     """
-    # Check if we have cached data first
+    # Use cache if available; it filters and paginates in a single pass
+    await refresh_stale_config(config_name)
     if background_cache.is_cached(config_name, 'address_groups'):
-        # Get all cached items for filtering
-        all_cached_data = background_cache.get_cached_data(config_name, 'address_groups', page=1, page_size=999999)
-        if all_cached_data:
-            items = all_cached_data['items']
-            
-            # Apply legacy filters
-            if name:
-                items = [g for g in items if name.lower() in g.get('name', '').lower()]
-            if tag:
-                items = [g for g in items if g.get('tag') and tag in g.get('tag')]
-            
-            # Apply advanced filters
-            filter_params = parse_filter_params(dict(request.query_params))
-            if filter_params:
-                # Convert dict items to objects for filter compatibility
-                from types import SimpleNamespace
-                items = [SimpleNamespace(**item) for item in items]
-                items = apply_filters(items, filter_params, GROUP_FILTERS)
-                # Convert back to dicts
-                items = [vars(item) for item in items]
-            
-            # Now apply pagination after filtering
-            total_items = len(items)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_items = items[start_idx:end_idx]
-            
-            return {
-                "items": paginated_items,
-                "total_items": total_items,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total_items + page_size - 1) // page_size,
-                "has_next": end_idx < total_items,
-                "has_previous": page > 1,
-                "from_cache": True
-            }
+        cached_data = await get_filtered_cached_page(
+            config_name, 'address_groups',
+            filters={'name': name, 'tag': tag, 'advanced': filter_params},
+            page=page,
+            page_size=page_size
+        )
+        if cached_data:
+            return cached_page_response(cached_data)
     
     # Fall back to parser if no cache available
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     groups = parser.get_shared_address_groups()
     
-    # Apply legacy filters for backwards compatibility
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    # Apply legacy and advanced filters in one lazy pass
     if tag:
-        groups = [g for g in groups if g.tag and tag in g.tag]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+        groups = (g for g in groups if tag in g.tag_set)
+    if name or tag or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/address-groups/{group_name}",
-         response_model=AddressGroup,
+         responses={200: {"model": AddressGroup}},
          tags=["Address Objects"],
          summary="Get specific address group",
          description="Retrieve a specific address group by its exact name")
@@ -890,27 +1154,26 @@ async def get_address_group(
     group_name: str = Path(..., description="Address group name")
 ):
     """Get a specific address group by name"""
-    parser = get_parser(config_name)
-    groups = parser.get_shared_address_groups()
-    for group in groups:
-        if group.name == group_name:
-            return group
+    parser = await get_parser(config_name)
+    group = parser.get_shared_address_groups_by_name().get(group_name)
+    if group is not None:
+        return object_response(parser, "address-group", group)
     raise HTTPException(status_code=404, detail=f"Address group '{group_name}' not found")
 
 # Service Objects Endpoints
 @app.get("/api/v1/configs/{config_name}/services",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Service Objects"],
          summary="Get all service objects",
          description="Retrieve all shared service objects with protocol definitions, with pagination")
 async def get_services(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by service name (partial match)"),
     protocol: Optional[str] = Query(None, description="Filter by protocol (tcp/udp)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared service objects with optional filtering and pagination
     
@@ -945,67 +1208,35 @@ async def get_services(
     - filter[protocol][eq]=tcp
     - filter[tag][contains]=web
     """
-    # Check if we have cached data first
+    # Use cache if available; it filters and paginates in a single pass
+    await refresh_stale_config(config_name)
     if background_cache.is_cached(config_name, 'services'):
-        # Get all cached items for filtering
-        all_cached_data = background_cache.get_cached_data(config_name, 'services', page=1, page_size=999999)
-        if all_cached_data:
-            items = all_cached_data['items']
-            
-            # Apply legacy filters
-            if name:
-                items = [s for s in items if name.lower() in s.get('name', '').lower()]
-            if protocol and protocol.lower() in ["tcp", "udp"]:
-                items = [s for s in items if s.get('protocol', {}).get(protocol.lower())]
-            
-            # Apply advanced filters
-            filter_params = parse_filter_params(dict(request.query_params))
-            if filter_params:
-                # Convert dict items to objects for filter compatibility
-                from types import SimpleNamespace
-                items = [SimpleNamespace(**item) for item in items]
-                items = apply_filters(items, filter_params, SERVICE_FILTERS)
-                # Convert back to dicts
-                items = [vars(item) for item in items]
-            
-            # Now apply pagination after filtering
-            total_items = len(items)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_items = items[start_idx:end_idx]
-            
-            return {
-                "items": paginated_items,
-                "total_items": total_items,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total_items + page_size - 1) // page_size,
-                "has_next": end_idx < total_items,
-                "has_previous": page > 1,
-                "from_cache": True
-            }
+        cached_data = await get_filtered_cached_page(
+            config_name, 'services',
+            filters={'name': name, 'protocol': protocol, 'advanced': filter_params},
+            page=page,
+            page_size=page_size
+        )
+        if cached_data:
+            return cached_page_response(cached_data)
     
     # Fall back to parser if no cache available
-    parser = get_parser(config_name)
-    services = parser.get_shared_services()
+    parser = await get_parser(config_name)
     
     # Apply legacy filters for backwards compatibility
-    if name:
-        services = [s for s in services if name.lower() in s.name.lower()]
     if protocol and protocol.lower() in ["tcp", "udp"]:
-        services = [s for s in services if hasattr(s.protocol, protocol.lower()) and getattr(s.protocol, protocol.lower())]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        services = apply_filters(services, filter_params, SERVICE_FILTERS)
+        services = parser.get_shared_services_by_protocol()[protocol.lower()]
+    else:
+        services = parser.get_shared_services()
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        services = iter_named_filters(services, name, filter_params, SERVICE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(services, pagination)
+    return await paginate_filtered_results(services, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/services/{service_name}",
-         response_model=ServiceObject,
+         responses={200: {"model": ServiceObject}},
          tags=["Service Objects"],
          summary="Get specific service object",
          description="Retrieve a specific service object by its exact name")
@@ -1014,26 +1245,25 @@ async def get_service(
     service_name: str = Path(..., description="Service object name")
 ):
     """Get a specific service object by name"""
-    parser = get_parser(config_name)
-    services = parser.get_shared_services()
-    for service in services:
-        if service.name == service_name:
-            return service
+    parser = await get_parser(config_name)
+    service = parser.get_shared_services_by_name().get(service_name)
+    if service is not None:
+        return object_response(parser, "service", service)
     raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
 
 @app.get("/api/v1/configs/{config_name}/service-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Service Objects"],
          summary="Get all service groups",
          description="Retrieve all shared service groups, with pagination")
 async def get_service_groups(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     tag: Optional[str] = Query(None, description="Filter by tag"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared service groups with optional filtering and pagination
     
@@ -1064,279 +1294,211 @@ async def get_service_groups(
     - filter[tag][in]=production
     - filter[description][starts_with]=Web
     """
-    # Check if we have cached data first
+    # Use cache if available; it filters and paginates in a single pass
+    await refresh_stale_config(config_name)
     if background_cache.is_cached(config_name, 'service_groups'):
-        # Get all cached items for filtering
-        all_cached_data = background_cache.get_cached_data(config_name, 'service_groups', page=1, page_size=999999)
-        if all_cached_data:
-            items = all_cached_data['items']
-            
-            # Apply legacy filters
-            if name:
-                items = [g for g in items if name.lower() in g.get('name', '').lower()]
-            if tag:
-                items = [g for g in items if g.get('tag') and tag in g.get('tag')]
-            
-            # Apply advanced filters
-            filter_params = parse_filter_params(dict(request.query_params))
-            if filter_params:
-                # Convert dict items to objects for filter compatibility
-                from types import SimpleNamespace
-                items = [SimpleNamespace(**item) for item in items]
-                items = apply_filters(items, filter_params, GROUP_FILTERS)
-                # Convert back to dicts
-                items = [vars(item) for item in items]
-            
-            # Now apply pagination after filtering
-            total_items = len(items)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_items = items[start_idx:end_idx]
-            
-            return {
-                "items": paginated_items,
-                "total_items": total_items,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total_items + page_size - 1) // page_size,
-                "has_next": end_idx < total_items,
-                "has_previous": page > 1,
-                "from_cache": True
-            }
+        cached_data = await get_filtered_cached_page(
+            config_name, 'service_groups',
+            filters={'name': name, 'tag': tag, 'advanced': filter_params},
+            page=page,
+            page_size=page_size
+        )
+        if cached_data:
+            return cached_page_response(cached_data)
     
     # Fall back to parser if no cache available
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     groups = parser.get_shared_service_groups()
     
-    # Apply legacy filters for backwards compatibility
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    # Apply legacy and advanced filters in one lazy pass
     if tag:
-        groups = [g for g in groups if g.tag and tag in g.tag]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+        groups = (g for g in groups if tag in g.tag_set)
+    if name or tag or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 # Shared Location Endpoints
 @app.get("/api/v1/configs/{config_name}/shared/addresses",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Address Objects"],
          summary="Get shared address objects",
          description="Retrieve all address objects defined in the shared location, with pagination")
 async def get_shared_addresses(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by address name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared address objects with pagination"""
-    parser = get_parser(config_name)
-    addresses = parser.get_shared_addresses()
+    parser = await get_parser(config_name)
     
-    if name:
-        addresses = [a for a in addresses if name.lower() in a.name.lower()]
+    # Unfiltered requests are served from the precomputed serialized objects
+    if not name and not filter_params:
+        return paginate_shared_objects(parser, "addresses", page, page_size, disable_paging)
     
-    # Ensure all have location set to shared
-    for addr in addresses:
-        addr.parent_device_group = None
-        addr.parent_template = None
-        addr.parent_vsys = None
+    addresses = parser.get_shared_addresses()
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        addresses = apply_filters(addresses, filter_params, ADDRESS_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        addresses = iter_named_filters(addresses, name, filter_params, ADDRESS_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(addresses, pagination)
+    return await paginate_filtered_results(addresses, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/shared/address-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Address Objects"],
          summary="Get shared address groups",
          description="Retrieve all address groups defined in the shared location, with pagination")
 async def get_shared_address_groups_endpoint(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared address groups with pagination"""
-    parser = get_parser(config_name)
-    groups = parser.get_shared_address_groups()
+    parser = await get_parser(config_name)
     
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    # Unfiltered requests are served from the precomputed serialized objects
+    if not name and not filter_params:
+        return paginate_shared_objects(parser, "address-groups", page, page_size, disable_paging)
     
-    # Ensure all have location set to shared
-    for group in groups:
-        group.parent_device_group = None
-        group.parent_template = None
-        group.parent_vsys = None
+    groups = parser.get_shared_address_groups()
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/shared/services",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Service Objects"],
          summary="Get shared service objects",
          description="Retrieve all service objects defined in the shared location, with pagination")
 async def get_shared_services(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by service name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared service objects with pagination"""
-    parser = get_parser(config_name)
-    services = parser.get_shared_services()
+    parser = await get_parser(config_name)
     
-    if name:
-        services = [s for s in services if name.lower() in s.name.lower()]
+    # Unfiltered requests are served from the precomputed serialized objects
+    if not name and not filter_params:
+        return paginate_shared_objects(parser, "services", page, page_size, disable_paging)
     
-    # Ensure all have location set to shared
-    for svc in services:
-        svc.parent_device_group = None
-        svc.parent_template = None
-        svc.parent_vsys = None
+    services = parser.get_shared_services()
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        services = apply_filters(services, filter_params, SERVICE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        services = iter_named_filters(services, name, filter_params, SERVICE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(services, pagination)
+    return await paginate_filtered_results(services, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/shared/service-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Service Objects"],
          summary="Get shared service groups",
          description="Retrieve all service groups defined in the shared location, with pagination")
 async def get_shared_service_groups_endpoint(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all shared service groups with pagination"""
-    parser = get_parser(config_name)
-    groups = parser.get_shared_service_groups()
+    parser = await get_parser(config_name)
     
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    # Unfiltered requests are served from the precomputed serialized objects
+    if not name and not filter_params:
+        return paginate_shared_objects(parser, "service-groups", page, page_size, disable_paging)
     
-    # Ensure all have location set to shared
-    for group in groups:
-        group.parent_device_group = None
-        group.parent_template = None
-        group.parent_vsys = None
+    groups = parser.get_shared_service_groups()
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 # Security Profiles Endpoints
 @app.get("/api/v1/configs/{config_name}/security-profiles/vulnerability",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Security Profiles"],
          summary="Get vulnerability protection profiles",
          description="Retrieve all vulnerability protection profiles with their rules, with pagination")
 async def get_vulnerability_profiles(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by profile name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all vulnerability protection profiles with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     profiles = parser.get_vulnerability_profiles()
     
-    if name:
-        profiles = [p for p in profiles if name.lower() in p.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        profiles = apply_filters(profiles, filter_params, PROFILE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        profiles = iter_named_filters(profiles, name, filter_params, PROFILE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(profiles, pagination)
+    return await paginate_filtered_results(profiles, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/security-profiles/url-filtering",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Security Profiles"],
          summary="Get URL filtering profiles",
          description="Retrieve all URL filtering profiles with category actions, with pagination")
 async def get_url_filtering_profiles(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by profile name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all URL filtering profiles with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     profiles = parser.get_url_filtering_profiles()
     
-    if name:
-        profiles = [p for p in profiles if name.lower() in p.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        profiles = apply_filters(profiles, filter_params, PROFILE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        profiles = iter_named_filters(profiles, name, filter_params, PROFILE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(profiles, pagination)
+    return await paginate_filtered_results(profiles, page, page_size, disable_paging)
 
 # Device Management Endpoints
 @app.get("/api/v1/configs/{config_name}/device-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get all device groups summary",
          description="Retrieve all device groups with counts of their child objects, with pagination")
 async def get_device_groups(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by device group name (partial match)"),
     parent: Optional[str] = Query(None, description="Filter by parent device group"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all device groups with counts of child objects and pagination
     
@@ -1368,7 +1530,7 @@ async def get_device_groups(
     - filter[description][contains]=branch
     """
     # Check if this is a firewall config - device groups don't exist in firewall configs
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     if parser.is_firewall:
         raise HTTPException(
             status_code=404,
@@ -1376,52 +1538,47 @@ async def get_device_groups(
         )
     
     # Check if we have cached data first
+    await refresh_stale_config(config_name)
     if background_cache.is_cached(config_name, 'device_groups'):
         # Check if simple filters are being applied
-        advanced_filters = parse_filter_params(dict(request.query_params))
         has_simple_filters = (name or parent)
         
-        if not has_simple_filters and not advanced_filters:
+        if not has_simple_filters and not filter_params:
             # No filters - return paginated cached data directly
             cached_data = background_cache.get_cached_data(config_name, 'device_groups', page, page_size)
             if cached_data:
-                return cached_data
+                return cached_page_response(cached_data)
         else:
             # Simple or advanced filters present - use cached filtering
-            filtered_data = background_cache.get_filtered_cached_data(
+            filtered_data = await get_filtered_cached_page(
                 config_name, 'device_groups',
                 filters={
                     'name': name,
                     'parent': parent,
-                    'advanced': advanced_filters  # Include advanced filters
+                    'advanced': filter_params  # Include advanced filters
                 },
                 page=page,
                 page_size=page_size
             )
             if filtered_data:
-                return filtered_data
+                return cached_page_response(filtered_data)
     
     # Fall back to parser if no cache available
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     groups = parser.get_device_group_summaries()
     
-    # Apply legacy filters for backwards compatibility
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    # Apply legacy and advanced filters in one lazy pass
     if parent:
-        groups = [g for g in groups if g.parent_dg and parent.lower() in g.parent_dg.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, DEVICE_GROUP_FILTERS)
+        parent_lower = parent.lower()
+        groups = (g for g in groups if g.parent_dg and parent_lower in g.lowered('parent_dg'))
+    if name or parent or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, DEVICE_GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}",
-         response_model=DeviceGroup,
+         responses={200: {"model": DeviceGroup}},
          tags=["Device Management"],
          summary="Get specific device group",
          description="Retrieve a specific device group by its exact name")
@@ -1430,7 +1587,7 @@ async def get_device_group(
     group_name: str = Path(..., description="Device group name")
 ):
     """Get a specific device group by name"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1438,28 +1595,27 @@ async def get_device_group(
             status_code=404,
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
-    groups = parser.get_device_groups()
-    for group in groups:
-        if group.name == group_name:
-            return group
+    group = parser.get_device_groups_by_name().get(group_name)
+    if group is not None:
+        return object_response(parser, "device-group", group)
     raise HTTPException(status_code=404, detail=f"Device group '{group_name}' not found")
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}/addresses",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get addresses for device group",
          description="Retrieve all address objects defined in a specific device group, with pagination")
 async def get_device_group_addresses(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     group_name: str = Path(..., description="Device group name"),
     name: Optional[str] = Query(None, description="Filter by address name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get addresses for a specific device group with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1468,40 +1624,34 @@ async def get_device_group_addresses(
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
     
-    addresses = parser.get_device_group_addresses(group_name)
+    addresses = await asyncio.to_thread(parser.get_device_group_addresses, group_name)
     
-    if not addresses and not parser.get_device_group_summaries():
+    if not addresses and not parser.get_device_group_names():
         raise HTTPException(status_code=404, detail=f"Device group '{group_name}' not found")
     
-    # Apply legacy filters
-    if name:
-        addresses = [a for a in addresses if name.lower() in a.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        addresses = apply_filters(addresses, filter_params, ADDRESS_FILTERS)
+    # Apply legacy and advanced filters lazily so only the requested page is kept
+    if name or filter_params:
+        addresses = iter_named_filters(addresses, name, filter_params, ADDRESS_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(addresses, pagination)
+    return await paginate_filtered_results(addresses, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}/address-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get address groups for device group",
          description="Retrieve all address groups defined in a specific device group, with pagination")
 async def get_device_group_address_groups(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     group_name: str = Path(..., description="Device group name"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get address groups for a specific device group with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1510,37 +1660,31 @@ async def get_device_group_address_groups(
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
     
-    groups = parser.get_device_group_address_groups(group_name)
-    
-    # Apply legacy filters
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
+    groups = await asyncio.to_thread(parser.get_device_group_address_groups, group_name)
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+    # Apply legacy and advanced filters lazily so only the requested page is kept
+    if name or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}/services",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get services for device group",
          description="Retrieve all service objects defined in a specific device group, with pagination")
 async def get_device_group_services(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     group_name: str = Path(..., description="Device group name"),
     name: Optional[str] = Query(None, description="Filter by service name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get services for a specific device group with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1549,37 +1693,31 @@ async def get_device_group_services(
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
     
-    services = parser.get_device_group_services(group_name)
-    
-    # Apply legacy filters
-    if name:
-        services = [s for s in services if name.lower() in s.name.lower()]
+    services = await asyncio.to_thread(parser.get_device_group_services, group_name)
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        services = apply_filters(services, filter_params, SERVICE_FILTERS)
+    # Apply legacy and advanced filters lazily so only the requested page is kept
+    if name or filter_params:
+        services = iter_named_filters(services, name, filter_params, SERVICE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(services, pagination)
+    return await paginate_filtered_results(services, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}/service-groups",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get service groups for device group",
          description="Retrieve all service groups defined in a specific device group, with pagination")
 async def get_device_group_service_groups(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     group_name: str = Path(..., description="Device group name"),
     name: Optional[str] = Query(None, description="Filter by group name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get service groups for a specific device group with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1588,37 +1726,31 @@ async def get_device_group_service_groups(
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
     
-    groups = parser.get_device_group_service_groups(group_name)
+    groups = await asyncio.to_thread(parser.get_device_group_service_groups, group_name)
     
-    # Apply legacy filters
-    if name:
-        groups = [g for g in groups if name.lower() in g.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        groups = apply_filters(groups, filter_params, GROUP_FILTERS)
+    # Apply legacy and advanced filters lazily so only the requested page is kept
+    if name or filter_params:
+        groups = iter_named_filters(groups, name, filter_params, GROUP_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(groups, pagination)
+    return await paginate_filtered_results(groups, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/device-groups/{group_name}/rules",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Policies"],
          summary="Get security rules for device group",
          description="Retrieve all security rules (pre and post) for a specific device group, with pagination")
 async def get_device_group_rules(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     group_name: str = Path(..., description="Device group name"),
     rulebase: Optional[str] = Query("all", description="Filter by rulebase type (pre/post/all)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get security rules for a specific device group with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a firewall config
     if parser.is_firewall:
@@ -1627,37 +1759,120 @@ async def get_device_group_rules(
             detail="Device groups are not available in firewall configurations. Use /vsys endpoints instead."
         )
     
-    rules = parser.get_device_group_security_rules(group_name, rulebase)
+    rules = await asyncio.to_thread(parser.get_device_group_security_rules, group_name, rulebase)
     
     if not rules:
         # Check if device group exists
-        summaries = parser.get_device_group_summaries()
-        if not any(s.name == group_name for s in summaries):
+        if group_name not in parser.get_device_group_names():
             raise HTTPException(status_code=404, detail=f"Device group '{group_name}' not found")
     
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
+    # Apply advanced filters lazily so only the requested page is kept
     if filter_params:
-        rules = apply_filters(rules, filter_params, SECURITY_RULE_FILTERS)
+        rules = iter_filters(rules, filter_params, SECURITY_RULE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(rules, pagination)
+    return await paginate_filtered_results(rules, page, page_size, disable_paging)
+
+def iter_security_policies(parser: PanoramaXMLParser,
+                           start: Optional[Tuple[str, int]] = None,
+                           name: Optional[str] = None,
+                           device_group: Optional[str] = None,
+                           action: Optional[str] = None) -> Iterator[Tuple[str, int, Any]]:
+    """Yield (location, index, rule) for security rules matching the legacy filters
+    
+    The rules, their runtime metadata and the lower-cased columns the legacy
+    filters scan are assembled once per parser. A start position from a
+    cursor skips every rule before it; a position that is not an existing
+    rule of its location is rejected with a 400.
+    """
+    positioned = parser.get_aggregated_security_rules()
+    first = 0
+    if start is not None:
+        location, index = start
+        # Panorama rules are always located by device group and firewall rules
+        # never are, so an unknown or empty location has no offset
+        offset = parser.get_aggregated_rule_offsets().get(location)
+        if offset is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        first = offset + index
+        # A cursor always points at an existing rule of its own location
+        if first >= len(positioned) or positioned[first][0] != location:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    if not (name or device_group or action):
+        return islice(positioned, first, None)
+    
+    # Action values are lower-case enum members, so an action filter starts
+    # from the positions of the rules with that action
+    candidates: Iterable[int] = range(first, len(positioned))
+    if action:
+        with_action = parser.get_aggregated_rule_positions_by_action().get(action.lower(), ())
+        candidates = islice(with_action, bisect_left(with_action, first), None)
+    if not (name or device_group):
+        return (positioned[i] for i in candidates)
+    
+    # Test the remaining legacy filters against the columns in one lazy pass,
+    # so a page stops scanning as soon as it is full
+    columns = parser.get_aggregated_rule_columns()
+    device_group_column, name_column = columns['device_group'], columns['name']
+    device_group_lower = device_group.lower() if device_group else None
+    name_lower = name.lower() if name else None
+    return (
+        positioned[i] for i in candidates
+        if (device_group_lower is None or device_group_lower in device_group_column[i])
+        and (name_lower is None or name_lower in name_column[i])
+    )
+
+
+def encode_rule_cursor(location: str, index: int) -> str:
+    """Encode a security rule position as an opaque URL-safe cursor"""
+    return base64.urlsafe_b64encode(f"{location}:{index}".encode()).decode("ascii")
+
+
+def decode_rule_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a non-empty cursor from encode_rule_cursor"""
+    try:
+        location, _, index = base64.urlsafe_b64decode(cursor.encode("ascii")).decode().rpartition(":")
+        position = int(index)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if position < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return location, position
+
+
+def paginate_rules_by_cursor(positioned: Iterator[Tuple[str, int, Any]], page_size: int) -> Response:
+    """Return one keyset page of positioned rules with the cursor of the next page"""
+    items = []
+    next_cursor = None
+    for location, index, rule in positioned:
+        if len(items) == page_size:
+            next_cursor = encode_rule_cursor(location, index)
+            break
+        items.append(_serialize_item(rule))
+    return ORJSONResponse({
+        "items": items,
+        "page_size": page_size,
+        "has_next": next_cursor is not None,
+        "next_cursor": next_cursor
+    })
+
 
 @app.get("/api/v1/configs/{config_name}/security-policies",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Policies"],
          summary="Get all security policies across device groups",
          description="Retrieve all security policies aggregated from all device groups, with pagination and filtering")
 async def get_all_security_policies(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by rule name (partial match)"),
     device_group: Optional[str] = Query(None, description="Filter by device group name"),
     action: Optional[str] = Query(None, description="Filter by action (allow/deny)"),
+    cursor: Optional[str] = Query(None, description="Keyset pagination cursor; pass an empty value for the first page and next_cursor afterwards"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all security policies from all device groups with pagination
     
@@ -1701,84 +1916,61 @@ async def get_all_security_policies(
     - filter[application][not_in]=ssl,web-browsing
     - filter[action][eq]=deny
     - filter[disabled][eq]=false
+    
+    **Keyset pagination:**
+    Passing cursor switches to keyset pagination: the response holds
+    page_size items plus a next_cursor to request the following page, and
+    rules before the cursor are skipped without being filtered. Start with
+    an empty cursor. total_items and page numbers are not reported in this mode.
     """
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
-    all_rules = []
+    # An empty cursor starts keyset pagination at the first rule
+    start = decode_rule_cursor(cursor) if cursor else None
+    # Assemble the aggregated rules off the event loop the first time they are needed
+    await asyncio.to_thread(parser.get_aggregated_rule_positions_by_action)
     
-    if parser.is_panorama:
-        # Get all device groups for Panorama configs
-        device_groups = parser.get_device_group_summaries()
-        
-        # Fetch security rules from each device group
-        for dg in device_groups:
-            rules = parser.get_device_group_security_rules(dg.name, "all")
-            for index, rule in enumerate(rules):
-                # Add metadata to each rule
-                rule.device_group = dg.name
-                rule.rule_type = 'Device Group' if rule.parent_device_group else 'Shared'
-                rule.order = index + 1
-                rule.rulebase_location = f"{dg.name} #{index + 1}"
-                all_rules.append(rule)
-    
-    elif parser.is_firewall:
-        # Get all rules from firewall vsys
-        all_rules = parser.get_all_security_rules()
-        for index, rule in enumerate(all_rules):
-            # Add metadata to each rule
-            vsys_name = rule.parent_vsys or "vsys1"
-            rule.rule_type = 'VSYS'
-            rule.order = index + 1
-            rule.rulebase_location = f"{vsys_name} #{index + 1}"
-    
-    # Apply legacy filters for backwards compatibility
-    if name:
-        all_rules = [r for r in all_rules if name.lower() in r.name.lower()]
-    if device_group:
-        all_rules = [r for r in all_rules if device_group.lower() in r.device_group.lower()]
-    if action:
-        all_rules = [r for r in all_rules if r.action and action.lower() == r.action.lower()]
+    # Legacy filters for backwards compatibility are applied on precomputed columns
+    positioned = iter_security_policies(parser, start, name, device_group, action)
     
     # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
     if filter_params:
-        all_rules = apply_filters(all_rules, filter_params, SECURITY_RULE_FILTERS)
+        predicates = SECURITY_RULE_FILTERS.compile(filter_params)
+        positioned = (p for p in positioned if FilterProcessor.matches_compiled(p[2], predicates))
+    
+    if cursor is not None:
+        # The lazy filters run while the page is consumed, so keep that off the event loop too
+        return await asyncio.to_thread(paginate_rules_by_cursor, positioned, page_size)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(all_rules, pagination)
+    return await paginate_filtered_results((p[2] for p in positioned), page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/templates",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get all templates",
          description="Retrieve all device templates, with pagination")
 async def get_templates(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by template name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all templates with optional filtering and pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     templates = parser.get_templates()
     
-    if name:
-        templates = [t for t in templates if name.lower() in t.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        templates = apply_filters(templates, filter_params, TEMPLATE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        templates = iter_named_filters(templates, name, filter_params, TEMPLATE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(templates, pagination)
+    return await paginate_filtered_results(templates, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/templates/{template_name}",
-         response_model=Template,
+         responses={200: {"model": Template}},
          tags=["Device Management"],
          summary="Get specific template",
          description="Retrieve a specific template by its exact name")
@@ -1787,44 +1979,38 @@ async def get_template(
     template_name: str = Path(..., description="Template name")
 ):
     """Get a specific template by name"""
-    parser = get_parser(config_name)
-    templates = parser.get_templates()
-    for template in templates:
-        if template.name == template_name:
-            return template
+    parser = await get_parser(config_name)
+    template = parser.get_templates_by_name().get(template_name)
+    if template is not None:
+        return object_response(parser, "template", template)
     raise HTTPException(status_code=404, detail=f"Template '{template_name}' not found")
 
 @app.get("/api/v1/configs/{config_name}/template-stacks",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Device Management"],
          summary="Get all template stacks",
          description="Retrieve all template stacks with their member templates, with pagination")
 async def get_template_stacks(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by stack name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all template stacks with optional filtering and pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     stacks = parser.get_template_stacks()
     
-    if name:
-        stacks = [s for s in stacks if name.lower() in s.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        stacks = apply_filters(stacks, filter_params, TEMPLATE_STACK_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        stacks = iter_named_filters(stacks, name, filter_params, TEMPLATE_STACK_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(stacks, pagination)
+    return await paginate_filtered_results(stacks, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/template-stacks/{stack_name}",
-         response_model=TemplateStack,
+         responses={200: {"model": TemplateStack}},
          tags=["Device Management"],
          summary="Get specific template stack",
          description="Retrieve a specific template stack by its exact name")
@@ -1833,16 +2019,15 @@ async def get_template_stack(
     stack_name: str = Path(..., description="Template stack name")
 ):
     """Get a specific template stack by name"""
-    parser = get_parser(config_name)
-    stacks = parser.get_template_stacks()
-    for stack in stacks:
-        if stack.name == stack_name:
-            return stack
+    parser = await get_parser(config_name)
+    stack = parser.get_template_stacks_by_name().get(stack_name)
+    if stack is not None:
+        return object_response(parser, "template-stack", stack)
     raise HTTPException(status_code=404, detail=f"Template stack '{stack_name}' not found")
 
 # Virtual System (Firewall) Endpoints
 @app.get("/api/v1/configs/{config_name}/vsys",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Virtual Systems"],
          summary="Get all virtual systems",
          description="Retrieve all virtual systems (vsys) for firewall configurations")
@@ -1853,7 +2038,7 @@ async def get_vsys_list(
     disable_paging: bool = Query(False, description="Return all results without pagination")
 ):
     """Get all virtual systems for firewall configurations"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a Panorama config
     if parser.is_panorama:
@@ -1865,11 +2050,10 @@ async def get_vsys_list(
     vsys_list = parser.get_vsys_list()
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(vsys_list, pagination)
+    return await paginate_filtered_results(vsys_list, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/vsys/{vsys_name}/addresses",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Virtual Systems"],
          summary="Get addresses for specific vsys",
          description="Retrieve all address objects for a specific vsys in firewall configurations")
@@ -1881,7 +2065,7 @@ async def get_vsys_addresses(
     disable_paging: bool = Query(False, description="Return all results without pagination")
 ):
     """Get addresses for a specific vsys in firewall configurations"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a Panorama config
     if parser.is_panorama:
@@ -1894,16 +2078,14 @@ async def get_vsys_addresses(
     
     if not addresses:
         # Check if vsys exists
-        vsys_list = parser.get_vsys_list()
-        if not any(v['name'] == vsys_name for v in vsys_list):
+        if vsys_name not in parser.get_vsys_names():
             raise HTTPException(status_code=404, detail=f"Virtual system '{vsys_name}' not found")
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(addresses, pagination)
+    return await paginate_filtered_results(addresses, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/vsys/{vsys_name}/services",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Virtual Systems"],
          summary="Get services for specific vsys",
          description="Retrieve all service objects for a specific vsys in firewall configurations")
@@ -1915,7 +2097,7 @@ async def get_vsys_services(
     disable_paging: bool = Query(False, description="Return all results without pagination")
 ):
     """Get services for a specific vsys in firewall configurations"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a Panorama config
     if parser.is_panorama:
@@ -1928,16 +2110,14 @@ async def get_vsys_services(
     
     if not services:
         # Check if vsys exists
-        vsys_list = parser.get_vsys_list()
-        if not any(v['name'] == vsys_name for v in vsys_list):
+        if vsys_name not in parser.get_vsys_names():
             raise HTTPException(status_code=404, detail=f"Virtual system '{vsys_name}' not found")
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(services, pagination)
+    return await paginate_filtered_results(services, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/vsys/{vsys_name}/rules",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Virtual Systems"],
          summary="Get security rules for specific vsys",
          description="Retrieve all security rules for a specific vsys in firewall configurations")
@@ -1949,7 +2129,7 @@ async def get_vsys_rules(
     disable_paging: bool = Query(False, description="Return all results without pagination")
 ):
     """Get security rules for a specific vsys in firewall configurations"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     
     # Check if this is a Panorama config
     if parser.is_panorama:
@@ -1962,72 +2142,60 @@ async def get_vsys_rules(
     
     if not rules:
         # Check if vsys exists
-        vsys_list = parser.get_vsys_list()
-        if not any(v['name'] == vsys_name for v in vsys_list):
+        if vsys_name not in parser.get_vsys_names():
             raise HTTPException(status_code=404, detail=f"Virtual system '{vsys_name}' not found")
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(rules, pagination)
+    return await paginate_filtered_results(rules, page, page_size, disable_paging)
 
 # Logging Endpoints
 @app.get("/api/v1/configs/{config_name}/log-profiles",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Logging"],
          summary="Get all log forwarding profiles",
          description="Retrieve all log forwarding profiles, with pagination")
 async def get_log_profiles(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by profile name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all log forwarding profiles with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     profiles = parser.get_log_profiles()
     
-    if name:
-        profiles = [p for p in profiles if name.lower() in p.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        profiles = apply_filters(profiles, filter_params, LOG_PROFILE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        profiles = iter_named_filters(profiles, name, filter_params, LOG_PROFILE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(profiles, pagination)
+    return await paginate_filtered_results(profiles, page, page_size, disable_paging)
 
 @app.get("/api/v1/configs/{config_name}/schedules",
-         response_model=PaginatedResponse,
+         responses={200: {"model": PaginatedResponse}},
          tags=["Logging"],
          summary="Get all schedules",
          description="Retrieve all time-based schedules, with pagination")
 async def get_schedules(
-    request: Request,
     config_name: str = Path(..., description="Configuration name (without .xml extension)"),
     name: Optional[str] = Query(None, description="Filter by schedule name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(500, ge=1, le=10000, description="Number of items per page"),
-    disable_paging: bool = Query(False, description="Return all results without pagination")
+    disable_paging: bool = Query(False, description="Return all results without pagination"),
+    filter_params: Dict[str, Any] = Depends(get_filters)
 ):
     """Get all schedules with pagination"""
-    parser = get_parser(config_name)
+    parser = await get_parser(config_name)
     schedules = parser.get_schedules()
     
-    if name:
-        schedules = [s for s in schedules if name.lower() in s.name.lower()]
-    
-    # Apply advanced filters
-    filter_params = parse_filter_params(dict(request.query_params))
-    if filter_params:
-        schedules = apply_filters(schedules, filter_params, SCHEDULE_FILTERS)
+    # Apply the legacy name filter and advanced filters in one lazy pass
+    if name or filter_params:
+        schedules = iter_named_filters(schedules, name, filter_params, SCHEDULE_FILTERS)
     
     # Apply pagination
-    pagination = PaginationParams(page=page, page_size=page_size, disable_paging=disable_paging)
-    return paginate_results(schedules, pagination)
+    return await paginate_filtered_results(schedules, page, page_size, disable_paging)
 
 # Object search endpoints
 @app.get("/api/v1/configs/{config_name}/search/by-xpath",
@@ -2039,35 +2207,15 @@ async def search_by_xpath(
     xpath: str = Query(..., description="XPath to search for")
 ):
     """Search for objects by XPath"""
-    parser = get_parser(config_name)
-    
-    # Search across all object types
-    results = []
-    
-    # Search addresses
-    for addr in parser.get_all_addresses():
-        if addr.xpath == xpath:
-            results.append({"type": "address", "object": addr})
-    
-    # Search address groups
-    for group in parser.get_shared_address_groups():
-        if group.xpath == xpath:
-            results.append({"type": "address-group", "object": group})
-    
-    # Search services
-    for service in parser.get_shared_services():
-        if service.xpath == xpath:
-            results.append({"type": "service", "object": service})
+    parser = await get_parser(config_name)
     
-    # Search device groups
-    for dg in parser.get_device_groups():
-        if dg.xpath == xpath:
-            results.append({"type": "device-group", "object": dg})
+    xpath_index = await asyncio.to_thread(parser.get_xpath_index)
+    results = [{"type": object_type, "object": obj} for object_type, obj in xpath_index.get(xpath, ())]
     
     if not results:
         raise HTTPException(status_code=404, detail=f"No object found at XPath: {xpath}")
     
-    return results
+    return ModelJSONResponse(results)
 
 # Cache status endpoint
 @app.get("/api/v1/configs/{config_name}/cache-status",
@@ -2079,7 +2227,7 @@ async def get_cache_status(
 ):
     """Get cache status for a configuration"""
     # Ensure parser exists (will trigger caching if not already started)
-    _ = get_parser(config_name)
+    _ = await get_parser(config_name)
     
     return background_cache.get_cache_status(config_name)
 
@@ -2096,7 +2244,9 @@ async def health_check():
         "configs_available": len(available_configs),
         "configs_ready": len(ready_configs),
         "configs_loading": len(loading_configs),
-        "available_configs": available_configs
+        "available_configs": available_configs_sorted,
+        "response_cache": response_cache.get_stats(),
+        "disk_response_cache": disk_response_cache.get_stats() if disk_response_cache else None
     }
 
 # Mount static files for the React app (after all API routes are defined)
@@ -2108,8 +2258,9 @@ if os.path.exists("static/dist"):
     async def serve_react_app(path: str):
         """Serve React app for all non-API routes"""
         # Return the index.html for client-side routing
-        if os.path.exists("static/dist/index.html"):
-            return FileResponse("static/dist/index.html")
+        index_html = get_index_html()
+        if index_html is not None:
+            return HTMLResponse(index_html)
         raise HTTPException(status_code=404)
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from enum import Enum
 
 
@@ -10,9 +10,51 @@ class ConfigLocation(BaseModel):
     parent_template: Optional[str] = Field(None, alias="parent-template", description="Parent template if applicable")
     parent_vsys: Optional[str] = Field(None, alias="parent-vsys", description="Parent virtual system if applicable")
     
+    # Lower-cased name and tag set, computed once so legacy filters don't
+    # call lower() or scan the tag list per object on every request
+    _name_lower: str = PrivateAttr(default="")
+    _tag_set: frozenset = PrivateAttr(default=frozenset())
+    # Lower-cased field values for case-insensitive filters, filled on first use
+    _lowered: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
     class Config:
         populate_by_name = True
         by_alias = True  # Use aliases (hyphens) in JSON serialization
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._name_lower = (getattr(self, "name", None) or "").lower()
+        self._tag_set = frozenset(getattr(self, "tag", None) or ())
+    
+    @property
+    def name_lower(self) -> str:
+        """Lower-cased object name for case-insensitive matching"""
+        return self._name_lower
+    
+    @property
+    def tag_set(self) -> frozenset:
+        """Object tags as a set for O(1) membership checks"""
+        return self._tag_set
+    
+    def lowered(self, field: str) -> Any:
+        """Lower-cased copy of a field, computed once per object
+        
+        Strings (and enum values) become lower-case strings, lists become a
+        frozenset of lower-case strings, and None stays None.
+        """
+        if self._lowered is None:
+            self._lowered = {}
+        elif field in self._lowered:
+            return self._lowered[field]
+        
+        value = getattr(self, field, None)
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, list):
+            value = frozenset(str(v).lower() for v in value)
+        elif value is not None:
+            value = str(value).lower()
+        self._lowered[field] = value
+        return value
 
 
 class ProtocolType(str, Enum):
@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from lxml import etree
 from models import (
     AddressObject, AddressGroup, ServiceObject, ServiceGroup,
@@ -8,15 +8,51 @@ from models import (
     DataFilteringProfile, SecurityProfileGroup, SecurityRule, NATRule,
     DeviceGroup, DeviceGroupSummary, Template, TemplateStack, LogSetting, Schedule,
     ZoneProtectionProfile, VulnerabilityRule, AntivirusRule,
-    SpywareThreat, URLCategory, FileBlockingRule
+    SpywareThreat, URLCategory, FileBlockingRule, ProtocolType
 )
 
 
+# Parser settings for large Panorama/firewall exports: lift libxml2's size
+# limits for huge documents, drop ignorable whitespace between elements to
+# cut tree memory, skip building an ID table, and never resolve external
+# entities or touch the network
+_XML_PARSER_OPTIONS = {
+    "huge_tree": True,
+    "remove_blank_text": True,
+    "collect_ids": False,
+    "resolve_entities": False,
+    "no_network": True,
+}
+
+# XPath expressions are compiled once at import time and evaluated against the
+# tree each parser keeps in memory, so lookups never re-parse path strings
+_XPATH = {
+    "devices_entry": etree.XPath("(devices/entry)[1]"),
+    "template": etree.XPath("(.//template)[1]"),
+    "template_entries": etree.XPath(".//template/entry"),
+    "template_stack": etree.XPath("(.//template-stack)[1]"),
+    "vsys": etree.XPath("(.//devices/entry/vsys)[1]"),
+    "vsys_entry": etree.XPath("(.//devices/entry/vsys/entry[@name = $name])[1]"),
+    "nested_vsys_addresses": etree.XPath(".//vsys/entry/address"),
+    "firewall_vsys_addresses": etree.XPath(".//devices/entry/vsys/entry/address"),
+    "shared_address": etree.XPath("(.//shared/address)[1]"),
+    "shared_address_group": etree.XPath("(.//shared/address-group)[1]"),
+    "shared_service": etree.XPath("(.//shared/service)[1]"),
+    "shared_service_group": etree.XPath("(.//shared/service-group)[1]"),
+    "shared_vulnerability_profiles": etree.XPath("(.//shared/profiles/vulnerability)[1]"),
+    "shared_url_filtering_profiles": etree.XPath("(.//shared/profiles/url-filtering)[1]"),
+    "shared_log_profiles": etree.XPath("(.//shared/log-settings/profiles)[1]"),
+    "shared_schedule": etree.XPath("(.//shared/schedule)[1]"),
+}
+
+
 class PanoramaXMLParser:
     def __init__(self, xml_file_path: str):
         self.xml_file_path = xml_file_path
         self.tree = None
         self.root = None
+        # Modification time of the file this parser was built from
+        self.mtime_ns = None
         self.is_panorama = False
         self.is_firewall = False
         # Cache for parsed objects to improve performance
@@ -26,10 +62,42 @@ class PanoramaXMLParser:
             'device_group_addresses': {},
             'all_services': None,
             'shared_services': None,
+            'shared_services_by_protocol': None,
+            'shared_address_groups': None,
+            'shared_service_groups': None,
             'device_group_services': {},
+            'device_group_address_groups': {},
+            'device_group_service_groups': {},
             'address_groups': None,
             'service_groups': None,
-            'device_group_summaries': None
+            'device_group_summaries': None,
+            'device_groups': None,
+            'device_group_names': None,
+            'device_group_elements': None,
+            'vsys_names': None,
+            'templates': None,
+            'template_stacks': None,
+            'vulnerability_profiles': None,
+            'url_filtering_profiles': None,
+            'log_profiles': None,
+            'schedules': None,
+            'vsys_list': None,
+            # Lookup indexes built from the lists above
+            'addresses_by_name': None,
+            'addresses_by_tag': None,
+            'shared_services_by_name': None,
+            'shared_address_groups_by_name': None,
+            'device_groups_by_name': None,
+            'templates_by_name': None,
+            'template_stacks_by_name': None,
+            'aggregated_security_rules': None,
+            'aggregated_rule_offsets': None,
+            'aggregated_rule_columns': None,
+            'aggregated_rules_by_action': None,
+            'xpath_index': None,
+            # model_dump() output and serialized payloads for the shared endpoints
+            'shared_dicts': {},
+            'serialized_payloads': {}
         }
         self._load_xml()
         self._detect_config_type()
@@ -39,23 +107,32 @@ class PanoramaXMLParser:
         if not os.path.exists(self.xml_file_path):
             raise FileNotFoundError(f"XML file not found: {self.xml_file_path}")
         
-        self.tree = etree.parse(self.xml_file_path)
+        # Stat before parsing so an edit made mid-parse is still seen as newer
+        self.mtime_ns = os.stat(self.xml_file_path).st_mtime_ns
+        # lxml parsers are not thread-safe, so each load gets its own instance
+        xml_parser = etree.XMLParser(**_XML_PARSER_OPTIONS)
+        self.tree = etree.parse(self.xml_file_path, xml_parser)
         self.root = self.tree.getroot()
     
     def _detect_config_type(self):
         """Detect if this is a Panorama or firewall configuration"""
         # Check for Panorama-specific elements
         # Device groups are under /config/devices/entry/device-group in Panorama configs
-        devices_entry = self.root.find("./devices/entry")
+        devices_entry = self._find_first("devices_entry")
         has_device_group = devices_entry is not None and devices_entry.find("device-group") is not None
-        has_template = self.root.find(".//template") is not None
+        has_template = self._find_first("template") is not None
         
         if has_device_group or has_template:
             self.is_panorama = True
         # Check for firewall-specific elements
-        elif self.root.find(".//devices/entry/vsys") is not None:
+        elif self._find_first("vsys") is not None:
             self.is_firewall = True
     
+    def _find_first(self, xpath_name: str, element=None, **variables):
+        """Return the first element matched by a precompiled XPath, or None"""
+        matches = _XPATH[xpath_name](self.root if element is None else element, **variables)
+        return matches[0] if matches else None
+    
     def _get_text(self, element, default: str = "") -> str:
         """Safely get text from an XML element"""
         return element.text if element is not None and element.text else default
@@ -137,6 +214,85 @@ class PanoramaXMLParser:
         obj_dict.update(context)
         return obj_dict
     
+    def _as_shared(self, objects: List[Any]) -> List[Any]:
+        """Clear the parent context of freshly parsed shared-location objects
+        
+        Shared lookups may match a nested <shared> element; the objects are
+        still reported as shared, so this is settled once at parse time.
+        """
+        for obj in objects:
+            obj.parent_device_group = None
+            obj.parent_template = None
+            obj.parent_vsys = None
+        return objects
+    
+    def _index_by_name(self, cache_key: str, get_objects) -> Dict[str, Any]:
+        """Build and memoize a name -> object index, keeping the first object per name"""
+        if self._cache[cache_key] is not None:
+            return self._cache[cache_key]
+        
+        index = {}
+        for obj in get_objects():
+            index.setdefault(obj.name, obj)
+        
+        self._cache[cache_key] = index
+        return index
+    
+    def _memoized(self, cache_key: str, build) -> Any:
+        """Return the cached result for a key, building it on first use"""
+        if self._cache[cache_key] is None:
+            self._cache[cache_key] = build()
+        return self._cache[cache_key]
+    
+    def _memoized_for_group(self, cache_key: str, device_group_name: str, build) -> Any:
+        """Return the cached per-device-group result, building it on first use"""
+        by_group = self._cache[cache_key]
+        if device_group_name not in by_group:
+            by_group[device_group_name] = build(device_group_name)
+        return by_group[device_group_name]
+    
+    def _get_device_group_elements(self) -> Dict[str, Any]:
+        """Index device group <entry> elements by name, built in one pass over the tree"""
+        def build():
+            elements = {}
+            devices_entry = self._find_first("devices_entry")
+            dg_parent = devices_entry.find("device-group") if devices_entry is not None else None
+            if dg_parent is not None:
+                for entry in dg_parent.iterchildren("entry"):
+                    name = entry.get("name")
+                    if name is not None:
+                        # Keep the first entry, as the named XPath lookup did
+                        elements.setdefault(name, entry)
+            return elements
+        return self._memoized('device_group_elements', build)
+    
+    def _dump_shared(self, cache_key: str, get_objects) -> List[Dict[str, Any]]:
+        """Build and memoize model_dump() output for shared-location objects"""
+        dumped = self._cache['shared_dicts']
+        if cache_key in dumped:
+            return dumped[cache_key]
+        
+        items = [obj.model_dump() for obj in get_objects()]
+        dumped[cache_key] = items
+        return items
+    
+    def get_shared_object_dicts(self, object_type: str) -> List[Dict[str, Any]]:
+        """Get the serialized form of shared addresses, address-groups, services or service-groups"""
+        getters = {
+            'addresses': self.get_shared_addresses,
+            'address-groups': self.get_shared_address_groups,
+            'services': self.get_shared_services,
+            'service-groups': self.get_shared_service_groups
+        }
+        return self._dump_shared(object_type, getters[object_type])
+    
+    def get_serialized_payload(self, key: str, build) -> bytes:
+        """Build and memoize a serialized payload derived from this configuration"""
+        payloads = self._cache['serialized_payloads']
+        if key not in payloads:
+            payloads[key] = build()
+        return payloads[key]
+    
     def _parse_addresses_from_element(self, base_element) -> List[AddressObject]:
         """Parse address objects from any element containing address entries"""
         addresses = []
@@ -179,11 +335,11 @@ class PanoramaXMLParser:
         all_addresses = []
         
         # Get shared addresses
-        shared_addresses = self.root.find(".//shared/address")
+        shared_addresses = self._find_first("shared_address")
         all_addresses.extend(self._parse_addresses_from_element(shared_addresses))
         
         # Get addresses from device groups
-        devices_entry = self.root.find("./devices/entry")
+        devices_entry = self._find_first("devices_entry")
         if devices_entry is not None:
             dg_element = devices_entry.find("device-group")
             if dg_element is not None:
@@ -192,13 +348,13 @@ class PanoramaXMLParser:
                     all_addresses.extend(self._parse_addresses_from_element(dg_addresses))
         
         # Get addresses from templates  
-        for tmpl in self.root.findall(".//template/entry"):
+        for tmpl in _XPATH["template_entries"](self.root):
             # Templates may have addresses in config/devices/entry/vsys/entry/address
-            for vsys_addresses in tmpl.findall(".//vsys/entry/address"):
+            for vsys_addresses in _XPATH["nested_vsys_addresses"](tmpl):
                 all_addresses.extend(self._parse_addresses_from_element(vsys_addresses))
         
         # Get addresses from firewall vsys
-        for vsys_addresses in self.root.findall(".//devices/entry/vsys/entry/address"):
+        for vsys_addresses in _XPATH["firewall_vsys_addresses"](self.root):
             all_addresses.extend(self._parse_addresses_from_element(vsys_addresses))
         
         # Cache the result
@@ -211,18 +367,60 @@ class PanoramaXMLParser:
         if self._cache['shared_addresses'] is not None:
             return self._cache['shared_addresses']
         
-        shared_addresses = self.root.find(".//shared/address")
-        result = self._parse_addresses_from_element(shared_addresses)
+        shared_addresses = self._find_first("shared_address")
+        result = self._as_shared(self._parse_addresses_from_element(shared_addresses))
         
         # Cache the result
         self._cache['shared_addresses'] = result
         return result
     
+    def get_addresses_by_name(self) -> Dict[str, AddressObject]:
+        """Index all address objects by exact name (first match across locations)"""
+        return self._index_by_name('addresses_by_name', self.get_all_addresses)
+    
+    def get_addresses_by_tag(self) -> Dict[str, List[AddressObject]]:
+        """Index all address objects by tag, preserving configuration order"""
+        if self._cache['addresses_by_tag'] is not None:
+            return self._cache['addresses_by_tag']
+        
+        by_tag: Dict[str, List[AddressObject]] = {}
+        for address in self.get_all_addresses():
+            for tag in address.tag_set:
+                by_tag.setdefault(tag, []).append(address)
+        
+        self._cache['addresses_by_tag'] = by_tag
+        return by_tag
+    
+    def get_xpath_index(self) -> Dict[str, List[Tuple[str, Any]]]:
+        """Index searchable objects by XPath as (type, object) pairs"""
+        if self._cache['xpath_index'] is not None:
+            return self._cache['xpath_index']
+        
+        index: Dict[str, List[Tuple[str, Any]]] = {}
+        sources = (
+            ("address", self.get_all_addresses),
+            ("address-group", self.get_shared_address_groups),
+            ("service", self.get_shared_services),
+            ("device-group", self.get_device_groups),
+        )
+        for object_type, get_objects in sources:
+            for obj in get_objects():
+                if obj.xpath:
+                    index.setdefault(obj.xpath, []).append((object_type, obj))
+        
+        self._cache['xpath_index'] = index
+        return index
+    
     def get_shared_address_groups(self) -> List[AddressGroup]:
         """Parse shared address groups"""
+        # Return cached result if available
+        if self._cache['shared_address_groups'] is not None:
+            return self._cache['shared_address_groups']
+        
         groups = []
-        shared_groups = self.root.find(".//shared/address-group")
+        shared_groups = self._find_first("shared_address_group")
         if shared_groups is None:
+            self._cache['shared_address_groups'] = groups
             return groups
         
         for entry in shared_groups.findall("entry"):
@@ -247,8 +445,14 @@ class PanoramaXMLParser:
             group = AddressGroup(**group_dict)
             groups.append(group)
         
+        # Cache the result
+        self._cache['shared_address_groups'] = self._as_shared(groups)
         return groups
     
+    def get_shared_address_groups_by_name(self) -> Dict[str, AddressGroup]:
+        """Index shared address groups by exact name"""
+        return self._index_by_name('shared_address_groups_by_name', self.get_shared_address_groups)
+    
     def _parse_dynamic_group(self, dynamic_elem) -> Dict[str, Any]:
         """Parse dynamic address group configuration"""
         if dynamic_elem is None:
@@ -268,7 +472,7 @@ class PanoramaXMLParser:
             return self._cache['shared_services']
         
         services = []
-        shared_services = self.root.find(".//shared/service")
+        shared_services = self._find_first("shared_service")
         if shared_services is None:
             self._cache['shared_services'] = services
             return services
@@ -311,14 +515,37 @@ class PanoramaXMLParser:
             services.append(service)
         
         # Cache the result
-        self._cache['shared_services'] = services
+        self._cache['shared_services'] = self._as_shared(services)
         return services
     
+    def get_shared_services_by_protocol(self) -> Dict[str, List[ServiceObject]]:
+        """Index shared services by their protocol type (tcp/udp)"""
+        # Return cached result if available
+        if self._cache['shared_services_by_protocol'] is not None:
+            return self._cache['shared_services_by_protocol']
+        
+        by_protocol = {protocol_type.value: [] for protocol_type in ProtocolType}
+        for service in self.get_shared_services():
+            if service.type is not None:
+                by_protocol[service.type.value].append(service)
+        
+        self._cache['shared_services_by_protocol'] = by_protocol
+        return by_protocol
+    
+    def get_shared_services_by_name(self) -> Dict[str, ServiceObject]:
+        """Index shared service objects by exact name"""
+        return self._index_by_name('shared_services_by_name', self.get_shared_services)
+    
     def get_shared_service_groups(self) -> List[ServiceGroup]:
         """Parse shared service groups"""
+        # Return cached result if available
+        if self._cache['shared_service_groups'] is not None:
+            return self._cache['shared_service_groups']
+        
         groups = []
-        shared_groups = self.root.find(".//shared/service-group")
+        shared_groups = self._find_first("shared_service_group")
         if shared_groups is None:
+            self._cache['shared_service_groups'] = groups
             return groups
         
         for entry in shared_groups.findall("entry"):
@@ -334,12 +561,17 @@ class PanoramaXMLParser:
             )
             groups.append(group)
         
+        # Cache the result
+        self._cache['shared_service_groups'] = groups
         return groups
     
     def get_vulnerability_profiles(self) -> List[VulnerabilityProfile]:
         """Parse vulnerability protection profiles"""
+        return self._memoized('vulnerability_profiles', self._parse_vulnerability_profiles)
+    
+    def _parse_vulnerability_profiles(self) -> List[VulnerabilityProfile]:
         profiles = []
-        vp_profiles = self.root.find(".//shared/profiles/vulnerability")
+        vp_profiles = self._find_first("shared_vulnerability_profiles")
         if vp_profiles is None:
             return profiles
         
@@ -390,8 +622,11 @@ class PanoramaXMLParser:
     
     def get_url_filtering_profiles(self) -> List[URLFilteringProfile]:
         """Parse URL filtering profiles"""
+        return self._memoized('url_filtering_profiles', self._parse_url_filtering_profiles)
+    
+    def _parse_url_filtering_profiles(self) -> List[URLFilteringProfile]:
         profiles = []
-        url_profiles = self.root.find(".//shared/profiles/url-filtering")
+        url_profiles = self._find_first("shared_url_filtering_profiles")
         if url_profiles is None:
             return profiles
         
@@ -434,9 +669,12 @@ class PanoramaXMLParser:
     
     def get_device_group_summaries(self) -> List[DeviceGroupSummary]:
         """Parse device groups and return summaries with counts"""
+        return self._memoized('device_group_summaries', self._parse_device_group_summaries)
+    
+    def _parse_device_group_summaries(self) -> List[DeviceGroupSummary]:
         summaries = []
         # Find device-group under devices/entry, not under admin roles
-        devices_entry = self.root.find("./devices/entry")
+        devices_entry = self._find_first("devices_entry")
         if devices_entry is None:
             return summaries
         
@@ -518,11 +756,31 @@ class PanoramaXMLParser:
         
         return summaries
     
+    def get_device_groups_by_name(self) -> Dict[str, DeviceGroup]:
+        """Index device groups by exact name"""
+        return self._index_by_name('device_groups_by_name', self.get_device_groups)
+    
+    def get_templates_by_name(self) -> Dict[str, Template]:
+        """Index templates by exact name"""
+        return self._index_by_name('templates_by_name', self.get_templates)
+    
+    def get_template_stacks_by_name(self) -> Dict[str, TemplateStack]:
+        """Index template stacks by exact name"""
+        return self._index_by_name('template_stacks_by_name', self.get_template_stacks)
+    
+    def get_device_group_names(self) -> frozenset:
+        """Names of all device groups, for O(1) existence checks"""
+        return self._memoized('device_group_names',
+                              lambda: frozenset(s.name for s in self.get_device_group_summaries()))
+    
     def get_device_groups(self) -> List[DeviceGroup]:
         """Parse device groups"""
+        return self._memoized('device_groups', self._parse_device_groups)
+    
+    def _parse_device_groups(self) -> List[DeviceGroup]:
         groups = []
         # Find device-group under devices/entry, not under admin roles
-        devices_entry = self.root.find("./devices/entry")
+        devices_entry = self._find_first("devices_entry")
         if devices_entry is None:
             return groups
         
@@ -648,8 +906,11 @@ class PanoramaXMLParser:
     
     def get_templates(self) -> List[Template]:
         """Parse templates"""
+        return self._memoized('templates', self._parse_templates)
+    
+    def _parse_templates(self) -> List[Template]:
         templates = []
-        template_element = self.root.find(".//template")
+        template_element = self._find_first("template")
         if template_element is None:
             return templates
         
@@ -677,8 +938,11 @@ class PanoramaXMLParser:
     
     def get_template_stacks(self) -> List[TemplateStack]:
         """Parse template stacks"""
+        return self._memoized('template_stacks', self._parse_template_stacks)
+    
+    def _parse_template_stacks(self) -> List[TemplateStack]:
         stacks = []
-        stack_element = self.root.find(".//template-stack")
+        stack_element = self._find_first("template_stack")
         if stack_element is None:
             return stacks
         
@@ -709,8 +973,11 @@ class PanoramaXMLParser:
     
     def get_log_profiles(self) -> List[LogSetting]:
         """Parse log forwarding profiles"""
+        return self._memoized('log_profiles', self._parse_log_profiles)
+    
+    def _parse_log_profiles(self) -> List[LogSetting]:
         profiles = []
-        log_profiles = self.root.find(".//shared/log-settings/profiles")
+        log_profiles = self._find_first("shared_log_profiles")
         if log_profiles is None:
             return profiles
         
@@ -733,17 +1000,7 @@ class PanoramaXMLParser:
         if device_group_name in self._cache['device_group_addresses']:
             return self._cache['device_group_addresses'][device_group_name]
         
-        devices_entry = self.root.find("./devices/entry")
-        if devices_entry is None:
-            self._cache['device_group_addresses'][device_group_name] = []
-            return []
-        
-        dg_parent = devices_entry.find("device-group")
-        if dg_parent is None:
-            self._cache['device_group_addresses'][device_group_name] = []
-            return []
-        
-        dg_element = dg_parent.find(f"entry[@name='{device_group_name}']")
+        dg_element = self._get_device_group_elements().get(device_group_name)
         if dg_element is None:
             self._cache['device_group_addresses'][device_group_name] = []
             return []
@@ -757,15 +1014,11 @@ class PanoramaXMLParser:
     
     def get_device_group_address_groups(self, device_group_name: str) -> List[AddressGroup]:
         """Get address groups for a specific device group"""
-        devices_entry = self.root.find("./devices/entry")
-        if devices_entry is None:
-            return []
-        
-        dg_parent = devices_entry.find("device-group")
-        if dg_parent is None:
-            return []
-        
-        dg_element = dg_parent.find(f"entry[@name='{device_group_name}']")
+        return self._memoized_for_group('device_group_address_groups', device_group_name,
+                                        self._parse_device_group_address_groups)
+    
+    def _parse_device_group_address_groups(self, device_group_name: str) -> List[AddressGroup]:
+        dg_element = self._get_device_group_elements().get(device_group_name)
         if dg_element is None:
             return []
         
@@ -800,15 +1053,11 @@ class PanoramaXMLParser:
     
     def get_device_group_services(self, device_group_name: str) -> List[ServiceObject]:
         """Get services for a specific device group"""
-        devices_entry = self.root.find("./devices/entry")
-        if devices_entry is None:
-            return []
-        
-        dg_parent = devices_entry.find("device-group")
-        if dg_parent is None:
-            return []
-        
-        dg_element = dg_parent.find(f"entry[@name='{device_group_name}']")
+        return self._memoized_for_group('device_group_services', device_group_name,
+                                        self._parse_device_group_services)
+    
+    def _parse_device_group_services(self, device_group_name: str) -> List[ServiceObject]:
+        dg_element = self._get_device_group_elements().get(device_group_name)
         if dg_element is None:
             return []
         
@@ -858,15 +1107,11 @@ class PanoramaXMLParser:
     
     def get_device_group_service_groups(self, device_group_name: str) -> List[ServiceGroup]:
         """Get service groups for a specific device group"""
-        devices_entry = self.root.find("./devices/entry")
-        if devices_entry is None:
-            return []
-        
-        dg_parent = devices_entry.find("device-group")
-        if dg_parent is None:
-            return []
-        
-        dg_element = dg_parent.find(f"entry[@name='{device_group_name}']")
+        return self._memoized_for_group('device_group_service_groups', device_group_name,
+                                        self._parse_device_group_service_groups)
+    
+    def _parse_device_group_service_groups(self, device_group_name: str) -> List[ServiceGroup]:
+        dg_element = self._get_device_group_elements().get(device_group_name)
         if dg_element is None:
             return []
         
@@ -897,15 +1142,7 @@ class PanoramaXMLParser:
     
     def get_device_group_security_rules(self, device_group_name: str, rulebase: str = "all") -> List[SecurityRule]:
         """Get security rules for a specific device group"""
-        devices_entry = self.root.find("./devices/entry")
-        if devices_entry is None:
-            return []
-        
-        dg_parent = devices_entry.find("device-group")
-        if dg_parent is None:
-            return []
-        
-        dg_element = dg_parent.find(f"entry[@name='{device_group_name}']")
+        dg_element = self._get_device_group_elements().get(device_group_name)
         if dg_element is None:
             return []
         
@@ -929,8 +1166,11 @@ class PanoramaXMLParser:
     
     def get_schedules(self) -> List[Schedule]:
         """Parse schedules"""
+        return self._memoized('schedules', self._parse_schedules)
+    
+    def _parse_schedules(self) -> List[Schedule]:
         schedules = []
-        schedule_elem = self.root.find(".//shared/schedule")
+        schedule_elem = self._find_first("shared_schedule")
         if schedule_elem is None:
             return schedules
         
@@ -964,11 +1204,14 @@ class PanoramaXMLParser:
     # Firewall-specific methods
     def get_vsys_list(self) -> List[Dict[str, Any]]:
         """Get list of virtual systems (vsys) for firewall configs"""
+        return self._memoized('vsys_list', self._parse_vsys_list)
+    
+    def _parse_vsys_list(self) -> List[Dict[str, Any]]:
         vsys_list = []
         if not self.is_firewall:
             return vsys_list
         
-        vsys_elem = self.root.find(".//devices/entry/vsys")
+        vsys_elem = self._find_first("vsys")
         if vsys_elem is None:
             return vsys_list
         
@@ -1003,12 +1246,16 @@ class PanoramaXMLParser:
         
         return vsys_list
     
+    def get_vsys_names(self) -> frozenset:
+        """Names of all virtual systems, for O(1) existence checks"""
+        return self._memoized('vsys_names', lambda: frozenset(v['name'] for v in self.get_vsys_list()))
+    
     def get_vsys_addresses(self, vsys_name: str) -> List[AddressObject]:
         """Get addresses for a specific vsys in firewall configs"""
         if not self.is_firewall:
             return []
         
-        vsys_elem = self.root.find(f".//devices/entry/vsys/entry[@name='{vsys_name}']")
+        vsys_elem = self._find_first("vsys_entry", name=vsys_name)
         if vsys_elem is None:
             return []
         
@@ -1020,7 +1267,7 @@ class PanoramaXMLParser:
         if not self.is_firewall:
             return []
         
-        vsys_elem = self.root.find(f".//devices/entry/vsys/entry[@name='{vsys_name}']")
+        vsys_elem = self._find_first("vsys_entry", name=vsys_name)
         if vsys_elem is None:
             return []
         
@@ -1073,7 +1320,7 @@ class PanoramaXMLParser:
         if not self.is_firewall:
             return []
         
-        vsys_elem = self.root.find(f".//devices/entry/vsys/entry[@name='{vsys_name}']")
+        vsys_elem = self._find_first("vsys_entry", name=vsys_name)
         if vsys_elem is None:
             return []
         
@@ -1086,13 +1333,77 @@ class PanoramaXMLParser:
         
         return rules
     
+    def get_aggregated_security_rules(self) -> List[Tuple[str, int, SecurityRule]]:
+        """All security rules as (location, index, rule) with their runtime metadata set
+        
+        Panorama rules are located by device group and numbered within it;
+        firewall rules use an empty location and are numbered across all vsys.
+        """
+        return self._memoized('aggregated_security_rules', self._aggregate_security_rules)
+    
+    def _aggregate_security_rules(self) -> List[Tuple[str, int, SecurityRule]]:
+        positioned = []
+        if self.is_panorama:
+            for dg in self.get_device_group_summaries():
+                rules = self.get_device_group_security_rules(dg.name, "all")
+                for index, rule in enumerate(rules):
+                    rule.device_group = dg.name
+                    rule.rule_type = 'Device Group' if rule.parent_device_group else 'Shared'
+                    rule.order = index + 1
+                    rule.rulebase_location = f"{dg.name} #{index + 1}"
+                    positioned.append((dg.name, index, rule))
+        
+        elif self.is_firewall:
+            for index, rule in enumerate(self.get_all_security_rules()):
+                vsys_name = rule.parent_vsys or "vsys1"
+                rule.rule_type = 'VSYS'
+                rule.order = index + 1
+                rule.rulebase_location = f"{vsys_name} #{index + 1}"
+                positioned.append(("", index, rule))
+        
+        return positioned
+    
+    def get_aggregated_rule_offsets(self) -> Dict[str, int]:
+        """Position of each location's first rule in get_aggregated_security_rules()"""
+        def build():
+            offsets = {}
+            for position, (location, _, _) in enumerate(self.get_aggregated_security_rules()):
+                offsets.setdefault(location, position)
+            return offsets
+        return self._memoized('aggregated_rule_offsets', build)
+    
+    def get_aggregated_rule_columns(self) -> Dict[str, Tuple[str, ...]]:
+        """Lower-cased name, action and device group of each aggregated rule
+        
+        The columns are parallel to get_aggregated_security_rules(), so the
+        legacy filters scan plain string tuples instead of model attributes.
+        """
+        def build():
+            positioned = self.get_aggregated_security_rules()
+            device_groups = {location: location.lower() for location, _, _ in positioned}
+            return {
+                'name': tuple(rule.name_lower for _, _, rule in positioned),
+                'action': tuple(rule.action.value if rule.action else "" for _, _, rule in positioned),
+                'device_group': tuple(device_groups[location] for location, _, _ in positioned),
+            }
+        return self._memoized('aggregated_rule_columns', build)
+    
+    def get_aggregated_rule_positions_by_action(self) -> Dict[str, Tuple[int, ...]]:
+        """Ascending positions in get_aggregated_security_rules() of the rules with each action"""
+        def build():
+            by_action: Dict[str, List[int]] = {}
+            for position, action in enumerate(self.get_aggregated_rule_columns()['action']):
+                by_action.setdefault(action, []).append(position)
+            return {action: tuple(positions) for action, positions in by_action.items()}
+        return self._memoized('aggregated_rules_by_action', build)
+    
     def get_all_security_rules(self) -> List[SecurityRule]:
         """Get all security rules from either Panorama device groups or firewall vsys"""
         rules = []
         
         if self.is_panorama:
             # Get rules from all device groups
-            devices_entry = self.root.find("./devices/entry")
+            devices_entry = self._find_first("devices_entry")
             if devices_entry is not None:
                 dg_element = devices_entry.find("device-group")
                 if dg_element is not None:
@@ -1113,7 +1424,7 @@ class PanoramaXMLParser:
         
         elif self.is_firewall:
             # Get rules from all vsys
-            vsys_elem = self.root.find(".//devices/entry/vsys")
+            vsys_elem = self._find_first("vsys")
             if vsys_elem is not None:
                 for entry in vsys_elem.findall("entry"):
                     rulebase = entry.find("rulebase")
@@ -1,4 +1,5 @@
 import pytest
+import base64
 import os
 import sys
 import shutil
@@ -14,7 +15,7 @@ os.environ["CONFIG_FILES_PATH"] = os.path.join(os.path.dirname(__file__), "test_
 from fastapi.testclient import TestClient
 
 # Import app - tests will run with test configs
-from main import app
+from main import app, parsers
 
 # Create a test client that properly triggers startup events
 client = TestClient(app)
@@ -312,6 +313,14 @@ class TestDeviceGroupEndpoints:
         data = response.json()
         assert data["items"] == []
     
+    def test_device_group_filters_are_applied_lazily(self):
+        """Test that name and advanced filters on device group objects paginate correctly"""
+        url = "/api/v1/configs/test_panorama/device-groups/test-dg/addresses"
+        expected = [a for a in client.get(url).json()["items"] if "SERVER" in a["name"].upper()]
+        data = client.get(url, params={"name": "SERVER", "filter[name][contains]": "server"}).json()
+        assert data["items"] == expected
+        assert data["total_items"] == len(expected)
+    
     def test_get_device_group_address_groups(self):
         """Test getting address groups for a device group"""
         response = client.get("/api/v1/configs/test_panorama/device-groups/test-dg/address-groups")
@@ -371,6 +380,15 @@ class TestDeviceGroupEndpoints:
         assert len(rules) == 1
         assert rules[0]["name"] == "post-rule-1"
     
+    def test_security_policies_action_filter_ignores_case(self):
+        """Test the legacy action filter on the security policies endpoint"""
+        response = client.get("/api/v1/configs/test_panorama/security-policies")
+        actions = {r["action"] for r in response.json()["items"]}
+        for action in actions:
+            response = client.get(f"/api/v1/configs/test_panorama/security-policies?action={action.upper()}")
+            rules = response.json()["items"]
+            assert rules and all(r["action"] == action for r in rules)
+    
     def test_get_device_group_not_found(self):
         """Test accessing non-existent device group"""
         response = client.get("/api/v1/configs/test_panorama/device-groups/nonexistent/addresses")
@@ -391,6 +409,71 @@ class TestDeviceGroupEndpoints:
         assert services[0]["name"] == "tcp-9090"
 
 
+class TestSecurityPolicyCursor:
+    """Test keyset pagination of the aggregated security policies"""
+    
+    def test_walking_cursors_matches_offset_pages(self):
+        """Test that following next_cursor yields every rule once, in order"""
+        url = "/api/v1/configs/test_panorama/security-policies"
+        expected = client.get(url, params={"disable_paging": True}).json()["items"]
+        assert len(expected) > 1
+        
+        collected = []
+        params = {"cursor": "", "page_size": 1}
+        while True:
+            data = client.get(url, params=params).json()
+            collected.extend(data["items"])
+            if not data["has_next"]:
+                assert data["next_cursor"] is None
+                break
+            params["cursor"] = data["next_cursor"]
+        assert collected == expected
+    
+    def test_legacy_filters_combine_with_cursor(self):
+        """Test that cursor pages honour the name and device group filters"""
+        url = "/api/v1/configs/test_panorama/security-policies"
+        params = {"name": "RULE", "device_group": "TEST-DG"}
+        expected = client.get(url, params={**params, "disable_paging": True}).json()["items"]
+        assert expected and all(r["device_group"] == "test-dg" for r in expected)
+        data = client.get(url, params={**params, "cursor": "", "page_size": 10000}).json()
+        assert data["items"] == expected
+    
+    def test_invalid_cursor_is_rejected(self):
+        """Test that an undecodable cursor returns 400"""
+        response = client.get("/api/v1/configs/test_panorama/security-policies", params={"cursor": "%%%"})
+        assert response.status_code == 400
+    
+    def test_negative_cursor_index_is_rejected(self):
+        """Test that a cursor with a negative rule index returns 400"""
+        url = "/api/v1/configs/test_panorama/security-policies"
+        for raw in (b":-5", b"test-dg:-5"):
+            cursor = base64.urlsafe_b64encode(raw).decode()
+            assert client.get(url, params={"cursor": cursor}).status_code == 400
+    
+    def test_cursor_past_location_end_is_rejected(self):
+        """Test that a cursor beyond its location's rules returns 400"""
+        url = "/api/v1/configs/test_panorama/security-policies"
+        rules = client.get(url, params={"disable_paging": True}).json()["items"]
+        in_dg = sum(1 for r in rules if r["device_group"] == "test-dg")
+        assert in_dg
+        for raw in (f"test-dg:{in_dg}".encode(), f":{len(rules)}".encode()):
+            cursor = base64.urlsafe_b64encode(raw).decode()
+            assert client.get(url, params={"cursor": cursor}).status_code == 400
+    
+    def test_cursor_for_unknown_device_group_is_rejected(self):
+        """Test that a cursor naming a missing device group returns 400, not an empty page"""
+        cursor = base64.urlsafe_b64encode(b"no-such-dg:5").decode()
+        response = client.get("/api/v1/configs/test_panorama/security-policies", params={"cursor": cursor})
+        assert response.status_code == 400
+    
+    def test_panorama_cursor_without_device_group_is_rejected(self):
+        """Test that Panorama cursors must name a device group"""
+        url = "/api/v1/configs/test_panorama/security-policies"
+        for raw in (b":0", b":1"):
+            cursor = base64.urlsafe_b64encode(raw).decode()
+            assert client.get(url, params={"cursor": cursor}).status_code == 400
+
+
 class TestTemplateEndpoints:
     """Test template endpoints"""
     
@@ -405,6 +488,13 @@ class TestTemplateEndpoints:
         assert len(templates) == 1
         assert templates[0]["name"] == "test-template"
     
+    def test_get_templates_name_filter_ignores_case(self):
+        """Test the legacy name filter matches case-insensitively"""
+        response = client.get("/api/v1/configs/test_panorama/templates?name=TEST-TEMP")
+        assert [t["name"] for t in response.json()["items"]] == ["test-template"]
+        response = client.get("/api/v1/configs/test_panorama/templates?name=missing")
+        assert response.json()["items"] == []
+    
     def test_get_specific_template(self):
         """Test getting a specific template"""
         response = client.get("/api/v1/configs/test_panorama/templates/test-template")
@@ -413,6 +503,15 @@ class TestTemplateEndpoints:
         assert template["name"] == "test-template"
         assert template["description"] == "Test template"
         assert template["settings"]["default-vsys"] == "vsys1"
+    
+    def test_specific_object_body_is_memoized(self):
+        """Test that single objects keep by-alias keys and are serialized once"""
+        url = "/api/v1/configs/test_panorama/addresses/test-server"
+        first = client.get(url)
+        assert "parent-device-group" in first.json()
+        parser = parsers["test_panorama"]
+        body = parser.get_serialized_payload("address/test-server", lambda: None)
+        assert body == first.content
 
 
 class TestTemplateStackEndpoints:
@@ -0,0 +1,167 @@
+"""
+Tests for configuration loading at startup and on-demand parser access.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set the test config path before importing the app
+os.environ["CONFIG_FILES_PATH"] = os.path.join(os.path.dirname(__file__), "test_configs")
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+from parser import PanoramaXMLParser
+from zodb_cache import ZODBCache
+
+client = TestClient(app)
+# Trigger the lifespan startup by making an initial request
+with client:
+    _ = client.get("/api/v1/configs")
+
+
+class TestStartupLoading:
+    """Test that the lifespan handler pre-loads configurations"""
+
+    def test_configs_are_ready_after_startup(self):
+        assert "test_panorama" in main.ready_configs
+        assert "test_panorama" not in main.loading_configs
+        assert isinstance(main.parsers["test_panorama"], PanoramaXMLParser)
+
+
+class TestGetParser:
+    """Test parser access from request handlers"""
+
+    def test_returns_preloaded_parser(self):
+        parser = asyncio.run(main.get_parser("test_panorama"))
+        assert parser is main.parsers["test_panorama"]
+
+    def test_unknown_config_is_404(self):
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(main.get_parser("nonexistent"))
+        assert exc_info.value.status_code == 404
+
+    def test_missing_parser_is_rebuilt(self):
+        original = main.parsers.pop("test_panorama")
+        try:
+            rebuilt = asyncio.run(main.get_parser("test_panorama"))
+            assert rebuilt is not original
+            assert main.parsers["test_panorama"] is rebuilt
+            assert len(rebuilt.get_all_addresses()) == len(original.get_all_addresses())
+        finally:
+            main.parsers["test_panorama"] = original
+
+    def test_modified_file_rebuilds_parser(self, monkeypatch):
+        cleared = []
+        reloads = []
+        monkeypatch.setattr(main.background_cache, "clear_cache", cleared.append)
+        monkeypatch.setattr(main, "schedule_cache_reload", lambda name, parser: reloads.append((name, parser)))
+        original = main.parsers["test_panorama"]
+        stale = PanoramaXMLParser(original.xml_file_path)
+        stale.mtime_ns -= 1
+        main.parsers["test_panorama"] = stale
+        try:
+            rebuilt = asyncio.run(main.get_parser("test_panorama"))
+            assert rebuilt is not stale
+            assert not main.is_parser_stale(rebuilt)
+            assert cleared == ["test_panorama"]
+            assert reloads == [("test_panorama", rebuilt)]
+            assert asyncio.run(main.get_parser("test_panorama")) is rebuilt
+        finally:
+            main.parsers["test_panorama"] = original
+
+
+def edit_config(config_path):
+    """Rename test-server in a copied config and move its mtime forward"""
+    config_path.write_bytes(config_path.read_bytes().replace(b'"test-server"', b'"renamed-server"'))
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    main.config_stat_cache.invalidate(str(config_path))
+
+
+class TestModifiedConfig:
+    """Test that cached endpoints notice an edited config file"""
+
+    @pytest.fixture
+    def config_path(self, tmp_path, monkeypatch):
+        source = main.get_config_path("test_panorama")
+        config_path = tmp_path / "edited_panorama.xml"
+        config_path.write_bytes(open(source, "rb").read())
+        zodb_cache = ZODBCache(str(tmp_path / "cache"))
+        monkeypatch.setattr(main, "CONFIG_FILES_PATH", str(tmp_path))
+        monkeypatch.setattr(main, "get_zodb_cache", lambda: zodb_cache)
+        return config_path
+
+    def test_cached_addresses_reflect_file_edits(self, config_path):
+        try:
+            asyncio.run(main.preload_config("edited_panorama"))
+            assert main.background_cache.is_cached("edited_panorama", "addresses")
+            url = "/api/v1/configs/edited_panorama/addresses"
+            names = {a["name"] for a in client.get(url).json()["items"]}
+            assert "test-server" in names
+
+            edit_config(config_path)
+
+            names = {a["name"] for a in client.get(url).json()["items"]}
+            assert "renamed-server" in names and "test-server" not in names
+        finally:
+            main.ready_configs.discard("edited_panorama")
+            main.parsers.pop("edited_panorama", None)
+            main.background_cache.clear_cache("edited_panorama")
+
+    def test_edited_config_is_cached_again(self, config_path):
+        async def refresh():
+            await main.refresh_stale_config("edited_panorama")
+            await main.cache_reload_tasks["edited_panorama"]
+
+        try:
+            asyncio.run(main.preload_config("edited_panorama"))
+            edit_config(config_path)
+            asyncio.run(refresh())
+
+            assert main.background_cache.is_config_ready("edited_panorama")
+            assert main.background_cache.is_cached("edited_panorama", "addresses")
+            assert "edited_panorama" not in main.cache_reload_tasks
+            cached = main.background_cache.get_cached_data("edited_panorama", "addresses", page_size=1000)
+            names = {a.name for a in cached["items"]}
+            assert "renamed-server" in names and "test-server" not in names
+            assert main.get_zodb_cache().is_cache_valid("edited_panorama", str(config_path))
+        finally:
+            main.ready_configs.discard("edited_panorama")
+            main.parsers.pop("edited_panorama", None)
+            main.background_cache.clear_cache("edited_panorama")
+
+
+class TestConfigInfo:
+    """Test the configuration info endpoint"""
+
+    def test_info_uses_file_stat(self):
+        response = client.get("/api/v1/configs/test_panorama/info")
+        assert response.status_code == 200
+        data = response.json()
+        stat = os.stat(main.get_config_path("test_panorama"))
+        assert data["size"] == stat.st_size
+        assert data["modified"] == stat.st_mtime
+        assert data["ready"] is True
+
+    def test_info_reflects_runtime_state(self):
+        # The info payload includes load state, so it must not be replayed from the response cache
+        client.get("/api/v1/configs/test_panorama/info")
+        main.ready_configs.discard("test_panorama")
+        try:
+            response = client.get("/api/v1/configs/test_panorama/info")
+            assert response.json()["ready"] is False
+            assert "etag" not in response.headers
+        finally:
+            main.ready_configs.add("test_panorama")
+
+    def test_unknown_config_info_is_404(self):
+        assert client.get("/api/v1/configs/nonexistent/info").status_code == 404
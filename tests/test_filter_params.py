@@ -0,0 +1,97 @@
+"""
+Tests for parsing filter query parameters into filter dictionaries.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set the test config path before importing the app
+os.environ["CONFIG_FILES_PATH"] = os.path.join(os.path.dirname(__file__), "test_configs")
+
+from fastapi import HTTPException
+
+from starlette.requests import Request
+
+from main import get_filters, parse_filter_key, parse_filter_params, parse_query_filters
+
+
+class TestParseFilterParams:
+    """Test the supported filter notations"""
+
+    def test_bracket_notation(self):
+        assert parse_filter_params({"filter[name]": "web"}) == {"name": "web"}
+        assert parse_filter_params({"filter[name][equals]": "web"}) == {"name_eq": "web"}
+
+    def test_dot_notation(self):
+        assert parse_filter_params({"filter.name": "web"}) == {"name": "web"}
+        assert parse_filter_params({"filter.port.gte": "80"}) == {"port_gte": "80"}
+
+    def test_underscore_notation(self):
+        assert parse_filter_params({"filter_name": "web"}) == {"name": "web"}
+        assert parse_filter_params({"filter_name_starts_with": "web"}) == {"name_starts_with": "web"}
+
+    def test_longest_operator_alias_wins(self):
+        assert parse_filter_params({"filter_name_not_equals": "web"}) == {"name_ne": "web"}
+        assert parse_filter_params({"filter_parent_device_group_eq": "dg"}) == {"parent_device_group_eq": "dg"}
+        assert parse_filter_params({"filter.a.b.not_in": "x"}) == {"a.b_not_in": "x"}
+
+    def test_key_value_pairs_are_accepted(self):
+        pairs = [("filter.name", "first"), ("page", "1"), ("filter.name", "last")]
+        assert parse_filter_params(pairs) == {"name": "last"}
+
+    def test_repeated_membership_filters_are_collected(self):
+        pairs = [("filter.tag.in", "web"), ("filter[tag][in]", "db"), ("filter.tag.not_in", "old"),
+                 ("filter.tag.in", "app")]
+        assert parse_filter_params(pairs) == {"tag_in": ["web", "db", "app"], "tag_not_in": "old"}
+
+    def test_non_filter_params_are_ignored(self):
+        assert parse_filter_params({"page": "1", "name": "web", "page_size": "10"}) == {}
+
+    def test_empty_dot_filter_is_rejected(self):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_filter_params({"filter.": "web"})
+        assert exc_info.value.status_code == 400
+
+    def test_filter_keys_are_memoized(self):
+        parse_filter_key.cache_clear()
+        assert parse_filter_key("filter.name.eq") == "name_eq"
+        assert parse_filter_key("filter.name.eq") == "name_eq"
+        assert parse_filter_key("filterx") is None
+        assert parse_filter_key.cache_info().hits == 1
+
+
+class TestParseQueryFilters:
+    """Test parsing filters from raw query strings"""
+
+    def test_parses_raw_query_string(self):
+        filters = parse_query_filters(b"page=2&filter%5Bname%5D%5Bcontains%5D=web&filter.port.lt=1024")
+        assert filters == {"name_contains": "web", "port_lt": "1024"}
+
+    def test_blank_values_are_kept(self):
+        assert parse_query_filters(b"filter.description=") == {"description": ""}
+
+    def test_repeated_query_strings_are_memoized(self):
+        query_string = b"filter.name.eq=memoized-host"
+        assert parse_query_filters(query_string) is parse_query_filters(query_string)
+
+    def test_repeated_in_filters_from_query_string(self):
+        assert parse_query_filters(b"filter.tag.in=web&filter.tag.in=db") == {"tag_in": ["web", "db"]}
+
+    def test_get_filters_dependency_reads_raw_query_string(self):
+        request = Request({"type": "http", "query_string": b"filter.name.eq=dep-host&page=3"})
+        assert get_filters(request) == {"name_eq": "dep-host"}
+        assert get_filters(request) is parse_query_filters(b"filter.name.eq=dep-host&page=3")
+
+    def test_get_filters_skips_queries_without_filters(self):
+        parse_query_filters.cache_clear()
+        for query_string in (b"page=2&page_size=10", b"name=filter&tag=filter.x"):
+            request = Request({"type": "http", "query_string": query_string})
+            assert get_filters(request) == {}
+        assert parse_query_filters.cache_info().misses == 0
+        request = Request({"type": "http", "query_string": b"page=2&filter.name=web"})
+        assert get_filters(request) == {"name": "web"}
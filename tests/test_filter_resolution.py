@@ -0,0 +1,97 @@
+"""
+Tests for resolving filter keys before matching objects.
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filtering import (
+    ADDRESS_FILTERS, SECURITY_RULE_FILTERS, FilterOperator, FilterProcessor, apply_filters,
+    split_filter_key
+)
+from models import AddressObject
+
+
+class TestSplitFilterKey:
+    """Test splitting filter keys into field and operator"""
+
+    def test_longest_operator_suffix_wins(self):
+        assert split_filter_key("name_not_contains") == ("name", FilterOperator.NOT_CONTAINS)
+        assert split_filter_key("name_contains") == ("name", FilterOperator.CONTAINS)
+        assert split_filter_key("port_gte") == ("port", FilterOperator.GREATER_THAN_OR_EQUAL)
+
+    def test_default_operator_is_contains(self):
+        assert split_filter_key("description") == ("description", FilterOperator.CONTAINS)
+
+
+class TestResolve:
+    """Test FilterDefinition.resolve"""
+
+    def test_unknown_fields_and_none_values_are_dropped(self):
+        resolved = ADDRESS_FILTERS.resolve({"name_eq": "web", "bogus": "x", "description": None})
+        assert [(operator, value) for _, operator, value, _ in resolved] == [(FilterOperator.EQUALS, "web")]
+
+    def test_none_is_kept_for_equality_operators(self):
+        resolved = ADDRESS_FILTERS.resolve({"description_eq": None, "description_ne": None})
+        assert [operator for _, operator, _, _ in resolved] == [FilterOperator.EQUALS, FilterOperator.NOT_EQUALS]
+
+    def test_resolved_matching_agrees_with_matches_filters(self):
+        addresses = [
+            AddressObject(name="web-1", ip_netmask="10.0.0.1/32"),
+            AddressObject(name="db-1", fqdn="db.example.com"),
+        ]
+        filters = {"name_starts_with": "web", "bogus_eq": "x"}
+        expected = [a for a in addresses if FilterProcessor.matches_filters(a, filters, ADDRESS_FILTERS)]
+        assert apply_filters(addresses, filters, ADDRESS_FILTERS) == expected == addresses[:1]
+
+
+class TestLoweredFields:
+    """Test case-insensitive matching against pre-lowered model fields"""
+
+    def test_needle_is_lowered_only_for_supported_operators(self):
+        resolved = SECURITY_RULE_FILTERS.resolve({
+            "name_contains": "WEB", "name_eq": "WEB", "source_in": "Any", "source_contains": "Any"
+        })
+        assert [needle for _, _, _, needle in resolved] == ["web", None, "any", None]
+
+    def test_model_fields_are_lowered_once(self):
+        address = AddressObject(name="Web-1", ip_netmask="10.0.0.1/32", tag=["Prod", "DMZ"])
+        assert address.lowered("name") == "web-1"
+        assert address.lowered("tag") == frozenset({"prod", "dmz"})
+        assert address.lowered("description") is None
+        assert address.lowered("tag") is address.lowered("tag")
+
+    def test_fast_path_agrees_with_apply_operator(self):
+        addresses = [
+            AddressObject(name="Web-Server", ip_netmask="10.0.0.1/32", description="Front End", tag=["Prod"]),
+            AddressObject(name="db", fqdn="db.example.com", tag=["dev"]),
+        ]
+        for filters in (
+            {"name_starts_with": "WEB"}, {"name_not_contains": "serv"}, {"description_contains": "END"},
+            {"description_not_contains": "x"}, {"tag_in": "PROD"}, {"tag_not_in": "prod"},
+        ):
+            slow = [
+                a for a in addresses
+                if all(FilterProcessor.apply_operator(getattr(a, config.field_path), value, operator)
+                       for config, operator, value, _ in ADDRESS_FILTERS.resolve(filters))
+            ]
+            assert apply_filters(addresses, filters, ADDRESS_FILTERS) == slow, filters
+
+
+class TestCompile:
+    """Test compiling filter sets into predicates"""
+
+    def test_compiled_predicates_are_memoized_per_filter_set(self):
+        predicates = ADDRESS_FILTERS.compile({"name_contains": "web", "bogus": "x"})
+        assert len(predicates) == 1
+        assert ADDRESS_FILTERS.compile({"bogus": "x", "name_contains": "web"}) is predicates
+        assert ADDRESS_FILTERS.compile({"name_contains": "db"}) is not predicates
+
+    def test_predicates_evaluate_each_condition(self):
+        address = AddressObject(name="web-1", ip_netmask="10.0.0.1/32", description="Front")
+        matching = ADDRESS_FILTERS.compile({"name_starts_with": "WEB", "description_eq": "front"})
+        assert FilterProcessor.matches_compiled(address, matching)
+        assert not FilterProcessor.matches_compiled(address, ADDRESS_FILTERS.compile({"name_eq": "db"}))
@@ -22,7 +22,7 @@ from unittest.mock import Mock, patch
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models import AddressGroup, ServiceGroup, DeviceGroupSummary
+from models import AddressGroup, ServiceGroup, DeviceGroupSummary, ProtocolType
 from filtering import (
     FilterProcessor, FilterDefinition, FilterConfig, FilterOperator,
     GROUP_FILTERS, DEVICE_GROUP_FILTERS, apply_filters
@@ -1052,6 +1052,14 @@ class TestFilterProcessorMethods:
         assert FilterProcessor.apply_operator(list_value, "ITEM2", FilterOperator.IN, case_sensitive=False) == True
         assert FilterProcessor.apply_operator(list_value, "item4", FilterOperator.IN) == False
     
+    def test_apply_operator_in_list_value_with_several_filter_values(self):
+        """Test IN / NOT_IN with a list value and a list of filter values"""
+        list_value = ["item1", "item2", "item3"]
+        assert FilterProcessor.apply_operator(list_value, ["item4", "ITEM2"], FilterOperator.IN) == True
+        assert FilterProcessor.apply_operator(list_value, ["item4", "item5"], FilterOperator.IN) == False
+        assert FilterProcessor.apply_operator(list_value, ["item4", "item5"], FilterOperator.NOT_IN) == True
+        assert FilterProcessor.apply_operator(list_value, ["item4", "item1"], FilterOperator.NOT_IN) == False
+    
     def test_apply_operator_in_string_value(self):
         """Test IN operator with string value (comma-separated)"""
         assert FilterProcessor.apply_operator("test", "test,other,values", FilterOperator.IN) == True
@@ -1073,6 +1081,31 @@ class TestFilterProcessorMethods:
         assert FilterProcessor.apply_operator("5", 10, FilterOperator.LESS_THAN) == True
         assert FilterProcessor.apply_operator(10, "10", FilterOperator.EQUALS) == True
     
+    def test_numeric_predicates_match_apply_operator(self):
+        """Test that compiled whole-number comparisons agree with apply_operator"""
+        config = FilterConfig("value")
+        values = [0, 80, 1024, "80", "1024", "8080", "1024-2048", "80,443", "", None, True, 1.5]
+        for operator in (FilterOperator.GREATER_THAN, FilterOperator.LESS_THAN,
+                         FilterOperator.GREATER_THAN_OR_EQUAL, FilterOperator.LESS_THAN_OR_EQUAL):
+            for filter_value in ("1024", 80):
+                predicate = FilterProcessor.compile_predicate(config, operator, filter_value, None)
+                for value in values:
+                    expected = FilterProcessor.apply_operator(value, filter_value, operator)
+                    assert predicate(Mock(value=value)) == expected, (operator, filter_value, value)
+    
+    def test_substring_predicates_match_apply_operator(self):
+        """Test that compiled substring tests agree with apply_operator"""
+        values = ["Web-Server", "web", "", None, 8080, ["web", "db"], ProtocolType.TCP]
+        for case_sensitive in (False, True):
+            config = FilterConfig("value", case_sensitive=case_sensitive)
+            for operator in (FilterOperator.CONTAINS, FilterOperator.NOT_CONTAINS,
+                             FilterOperator.STARTS_WITH, FilterOperator.ENDS_WITH):
+                for filter_value in ("web", "TCP", "80", ""):
+                    predicate = FilterProcessor.compile_predicate(config, operator, filter_value, None)
+                    for value in values:
+                        expected = FilterProcessor.apply_operator(value, filter_value, operator, case_sensitive)
+                        assert predicate(Mock(value=value)) == expected, (operator, filter_value, value)
+    
     def test_apply_operator_none_values(self):
         """Test handling of None values"""
         # Both None - should be equal
@@ -0,0 +1,328 @@
+"""
+Tests for HTTP conditional GET support (ETag / Last-Modified).
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set the test config path before importing the app
+os.environ["CONFIG_FILES_PATH"] = os.path.join(os.path.dirname(__file__), "test_configs")
+
+from fastapi.testclient import TestClient
+
+from main import app, response_cache
+from http_cache import (
+    compute_etag, etag_matches, get_config_name, not_modified_since,
+    DiskResponseCache, FileStatCache, HTTPCacheMiddleware, ResponseCache
+)
+
+client = TestClient(app)
+# Trigger the startup event by making an initial request
+with client:
+    _ = client.get("/api/v1/configs")
+
+
+class TestETagHelpers:
+    """Test the ETag helper functions"""
+
+    def test_get_config_name(self):
+        assert get_config_name("/api/v1/configs/pan/addresses") == "pan"
+        assert get_config_name("/api/v1/configs/pan/device-groups/dg/rules") == "pan"
+        assert get_config_name("/api/v1/configs") is None
+        assert get_config_name("/api/v1/health") is None
+
+    def test_runtime_state_endpoints_are_excluded(self):
+        assert get_config_name("/api/v1/configs/pan/cache-stats") is None
+        assert get_config_name("/api/v1/configs/pan/info") is None
+
+    def test_etag_depends_on_request_and_file_state(self):
+        etag = compute_etag("pan", "/api/v1/configs/pan/addresses", b"page=1", 100, 10)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == compute_etag("pan", "/api/v1/configs/pan/addresses", b"page=1", 100, 10)
+        assert etag != compute_etag("pan", "/api/v1/configs/pan/addresses", b"page=2", 100, 10)
+        assert etag != compute_etag("pan", "/api/v1/configs/pan/addresses", b"page=1", 101, 10)
+        assert etag != compute_etag("pan", "/api/v1/configs/pan/addresses", b"page=1", 100, 11)
+
+    def test_etag_matches(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('"xyz", "abc"', '"abc"')
+        assert not etag_matches('"xyz"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+    
+    def test_etag_matching_is_weak(self):
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"xyz", W/"abc"', '"abc"')
+        assert etag_matches('*', '"abc"')
+        assert not etag_matches('W/"xyz"', '"abc"')
+
+    def test_not_modified_since(self):
+        assert not_modified_since("Sun, 06 Nov 1994 08:49:37 GMT", 784111777.9)
+        assert not_modified_since("Sun, 06 Nov 1994 08:49:38 GMT", 784111777.0)
+        assert not not_modified_since("Sun, 06 Nov 1994 08:49:36 GMT", 784111777.0)
+        assert not not_modified_since("not a date", 784111777.0)
+        assert not not_modified_since(None, 784111777.0)
+
+
+class TestConditionalGet:
+    """Test ETag handling on the API endpoints"""
+
+    def test_response_has_etag(self):
+        response = client.get("/api/v1/configs/test_panorama/addresses")
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    def test_if_none_match_returns_304(self):
+        response = client.get("/api/v1/configs/test_panorama/addresses")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/v1/configs/test_panorama/addresses",
+                              headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_response_has_last_modified(self):
+        response = client.get("/api/v1/configs/test_panorama/addresses")
+        assert response.headers["last-modified"].endswith(" GMT")
+
+    def test_if_modified_since_returns_304(self):
+        response = client.get("/api/v1/configs/test_panorama/addresses")
+        last_modified = response.headers["last-modified"]
+
+        response = client.get("/api/v1/configs/test_panorama/addresses",
+                              headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        assert response.headers["last-modified"] == last_modified
+
+        response = client.get("/api/v1/configs/test_panorama/addresses",
+                              headers={"If-Modified-Since": "Sun, 06 Nov 1994 08:49:37 GMT"})
+        assert response.status_code == 200
+
+    def test_if_none_match_takes_precedence(self):
+        response = client.get("/api/v1/configs/test_panorama/addresses")
+        response = client.get("/api/v1/configs/test_panorama/addresses",
+                              headers={"If-None-Match": '"stale"',
+                                       "If-Modified-Since": response.headers["last-modified"]})
+        assert response.status_code == 200
+
+    def test_different_query_gets_different_etag(self):
+        first = client.get("/api/v1/configs/test_panorama/addresses?page_size=1")
+        second = client.get("/api/v1/configs/test_panorama/addresses?page_size=2")
+        assert first.headers["etag"] != second.headers["etag"]
+
+        response = client.get("/api/v1/configs/test_panorama/addresses?page_size=2",
+                              headers={"If-None-Match": first.headers["etag"]})
+        assert response.status_code == 200
+
+    def test_errors_and_unknown_configs_have_no_etag(self):
+        response = client.get("/api/v1/configs/nonexistent/addresses")
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+        response = client.get("/api/v1/configs/test_panorama/addresses/no-such-address")
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+
+class TestResponseCache:
+    """Test the serialized response body cache"""
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.set("a", b"12345", "application/json")
+        cache.set("b", b"12345", "application/json")
+        assert cache.get("a") is not None
+        cache.set("c", b"12345", "application/json")
+        assert cache.get("b") is None
+        assert cache.get("a").body == b"12345"
+        assert cache.get_stats()["size_bytes"] == 10
+
+    def test_oversized_bodies_are_not_stored(self):
+        cache = ResponseCache(max_bytes=4)
+        cache.set("a", b"12345", "application/json")
+        assert cache.get("a") is None
+
+    def test_repeated_request_served_from_cache(self):
+        response_cache.clear()
+        url = "/api/v1/configs/test_panorama/addresses?page_size=2&page=1"
+        first = client.get(url)
+        hits = response_cache.hits
+        # Parameter order does not matter for the cache key
+        second = client.get("/api/v1/configs/test_panorama/addresses?page=1&page_size=2")
+        assert response_cache.hits == hits + 1
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["content-type"] == first.headers["content-type"]
+        assert "etag" in second.headers
+
+    def test_repeated_parameters_keep_their_order_in_the_key(self):
+        response_cache.clear()
+        base = "/api/v1/configs/test_panorama/addresses?page_size=1"
+        first = client.get(base + "&page=1&page=2")
+        second = client.get(base + "&page=2&page=1")
+        assert first.json()["page"] == 2
+        assert second.json()["page"] == 1
+        assert response_cache.get_stats()["entries"] == 2
+
+    def test_error_responses_are_not_cached(self):
+        response_cache.clear()
+        client.get("/api/v1/configs/test_panorama/addresses/no-such-address")
+        assert response_cache.get_stats()["entries"] == 0
+
+
+class TestDiskResponseCache:
+    """Test the on-disk second cache tier"""
+
+    def test_round_trip(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path / "responses"))
+        key = ("pan", "/api/v1/configs/pan/addresses", (), 1, 2)
+        assert cache.get(key) is None
+        cache.set(key, b'{"items":[]}', "application/json")
+        cached = cache.get(key)
+        assert cached.body == b'{"items":[]}'
+        assert cached.media_type == "application/json"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_entries_survive_a_new_instance_and_clear(self, tmp_path):
+        key = ("pan", "/path", (("page", "1"),), 1, 2)
+        DiskResponseCache(str(tmp_path)).set(key, b"body\nwith newline", None)
+        cache = DiskResponseCache(str(tmp_path))
+        assert cache.get(key) == (b"body\nwith newline", None)
+        cache.clear()
+        assert cache.get(key) is None
+
+    def test_entries_are_scoped_to_the_version(self, tmp_path):
+        key = ("pan", "/path", (), 1, 2)
+        DiskResponseCache(str(tmp_path), version="1.0.0").set(key, b"old", None)
+        assert DiskResponseCache(str(tmp_path), version="1.1.0").get(key) is None
+        assert DiskResponseCache(str(tmp_path), version="1.0.0").get(key) == (b"old", None)
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path), max_bytes=30)
+        cache.set("a", b"x" * 9, None)
+        cache.set("b", b"x" * 9, None)
+        cache.set("c", b"x" * 9, None)
+        assert cache.get("a") is not None
+        cache.set("d", b"x" * 9, None)
+        assert cache.get("b") is None
+        assert cache.get_stats()["entries"] == 3
+        assert cache.get_stats()["size_bytes"] <= 30
+        assert len(list(tmp_path.glob("*.resp"))) == 3
+
+        # A smaller bound trims the existing files when the directory is reopened
+        reopened = DiskResponseCache(str(tmp_path), max_bytes=20)
+        assert reopened.get_stats()["entries"] == 2
+        assert len(list(tmp_path.glob("*.resp"))) == 2
+
+    def test_middleware_falls_back_to_disk(self, tmp_path):
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse
+        from starlette.routing import Route
+
+        config = tmp_path / "pan.xml"
+        config.write_text("<config/>")
+        calls = []
+
+        async def endpoint(request):
+            calls.append(request.url.path)
+            return JSONResponse({"items": [1, 2, 3]})
+
+        def build_client(disk_cache):
+            inner = Starlette(routes=[Route("/api/v1/configs/pan/addresses", endpoint)])
+            wrapped = HTTPCacheMiddleware(inner, lambda name: str(config),
+                                          ResponseCache(max_bytes=1024), FileStatCache(), disk_cache)
+            return TestClient(wrapped)
+
+        first = build_client(DiskResponseCache(str(tmp_path / "responses")))
+        assert first.get("/api/v1/configs/pan/addresses").json() == {"items": [1, 2, 3]}
+
+        # A fresh worker with an empty memory tier is served from disk
+        second = build_client(DiskResponseCache(str(tmp_path / "responses")))
+        response = second.get("/api/v1/configs/pan/addresses")
+        assert response.json() == {"items": [1, 2, 3]}
+        assert response.headers["content-type"] == "application/json"
+        assert "etag" in response.headers
+        assert len(calls) == 1
+
+
+class TestFileStatCache:
+    """Test the short-lived stat cache"""
+
+    def test_stat_is_reused_within_ttl(self, tmp_path):
+        path = tmp_path / "config.xml"
+        path.write_text("<config/>")
+        stat_cache = FileStatCache(ttl=60)
+        first = stat_cache.stat(str(path))
+        path.write_text("<config><shared/></config>")
+        assert stat_cache.stat(str(path)) is first
+        stat_cache.invalidate(str(path))
+        assert stat_cache.stat(str(path)).st_size != first.st_size
+
+    def test_primed_stat_is_served(self, tmp_path):
+        path = tmp_path / "config.xml"
+        path.write_text("<config/>")
+        stat_cache = FileStatCache(ttl=60)
+        primed = os.stat(path)
+        stat_cache.prime(str(path), primed)
+        assert stat_cache.stat(str(path)) is primed
+
+    def test_missing_file(self, tmp_path):
+        assert FileStatCache().stat(str(tmp_path / "missing.xml")) is None
+
+
+class TestIndexHtml:
+    """Test the in-memory copy of the React entry page"""
+
+    def test_index_is_read_once_and_refreshed_on_change(self, tmp_path, monkeypatch):
+        import main
+
+        index = tmp_path / "index.html"
+        index.write_text("<html>v1</html>")
+        monkeypatch.setattr(main, "INDEX_HTML_PATH", str(index))
+        monkeypatch.setattr(main, "_index_html", None)
+        main.static_stat_cache.invalidate()
+
+        first = main.get_index_html()
+        assert first == b"<html>v1</html>"
+        assert main.get_index_html() is first
+
+        index.write_text("<html>v2</html>")
+        os.utime(index, ns=(0, index.stat().st_mtime_ns + 1_000_000_000))
+        main.static_stat_cache.invalidate()
+        assert main.get_index_html() == b"<html>v2</html>"
+
+        # Use the app from the current module, in case another test reloaded it
+        response = TestClient(main.app).get("/")
+        assert response.status_code == 200
+        assert response.text == "<html>v2</html>"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["cache-control"] == "no-cache"
+        revalidated = TestClient(main.app).get("/", headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+
+    def test_missing_frontend_redirects_to_docs(self, tmp_path, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main, "INDEX_HTML_PATH", str(tmp_path / "missing.html"))
+        main.static_stat_cache.invalidate()
+        assert main.get_index_html() is None
+        response = TestClient(main.app).get("/", follow_redirects=False)
+        assert response.status_code in (302, 307)
+        assert response.headers["location"] == "/docs"
+
+
+class TestModelJSONResponse:
+    """Test the orjson response used for payloads containing models"""
+
+    def test_matches_jsonable_encoder(self):
+        import orjson
+        from fastapi.encoders import jsonable_encoder
+        from main import ModelJSONResponse
+        from models import AddressObject
+
+        payload = {"items": [AddressObject(name="a", ip_netmask="10.0.0.1/32", tag=["t"])], "page": 1}
+        assert ModelJSONResponse(payload).body == orjson.dumps(jsonable_encoder(payload))
@@ -162,5 +162,33 @@ class TestAddressObject:
         assert address.fqdn is None
 
 
+class TestNameLower:
+    """Test the precomputed lower-cased name on config objects"""
+    
+    def test_name_lower_is_precomputed(self):
+        """Test that name_lower is available without extra work per access"""
+        address = AddressObject(name="Web-Server-01", fqdn="web.example.com")
+        assert address.name_lower == "web-server-01"
+    
+    def test_name_lower_not_serialized(self):
+        """Test that name_lower does not leak into API output"""
+        address = AddressObject(name="Web-Server-01", fqdn="web.example.com")
+        assert "name_lower" not in address.model_dump()
+        assert "_name_lower" not in address.model_dump(by_alias=True)
+    
+    def test_equality_unaffected(self):
+        """Test that equal objects stay equal"""
+        first = AddressObject(name="Host", fqdn="host.example.com")
+        second = AddressObject(name="Host", fqdn="host.example.com")
+        assert first == second
+    
+    def test_tag_set(self):
+        """Test that tags are also available as a set"""
+        address = AddressObject(name="Host", fqdn="host.example.com", tag=["web", "prod", "web"])
+        assert address.tag_set == frozenset({"web", "prod"})
+        assert AddressObject(name="Host", fqdn="host.example.com").tag_set == frozenset()
+        assert "tag_set" not in address.model_dump()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
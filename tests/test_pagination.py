@@ -2,13 +2,23 @@ import pytest
 import os
 import sys
 import math
+import asyncio
+import threading
 from typing import Dict, Any, List
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi.testclient import TestClient
-from main import app
+from main import (
+    app, paginate_results, paginate_filtered_results, cached_page_response, iter_security_policies,
+    ModelJSONResponse, STREAMING_MIN_ITEMS
+)
+from parser import PanoramaXMLParser
+from filtering import build_page_info
+from fastapi.responses import StreamingResponse
+from models import AddressObject, PaginatedResponse
+import orjson
 
 client = TestClient(app)
 
@@ -467,5 +477,132 @@ class TestPaginationSpecialCases:
             assert len(data["items"]) <= 20
 
 
+def read_body(response):
+    """Read the body of a buffered or streaming response"""
+    if not isinstance(response, StreamingResponse):
+        return response.body
+    
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return asyncio.run(collect())
+
+
+class TestLazyPagination:
+    """Test paginating lazily filtered iterables"""
+    
+    def test_generator_matches_list(self):
+        """Test that a generator paginates exactly like the equivalent list"""
+        items = [{"name": f"obj-{i}"} for i in range(25)]
+        for page in (1, 2, 3, 4):
+            from_list = orjson.loads(read_body(paginate_results(items, page, 10)))
+            from_generator = orjson.loads(read_body(paginate_results((i for i in items), page, 10)))
+            assert from_generator == from_list
+    
+    def test_page_info(self):
+        """Test the shared pagination metadata at the edges"""
+        assert build_page_info(0, 1, 10) == {"total_items": 0, "page": 1, "page_size": 10, "total_pages": 0,
+                                             "has_next": False, "has_previous": False}
+        assert build_page_info(25, 2, 10)["total_pages"] == 3
+        assert build_page_info(25, 2, 10)["has_next"] and build_page_info(25, 2, 10)["has_previous"]
+        assert not build_page_info(30, 3, 10)["has_next"]
+    
+    def test_generator_with_disable_paging(self):
+        """Test that disable_paging consumes the whole generator"""
+        data = orjson.loads(read_body(paginate_results((i for i in range(7)), disable_paging=True)))
+        assert data["items"] == list(range(7))
+        assert data["total_items"] == 7
+
+
+class TestStreamingPagination:
+    """Test that large pages are streamed with an identical body"""
+    
+    @pytest.mark.parametrize("count", [0, 1, 2, 255, 256, 257, 1000, 1300])
+    def test_streamed_body_matches_buffered(self, count):
+        """Test that streamed pages decode to the same payload as buffered ones"""
+        items = [{"name": f"obj-{i}", "tag": ["a"]} for i in range(count)]
+        for pagination in ({"disable_paging": True},
+                           {"page": 1, "page_size": 10000},
+                           {"page": 2, "page_size": 1000}):
+            response = paginate_results((i for i in items), **pagination)
+            expected = paginate_results(items, **pagination)
+            assert orjson.loads(read_body(response)) == orjson.loads(read_body(expected))
+    
+    def test_large_pages_are_streamed(self):
+        """Test that only large pages use a streaming response"""
+        items = list(range(STREAMING_MIN_ITEMS))
+        assert isinstance(paginate_results(items, disable_paging=True), StreamingResponse)
+        assert not isinstance(paginate_results(items, page_size=10), StreamingResponse)
+    
+    def test_lazy_pages_are_collected_off_the_event_loop(self):
+        """Test that a pending filter chain runs in a worker thread while lists are sliced inline"""
+        threads = set()
+        def items():
+            for i in range(25):
+                threads.add(threading.get_ident())
+                yield {"name": f"obj-{i}"}
+        
+        response = asyncio.run(paginate_filtered_results(items(), 2, 10))
+        assert orjson.loads(read_body(response))["items"] == [{"name": f"obj-{i}"} for i in range(10, 20)]
+        assert threads and threading.get_ident() not in threads
+        
+        listed = asyncio.run(paginate_filtered_results([{"name": "a"}], 1, 10))
+        assert orjson.loads(read_body(listed))["total_items"] == 1
+    
+    def test_large_cached_pages_are_streamed(self):
+        """Test that large pages of cached models stream the same by-alias payload"""
+        items = [AddressObject(name=f"a{i}", ip_netmask="10.0.0.1/32") for i in range(STREAMING_MIN_ITEMS)]
+        page_data = {"items": items, "total_items": STREAMING_MIN_ITEMS + 1, "page": 1,
+                     "page_size": STREAMING_MIN_ITEMS, "total_pages": 2, "has_next": True, "has_previous": False}
+        response = cached_page_response(page_data)
+        assert isinstance(response, StreamingResponse)
+        assert orjson.loads(read_body(response)) == orjson.loads(ModelJSONResponse(page_data).body)
+        small_page = dict(page_data, items=items[:10])
+        assert not isinstance(cached_page_response(small_page), StreamingResponse)
+
+
+
+class TestSecurityPolicyFilters:
+    """Test the fused legacy filters over the aggregated security rules"""
+    
+    def test_combined_filters_match_rule_attributes(self):
+        """Test that every filter combination selects the same rules as a direct check"""
+        config_path = os.path.join(os.path.dirname(__file__), "test_configs", f"{TEST_CONFIG}.xml")
+        parser = PanoramaXMLParser(config_path)
+        positioned = parser.get_aggregated_security_rules()
+        location, _, rule = positioned[-1]
+        for name, device_group, action in [(rule.name[:3].upper(), None, None),
+                                           (None, location, rule.action.value),
+                                           (rule.name, location.upper(), rule.action.value),
+                                           ("no-such-rule", None, None)]:
+            expected = [
+                entry for entry in positioned
+                if (name is None or name.lower() in entry[2].name.lower())
+                and (device_group is None or device_group.lower() in entry[0].lower())
+                and (action is None or entry[2].action.value == action)
+            ]
+            assert list(iter_security_policies(parser, None, name, device_group, action)) == expected
+        
+        # Starting from a cursor position skips the earlier rules with the action
+        first_location = positioned[0][0]
+        for index in range(len(positioned)):
+            expected = [entry for entry in positioned[index:] if entry[2].action == rule.action]
+            assert list(iter_security_policies(parser, (first_location, index), None, None,
+                                               rule.action.value.upper())) == expected
+
+
+class TestPaginatedResponseSchema:
+    """Test that list endpoints document PaginatedResponse without re-validating it"""
+    
+    def test_list_endpoints_skip_response_model(self):
+        """Test that the schema is documented while no response_model is applied"""
+        schema = app.openapi()
+        for route in app.routes:
+            responses = getattr(route, "responses", None) or {}
+            if responses.get(200, {}).get("model") is not PaginatedResponse:
+                continue
+            assert route.response_model is None
+            documented = schema["paths"][route.path]["get"]["responses"]["200"]
+            assert documented["content"]["application/json"]["schema"]["$ref"].endswith("/PaginatedResponse")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
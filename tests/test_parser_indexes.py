@@ -0,0 +1,199 @@
+"""
+Tests for the lookup indexes memoized by PanoramaXMLParser.
+
+The parser builds these indexes once from the parsed object lists so that
+endpoints can answer common queries with a dict lookup instead of scanning
+every object on each request.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parser import PanoramaXMLParser
+from models import ProtocolType
+
+
+TEST_CONFIG = os.path.join(os.path.dirname(__file__), "test_configs", "test_panorama.xml")
+
+
+@pytest.fixture
+def parser():
+    return PanoramaXMLParser(TEST_CONFIG)
+
+
+class TestServiceProtocolIndex:
+    """Test the shared services protocol index"""
+
+    def test_services_grouped_by_protocol(self, parser):
+        by_protocol = parser.get_shared_services_by_protocol()
+        assert [s.name for s in by_protocol["tcp"]] == ["tcp-8080"]
+        assert [s.name for s in by_protocol["udp"]] == ["udp-5000"]
+        assert all(s.type == ProtocolType.TCP for s in by_protocol["tcp"])
+
+    def test_index_is_memoized(self, parser):
+        assert parser.get_shared_services_by_protocol() is parser.get_shared_services_by_protocol()
+
+    def test_index_reuses_service_objects(self, parser):
+        services = parser.get_shared_services()
+        by_protocol = parser.get_shared_services_by_protocol()
+        assert by_protocol["tcp"][0] is services[0]
+
+
+class TestPrecompiledXPaths:
+    """Test lookups that go through precompiled XPaths and the device group index"""
+
+    def test_device_group_lookup_by_name(self, parser):
+        assert [a.name for a in parser.get_device_group_addresses("test-dg")] == ["dg-server"]
+
+    def test_names_with_quotes_are_passed_as_variables(self, parser):
+        assert parser.get_device_group_addresses("it's-missing") == []
+        assert parser.get_device_group_security_rules('say "hi"') == []
+
+
+class TestNameAndTagIndexes:
+    """Test the name and tag lookup indexes"""
+
+    def test_addresses_by_name(self, parser):
+        by_name = parser.get_addresses_by_name()
+        assert set(by_name) == {a.name for a in parser.get_all_addresses()}
+        assert by_name["dg-server"].parent_device_group == "test-dg"
+
+    def test_addresses_by_name_keeps_first_match(self, parser):
+        addresses = parser.get_all_addresses()
+        by_name = parser.get_addresses_by_name()
+        for address in addresses:
+            assert by_name[address.name] is next(a for a in addresses if a.name == address.name)
+
+    def test_addresses_by_tag(self, parser):
+        by_tag = parser.get_addresses_by_tag()
+        for tag, tagged in by_tag.items():
+            expected = [a for a in parser.get_all_addresses() if a.tag and tag in a.tag]
+            assert tagged == expected
+
+    def test_shared_services_by_name(self, parser):
+        assert parser.get_shared_services_by_name()["udp-5000"].type == ProtocolType.UDP
+        assert "tcp-9090" not in parser.get_shared_services_by_name()
+
+    @pytest.mark.parametrize("index, getter", [
+        ("get_device_groups_by_name", "get_device_groups"),
+        ("get_templates_by_name", "get_templates"),
+        ("get_template_stacks_by_name", "get_template_stacks"),
+    ])
+    def test_device_objects_by_name(self, parser, index, getter):
+        by_name = getattr(parser, index)()
+        assert list(by_name.values()) == getattr(parser, getter)()
+        assert getattr(parser, index)() is by_name
+
+    def test_shared_address_groups_by_name(self, parser):
+        groups = parser.get_shared_address_groups_by_name()
+        assert set(groups) == {g.name for g in parser.get_shared_address_groups()}
+        assert parser.get_shared_address_groups_by_name() is groups
+
+
+class TestSharedObjects:
+    """Test the memoized shared-location object lists"""
+
+    @pytest.mark.parametrize("getter", [
+        "get_shared_addresses", "get_shared_address_groups",
+        "get_shared_services", "get_shared_service_groups",
+    ])
+    def test_shared_objects_are_memoized_without_parent_context(self, parser, getter):
+        objects = getattr(parser, getter)()
+        assert getattr(parser, getter)() is objects
+        for obj in objects:
+            assert obj.parent_device_group is None
+            assert obj.parent_template is None
+            assert obj.parent_vsys is None
+
+
+class TestXPathIndex:
+    """Test the xpath -> object index used by the search endpoint"""
+
+    def test_index_covers_searchable_objects(self, parser):
+        index = parser.get_xpath_index()
+        for address in parser.get_all_addresses():
+            assert ("address", address) in index[address.xpath]
+        for dg in parser.get_device_groups():
+            assert index[dg.xpath][0][0] == "device-group"
+
+    def test_index_is_memoized(self, parser):
+        assert parser.get_xpath_index() is parser.get_xpath_index()
+
+
+class TestMemoizedLists:
+    """Test the device group, template, profile and schedule lists memoized per parser"""
+
+    @pytest.mark.parametrize("getter", [
+        "get_device_group_summaries", "get_device_groups",
+        "get_templates", "get_template_stacks",
+        "get_vulnerability_profiles", "get_url_filtering_profiles",
+        "get_log_profiles", "get_schedules", "get_vsys_list",
+    ])
+    def test_lists_are_memoized(self, parser, getter):
+        assert getattr(parser, getter)() is getattr(parser, getter)()
+
+    def test_device_group_names(self, parser):
+        names = parser.get_device_group_names()
+        assert names == {s.name for s in parser.get_device_group_summaries()}
+        assert "test-dg" in names
+
+    def test_vsys_names(self, tmp_path):
+        config = tmp_path / "firewall.xml"
+        config.write_text(
+            '<config><devices><entry name="localhost.localdomain"><vsys>'
+            '<entry name="vsys1"/><entry name="vsys2"/>'
+            '</vsys></entry></devices></config>'
+        )
+        firewall = PanoramaXMLParser(str(config))
+        assert firewall.get_vsys_names() == {"vsys1", "vsys2"}
+        assert firewall.get_vsys_names() is firewall.get_vsys_names()
+
+    def test_device_group_elements_are_indexed_once(self, parser):
+        elements = parser._get_device_group_elements()
+        assert set(elements) == parser.get_device_group_names()
+        assert parser._get_device_group_elements() is elements
+
+    @pytest.mark.parametrize("getter", [
+        "get_device_group_addresses", "get_device_group_address_groups",
+        "get_device_group_services", "get_device_group_service_groups",
+    ])
+    def test_device_group_objects_are_memoized(self, parser, getter):
+        assert getattr(parser, getter)("test-dg") is getattr(parser, getter)("test-dg")
+
+
+class TestAggregatedSecurityRules:
+    """Test the memoized cross-device-group rule list"""
+
+    def test_rules_carry_position_metadata(self, parser):
+        positioned = parser.get_aggregated_security_rules()
+        assert positioned
+        for location, index, rule in positioned:
+            assert rule.device_group == location
+            assert rule.order == index + 1
+            assert rule.rulebase_location == f"{location} #{index + 1}"
+        assert parser.get_aggregated_security_rules() is positioned
+
+    def test_offsets_point_at_first_rule_of_each_location(self, parser):
+        positioned = parser.get_aggregated_security_rules()
+        for location, offset in parser.get_aggregated_rule_offsets().items():
+            assert positioned[offset][:2] == (location, 0)
+
+    def test_columns_are_parallel_to_rules(self, parser):
+        positioned = parser.get_aggregated_security_rules()
+        columns = parser.get_aggregated_rule_columns()
+        assert columns['name'] == tuple(rule.name.lower() for _, _, rule in positioned)
+        assert columns['action'] == tuple(rule.action.value for _, _, rule in positioned)
+        assert columns['device_group'] == tuple(location.lower() for location, _, _ in positioned)
+
+    def test_positions_by_action(self, parser):
+        positioned = parser.get_aggregated_security_rules()
+        by_action = parser.get_aggregated_rule_positions_by_action()
+        assert sorted(p for positions in by_action.values() for p in positions) == list(range(len(positioned)))
+        for action, positions in by_action.items():
+            assert all(positioned[p][2].action.value == action for p in positions)
+        assert parser.get_aggregated_rule_positions_by_action() is by_action
@@ -14,7 +14,9 @@ import pytest
 import asyncio
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from unittest.mock import Mock, patch
 
@@ -210,6 +212,128 @@ class TestServiceCacheFiltering:
             for service in filtered_services:
                 assert service.type == ProtocolType.UDP
 
+    def test_background_cache_protocol_partition(self):
+        """Test the memoized protocol partition of cached services"""
+        services = self.create_test_services()
+        
+        self.bg_cache.cache["test-config:services"] = {'data': list(services)}
+        by_protocol = self.bg_cache.get_cached_services_by_protocol("test-config")
+        assert [s for s in services if s.type == "tcp"] == by_protocol["tcp"]
+        assert len(by_protocol["udp"]) == 4
+        assert self.bg_cache.get_cached_services_by_protocol("test-config") is by_protocol
+        
+        # Growing the cached list rebuilds the partition
+        self.bg_cache.cache["test-config:services"]['data'].append(services[0])
+        assert len(self.bg_cache.get_cached_services_by_protocol("test-config")["tcp"]) == 5
+        assert self.bg_cache.get_cached_services_by_protocol("missing-config") is None
+
+    def test_filtered_cached_data_is_paginated_lazily(self):
+        """Test that chained cache filters count matches beyond the returned page"""
+        services = self.create_test_services()
+        self.bg_cache.cache["test-config:services"] = {'data': services}
+        
+        result = self.bg_cache.get_filtered_cached_data(
+            "test-config", "services", {'name': 'TCP', 'advanced': {'type': 'tcp'}}, page=2, page_size=3
+        )
+        tcp = [s for s in services if s.type == "tcp"]
+        assert result['items'] == tcp[3:6]
+        assert result['total_items'] == len(tcp)
+        assert result['has_next'] == (len(tcp) > 6)
+        
+        udp = self.bg_cache.get_filtered_cached_data("test-config", "services", {'protocol': 'UDP'})
+        assert udp['items'] == [s for s in services if s.type == "udp"]
+
+    def test_filtered_scan_does_not_hold_cache_lock(self):
+        """Test that an unfiltered request completes while a filtered scan is still running"""
+        scanning = threading.Event()
+        release = threading.Event()
+        
+        class SlowService:
+            name = "slow"
+            
+            @property
+            def name_lower(self):
+                scanning.set()
+                release.wait(5)
+                return "slow"
+        
+        services = self.create_test_services()
+        self.bg_cache.cache["test-config:services"] = {'data': services + [SlowService()]}
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            filtered = pool.submit(
+                self.bg_cache.get_filtered_cached_data, "test-config", "services", {'name': 'sl'}
+            )
+            assert scanning.wait(5)
+            unfiltered = pool.submit(self.bg_cache.get_filtered_cached_data, "test-config", "services", {})
+            try:
+                page = unfiltered.result(timeout=2)
+                assert self.bg_cache.is_cached("test-config", "services")
+            finally:
+                release.set()
+            assert page['total_items'] == len(services) + 1
+            assert [item.name for item in filtered.result(timeout=5)['items']] == ["slow"]
+
+    def test_background_cache_tag_index(self):
+        """Test the memoized tag index of cached objects"""
+        tagged = ServiceObject(name="web", protocol=Protocol(tcp={"port": "80"}), tag=["web", "prod"])
+        services = self.create_test_services() + [tagged]
+        
+        self.bg_cache.cache["test-config:services"] = {'data': services}
+        by_tag = self.bg_cache.get_cached_by_tag("test-config", "services")
+        assert by_tag == {"web": [tagged], "prod": [tagged]}
+        assert self.bg_cache.get_cached_by_tag("test-config", "services") is by_tag
+        assert self.bg_cache.get_cached_by_tag("missing-config", "services") is None
+
+    def test_name_filter_uses_trigram_index(self):
+        """Test that partial-name lookups through the trigram index match a full scan"""
+        services = self.create_test_services()
+        self.bg_cache.cache["test-config:services"] = {'data': services}
+        
+        by_trigram = self.bg_cache.get_cached_by_name_trigram("test-config", "services")
+        assert by_trigram["tcp"] == [s for s in services if "tcp" in s.name]
+        assert self.bg_cache.get_cached_by_name_trigram("test-config", "services") is by_trigram
+        
+        for name in ("TCP-4", "udp", "cp-", "p-", "nomatch"):
+            result = self.bg_cache.get_filtered_cached_data("test-config", "services", {'name': name}, page_size=50)
+            assert result['items'] == [s for s in services if name.lower() in s.name.lower()]
+
+    def test_name_prefix_filter_uses_sorted_names(self):
+        """Test that name prefix lookups return the same objects as a scan, in cached order"""
+        services = self.create_test_services()
+        self.bg_cache.cache["test-config:services"] = {'data': services}
+        
+        assert self.bg_cache.get_cached_by_name_prefix("test-config", "services", "TCP-") == \
+            [s for s in services if s.name.startswith("tcp-")]
+        assert self.bg_cache.get_cached_by_name_prefix("missing-config", "services", "tcp") == []
+        
+        for prefix in ("tcp-4", "UDP", "t", "zzz"):
+            result = self.bg_cache.get_filtered_cached_data(
+                "test-config", "services", {'advanced': {'name_starts_with': prefix}}, page_size=50
+            )
+            assert result['items'] == [s for s in services if s.name.lower().startswith(prefix.lower())]
+
+    def test_cleared_cache_drops_stale_generation(self):
+        """Test that objects from a load started before clear_cache are not published"""
+        services = self.create_test_services()
+        generation = self.bg_cache.get_generation("test-config")
+        assert self.bg_cache.publish("test-config", "services", services, generation)
+        assert self.bg_cache.mark_config_ready("test-config", generation)
+        
+        # A reload clears the config while the old load is still running
+        self.bg_cache.progress["services"].cached_items = 7
+        self.bg_cache.clear_cache("test-config")
+        # Progress is shared by every config, so clearing one leaves it alone
+        assert self.bg_cache.progress["services"].cached_items == 7
+        assert not self.bg_cache.publish("test-config", "services", services[:1], generation)
+        assert not self.bg_cache.mark_config_ready("test-config", generation)
+        assert not self.bg_cache.is_cached("test-config", "services")
+        assert not self.bg_cache.is_config_ready("test-config")
+        
+        current = self.bg_cache.get_generation("test-config")
+        assert self.bg_cache.publish("test-config", "services", services[:1], current)
+        assert self.bg_cache.get_cached_data("test-config", "services")['items'] == services[:1]
+
     def test_async_cache_task_with_type_filtering(self):
         """Test async cache task handles type filtering correctly"""
         services = self.create_test_services()
@@ -0,0 +1,62 @@
+"""
+Tests for the precomputed serialized payloads behind the /shared/* endpoints.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set the test config path before importing the app
+os.environ["CONFIG_FILES_PATH"] = os.path.join(os.path.dirname(__file__), "test_configs")
+
+from fastapi.testclient import TestClient
+
+from main import app, response_cache
+
+client = TestClient(app)
+# Trigger the startup event by making an initial request
+with client:
+    _ = client.get("/api/v1/configs")
+
+BASE_URL = "/api/v1/configs/test_panorama/shared"
+SHARED_TYPES = ["addresses", "address-groups", "services", "service-groups"]
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache():
+    # Make sure every request reaches the endpoint
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+class TestSharedPayloads:
+    """Test that the precomputed fast path matches the filtering path"""
+
+    @pytest.mark.parametrize("object_type", SHARED_TYPES)
+    def test_unfiltered_matches_filtered_path(self, object_type):
+        fast = client.get(f"{BASE_URL}/{object_type}").json()
+        # An always-true advanced filter forces the per-object path
+        slow = client.get(f"{BASE_URL}/{object_type}?filter.name.not_equals=__none__").json()
+        assert fast == slow
+        assert all(item["parent_device_group"] is None for item in fast["items"])
+
+    @pytest.mark.parametrize("object_type", SHARED_TYPES)
+    def test_disable_paging_payload_is_reused(self, object_type):
+        first = client.get(f"{BASE_URL}/{object_type}?disable_paging=true")
+        response_cache.clear()
+        second = client.get(f"{BASE_URL}/{object_type}?disable_paging=true")
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "application/json"
+        assert first.content == second.content
+        assert first.json()["total_items"] == len(first.json()["items"])
+
+    def test_paged_requests_slice_precomputed_objects(self):
+        full = client.get(f"{BASE_URL}/addresses?disable_paging=true").json()
+        page = client.get(f"{BASE_URL}/addresses?page=1&page_size=1").json()
+        assert page["items"] == full["items"][:1]
+        assert page["total_items"] == full["total_items"]
@@ -0,0 +1,34 @@
+"""
+Tests for the ZODB cache file hashing.
+"""
+
+import hashlib
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zodb_cache import ZODBCache
+
+
+class TestFileHash:
+    """The config file is hashed once per (mtime, size)"""
+
+    def test_hash_is_reused_until_file_changes(self, tmp_path, monkeypatch):
+        config = tmp_path / "config.xml"
+        config.write_bytes(b"<config/>")
+        cache = ZODBCache(str(tmp_path / "cache"))
+
+        expected = hashlib.md5(b"<config/>").hexdigest()
+        assert cache._get_file_hash(str(config)) == expected
+
+        opened = []
+        real_open = open
+        monkeypatch.setattr("builtins.open", lambda *a, **kw: opened.append(a[0]) or real_open(*a, **kw))
+        assert cache._get_file_hash(str(config)) == expected
+        assert opened == []
+
+        config.write_bytes(b"<config><devices/></config>")
+        assert cache._get_file_hash(str(config)) == hashlib.md5(b"<config><devices/></config>").hexdigest()
+        assert opened == [str(config)]
@@ -23,12 +23,17 @@ from models import AddressObject, AddressGroup, ServiceObject, ServiceGroup, Sec
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the shape of the cached objects changes, so caches written
+# by older code are rebuilt instead of loaded
+CACHE_FORMAT_VERSION = 2
+
 class CachedConfig(Persistent):
     """Persistent container for cached configuration data"""
     
     def __init__(self, config_name: str, md5_hash: str):
         self.config_name = config_name
         self.md5_hash = md5_hash
+        self.format_version = CACHE_FORMAT_VERSION
         self.parse_timestamp = time.time()
         self.data = PersistentMapping()
         
@@ -78,15 +83,29 @@ class ZODBCache:
             self.cache_enabled = False
         self.connections = {}
         self.databases = {}
+        # File path -> ((mtime_ns, size), md5 hex digest)
+        self.file_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
         
     def _get_file_hash(self, file_path: str) -> str:
-        """Calculate MD5 hash of a file"""
+        """Calculate MD5 hash of a file
+        
+        The hash is remembered per (mtime, size), so checking and then saving
+        the cache for the same file reads it only once.
+        """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        known = self.file_hashes.get(file_path)
+        if known is not None and known[0] == signature:
+            return known[1]
+        
         md5_hash = hashlib.md5()
         with open(file_path, 'rb') as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b''):
+            # Read in large chunks to handle large files with few syscalls
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
                 md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        digest = md5_hash.hexdigest()
+        self.file_hashes[file_path] = (signature, digest)
+        return digest
     
     def _get_cache_path(self, config_name: str) -> Path:
         """Get the cache file path for a configuration"""
@@ -152,6 +171,10 @@ class ZODBCache:
                 return False
             
             cached_config = root['config']
+            if getattr(cached_config, 'format_version', 1) != CACHE_FORMAT_VERSION:
+                logger.info(f"Cache invalidated for {config_name}: format version changed")
+                return False
+            
             if cached_config.md5_hash != current_hash:
                 logger.info(f"Cache invalidated for {config_name}: MD5 mismatch")
                 logger.info(f"  Cached MD5: {cached_config.md5_hash}")